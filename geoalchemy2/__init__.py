@@ -6,8 +6,6 @@ from geoalchemy2 import exc  # noqa
 from geoalchemy2 import functions  # noqa
 from geoalchemy2 import shape  # noqa
 from geoalchemy2 import types  # noqa
-from geoalchemy2.admin.dialects.geopackage import load_spatialite_gpkg  # noqa
-from geoalchemy2.admin.dialects.sqlite import load_spatialite  # noqa
 from geoalchemy2.admin.plugin import GeoEngine  # noqa
 from geoalchemy2.elements import CompositeElement  # noqa
 from geoalchemy2.elements import RasterElement  # noqa
@@ -48,5 +46,18 @@ __all__ = [
 ]
 
 
+def __getattr__(name):
+    # The SQLite and GeoPackage modules are only imported when their loaders are used
+    if name == "load_spatialite":
+        from geoalchemy2.admin.dialects.sqlite import load_spatialite
+
+        return load_spatialite
+    if name == "load_spatialite_gpkg":
+        from geoalchemy2.admin.dialects.geopackage import load_spatialite_gpkg
+
+        return load_spatialite_gpkg
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def __dir__():
     return __all__
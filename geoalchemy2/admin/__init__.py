@@ -2,6 +2,7 @@
 
 from sqlalchemy import Column
 from sqlalchemy import Index
+from sqlalchemy import MetaData
 from sqlalchemy import Table
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
@@ -10,23 +11,57 @@ from sqlalchemy.sql import func
 from geoalchemy2.admin import dialects
 from geoalchemy2.admin.dialects.common import _check_spatial_type
 from geoalchemy2.admin.dialects.common import _spatial_idx_name
+from geoalchemy2.admin.dialects.common import _spatial_index_kwargs
 from geoalchemy2.exc import ArgumentError
-from geoalchemy2.types import Geography
-from geoalchemy2.types import Geometry
 from geoalchemy2.types import Raster
 
 
 def select_dialect(dialect_name):
-    """Select the dialect from its name."""
-    known_dialects = {
-        "geopackage": dialects.geopackage,
-        "mysql": dialects.mysql,
-        "mariadb": dialects.mariadb,
-        "mssql": dialects.mssql,
-        "postgresql": dialects.postgresql,
-        "sqlite": dialects.sqlite,
-    }
-    return known_dialects.get(dialect_name, dialects.common)
+    """Select the dialect from its name.
+
+    The dialect module is imported on first use, which registers its compilation rules and its
+    reflected types.
+    """
+    if dialect_name in dialects.DIALECT_MODULES:
+        return getattr(dialects, dialect_name)
+    return dialects.common
+
+
+def build_deferred_spatial_indexes(
+    bind, metadata, concurrently=True, max_workers=None, maintenance_work_mem=None
+):
+    """Build the spatial indexes of the columns defined with ``spatial_index="deferred"``.
+
+    With PostgreSQL, these indexes are not created with the tables, so they do not slow down the
+    loading of the data. This function should be called once the data are loaded. The valid
+    indexes which already exist are skipped, so it can be called several times, and the invalid
+    ones left behind by a failed concurrent build are dropped and built again. The other dialects
+    create the deferred indexes with the tables, so there is nothing to do for them.
+
+    Args:
+        bind: The engine or connection used to build the indexes. When ``concurrently`` is
+            ``True``, a connection must use the ``AUTOCOMMIT`` isolation level.
+        metadata: The metadata containing the tables whose indexes are built.
+        concurrently: Use ``CREATE INDEX CONCURRENTLY`` so the tables are not locked against
+            writes during the build.
+        max_workers: The number of tables whose indexes are built in parallel. Each table uses its
+            own connection, so this is only possible when ``bind`` is an engine.
+        maintenance_work_mem: The ``maintenance_work_mem`` value used for the builds, e.g.
+            ``"1GB"``. Note that each parallel build can use this amount of memory.
+
+    Returns:
+        The names of the indexes built by this call.
+    """
+    dialect_module = select_dialect(bind.dialect.name)
+    if not hasattr(dialect_module, "build_deferred_spatial_indexes"):
+        return []
+    return dialect_module.build_deferred_spatial_indexes(
+        bind,
+        metadata,
+        concurrently=concurrently,
+        max_workers=max_workers,
+        maintenance_work_mem=maintenance_work_mem,
+    )
 
 
 def setup_ddl_event_listeners():
@@ -52,6 +87,20 @@ def setup_ddl_event_listeners():
         """Restore original column list including managed Geometry columns."""
         select_dialect(bind.dialect.name).after_drop(table, bind, **kw)
 
+    @event.listens_for(MetaData, "after_create")
+    def after_create_all(metadata, bind, **kw):
+        """Execute the spatial DDL collected during ``MetaData.create_all()``."""
+        dialect_module = select_dialect(bind.dialect.name)
+        if hasattr(dialect_module, "after_create_all"):
+            dialect_module.after_create_all(metadata, bind, **kw)
+
+    @event.listens_for(MetaData, "before_drop")
+    def before_drop_all(metadata, bind, **kw):
+        """Drop the managed Geometry columns of all the tables at once."""
+        dialect_module = select_dialect(bind.dialect.name)
+        if hasattr(dialect_module, "before_drop_all"):
+            dialect_module.before_drop_all(metadata, bind, **kw)
+
     @event.listens_for(Column, "after_parent_attach")
     def after_parent_attach(column, table):
         """Automatically add spatial indexes."""
@@ -81,14 +130,11 @@ def setup_ddl_event_listeners():
             pass
 
         kwargs = {
-            "postgresql_using": "gist",
+            **_spatial_index_kwargs(column.type, column.name),
             "_column_flag": True,
         }
         col = column
-        if _check_spatial_type(column.type, (Geometry, Geography)):
-            if column.type.use_N_D_index:
-                kwargs["postgresql_ops"] = {column.name: "gist_geometry_ops_nd"}
-        elif _check_spatial_type(column.type, Raster):
+        if _check_spatial_type(column.type, Raster):
             col = func.ST_ConvexHull(column)
 
         table.append_constraint(
@@ -105,21 +151,26 @@ def setup_ddl_event_listeners():
             inspector, table, column_info
         )
 
-    @event.listens_for(Engine, "before_execute", retval=True)
-    def before_execute(conn, clauseelement, multiparams, params, execution_options):
-        dialect_module = select_dialect(conn.dialect.name)
+    @event.listens_for(Engine, "engine_connect")
+    def engine_connect(conn, *args):
+        """Load the dialect module and attach its ``before_execute`` listener if it has one.
+
+        This is done once per engine, so the dialect module is loaded before anything is reflected
+        or executed. The listener is only attached for the dialects which define a
+        ``before_execute`` function, so the other engines do not pay any overhead per statement.
+        """
+        engine = getattr(conn.engine, "_proxied", conn.engine)
+        if getattr(engine, "_geoalchemy2_before_execute_setup", False):
+            return
+        engine._geoalchemy2_before_execute_setup = True
+
+        dialect_module = select_dialect(engine.dialect.name)
         if hasattr(dialect_module, "before_execute"):
-            return dialect_module.before_execute(
-                conn,
-                clauseelement,
-                multiparams,
-                params,
-                execution_options,
-            )
-        return clauseelement, multiparams, params
+            event.listen(engine, "before_execute", dialect_module.before_execute, retval=True)
 
 
 __all__ = [
+    "build_deferred_spatial_indexes",
     "dialects",
     "select_dialect",
     "setup_ddl_event_listeners",
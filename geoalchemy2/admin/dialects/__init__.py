@@ -1,9 +1,38 @@
-"""This module defines some dialect-specific functions used for administration tasks."""
+"""This module defines some dialect-specific functions used for administration tasks.
+
+The dialect modules are only imported when they are first used, see
+:func:`geoalchemy2.admin.select_dialect`. Importing a dialect module registers its compilation
+rules and the spatial types in the ``ischema_names`` of the SQLAlchemy dialect.
+"""
+
+import importlib
+
+from sqlalchemy import Index
+from sqlalchemy.dialects import registry
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import BinaryExpression
 
 from geoalchemy2.admin.dialects import common  # noqa
-from geoalchemy2.admin.dialects import geopackage  # noqa
-from geoalchemy2.admin.dialects import mariadb  # noqa
-from geoalchemy2.admin.dialects import mssql  # noqa
-from geoalchemy2.admin.dialects import mysql  # noqa
-from geoalchemy2.admin.dialects import postgresql  # noqa
-from geoalchemy2.admin.dialects import sqlite  # noqa
+
+DIALECT_MODULES = ("geopackage", "mariadb", "mssql", "mysql", "postgresql", "sqlite")
+"""The names of the dialects with a specific module."""
+
+registry.register("gpkg", "geoalchemy2.admin.dialects.geopackage", "GeoPackageDialect")
+
+# Register GeoAlchemy's spatial index kwargs so SQLAlchemy accepts them on Index(...), even before
+# the MSSQL module is loaded.
+for _dialect_kwarg in ("bounding_box", "cells_per_object", "grids", "using", "with"):
+    Index.argument_for("mssql", _dialect_kwarg, None)
+
+
+@compiles(BinaryExpression, "mssql")  # type: ignore
+def _MSSQL_binary_expression(binary, compiler, **kw):
+    # The MSSQL module replaces this rule when it is loaded
+    importlib.import_module(f"{__name__}.mssql")
+    return binary._compiler_dispatch(compiler, **kw)
+
+
+def __getattr__(name):
+    if name in DIALECT_MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
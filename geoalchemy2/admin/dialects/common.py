@@ -3,6 +3,7 @@
 import sqlalchemy
 from packaging import version
 from sqlalchemy import Column
+from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy.sql import expression
 from sqlalchemy.sql.elements import BindParameter
@@ -18,10 +19,67 @@ _COLUMN_COLLECTION_CLASS = getattr(
 )
 
 
+BATCH_SPATIAL_DDL = "geoalchemy2_batch_spatial_ddl"
+"""Execution option enabling the batched spatial DDL.
+
+When a connection with this option set to ``True`` is given to ``MetaData.create_all()`` or
+``MetaData.drop_all()``, the spatial DDL of all the tables is collected and executed together
+instead of table by table::
+
+    with engine.begin() as conn:
+        metadata.create_all(conn.execution_options(geoalchemy2_batch_spatial_ddl=True))
+"""
+
+
+def get_spatial_ddl_batch(bind, **kw):
+    """Get the list collecting the spatial DDL of the current ``create_all()`` or ``drop_all()``.
+
+    Returns:
+        ``None`` if the statements must be executed immediately, i.e. when the batched spatial DDL
+        is not enabled on the bind or when the event is not part of a ``create_all()`` or
+        ``drop_all()`` call.
+    """
+    ddl_runner = kw.get("_ddl_runner")
+    if (
+        ddl_runner is None
+        or not kw.get("_is_metadata_operation", True)
+        or not getattr(bind, "get_execution_options", dict)().get(BATCH_SPATIAL_DDL, False)
+    ):
+        return None
+    # The DDL runner is specific to each create_all() or drop_all() call
+    if not hasattr(ddl_runner, "_geoalchemy2_spatial_ddl"):
+        ddl_runner._geoalchemy2_spatial_ddl = []
+    return ddl_runner._geoalchemy2_spatial_ddl
+
+
 def _spatial_idx_name(table_name, column_name):
     return f"idx_{table_name}_{column_name}"
 
 
+_N_D_INDEX_OPCLASSES = {
+    "gist": "gist_geometry_ops_nd",
+    "spgist": "spgist_geometry_ops_nd",
+    "brin": "brin_geometry_inclusion_ops_4d",
+}
+"""The N-D operator classes of the PostgreSQL access methods used with ``use_N_D_index``."""
+
+
+def _spatial_index_kwargs(col_type, col_name):
+    """Get the PostgreSQL keyword arguments of the spatial index of a column from its type."""
+    method = getattr(col_type, "spatial_index_method", "gist")
+    opclass = getattr(col_type, "spatial_index_opclass", None)
+    if opclass is None and getattr(col_type, "use_N_D_index", False):
+        opclass = _N_D_INDEX_OPCLASSES[method]
+    kwargs = {
+        "postgresql_using": method,
+        "postgresql_ops": {col_name: opclass} if opclass is not None else {},
+    }
+    storage_parameters = getattr(col_type, "spatial_index_with", None)
+    if storage_parameters:
+        kwargs["postgresql_with"] = dict(storage_parameters)
+    return kwargs
+
+
 def _format_select_args(*args):
     if _SQLALCHEMY_VERSION_BEFORE_14:
         return [args]
@@ -115,11 +173,7 @@ def compile_bin_literal(wkb_clause):
 
     wkb_data = wkb_clause.value
     if isinstance(wkb_data, (bytes, bytearray, memoryview, WKBElement)):
-        if isinstance(wkb_data, bytearray):
-            wkb_data = bytes(wkb_data)
-        if isinstance(wkb_data, memoryview):
-            wkb_data = wkb_data.tobytes()
-        if isinstance(wkb_data, bytes):
+        if isinstance(wkb_data, (bytes, bytearray, memoryview)):
             wkb_data = WKBElement._wkb_to_hex(wkb_data)
         elif isinstance(wkb_data, WKBElement):
             wkb_data = wkb_data.desc
@@ -133,6 +187,60 @@ def compile_bin_literal(wkb_clause):
     return wkb_clause
 
 
+class _SRIDBindType(TypeDecorator):
+    """Bind the SRID argument of a WKB constructor, replacing unknown SRIDs by a given value."""
+
+    impl = Integer
+    cache_ok = True
+
+    def __init__(self, unknown_srid=None):
+        super().__init__()
+        self.unknown_srid = unknown_srid
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return self.unknown_srid
+        srid = int(value)
+        return srid if _wkb_wkt.is_known_srid(srid) else self.unknown_srid
+
+
+def compile_srid_arg(srid_clause, compiler, *, unknown_srid=None, **kw):
+    """Compile the SRID argument of a WKB constructor.
+
+    The value of a bound SRID is only read when the statement is executed, so the compiled
+    statement does not depend on it and can be reused from the compiled cache for any SRID.
+    """
+    if isinstance(srid_clause, BindParameter):
+        srid_clause = expression.type_coerce(srid_clause, _SRIDBindType(unknown_srid=unknown_srid))
+    return compiler.process(srid_clause, **kw)
+
+
+def get_wkb_constructor_srid(element, clauses, *, include_srid, literal_binds):
+    """Get the SRID of a WKB constructor and its SRID argument that must be compiled, if any.
+
+    With literal binds, the value of the SRID argument is inlined. Otherwise, the SRID argument of
+    ``ST_GeomFromWKB`` is bound, so the compiled statement does not depend on its value. The SRID
+    given to ``ST_GeomFromEWKB`` is stored in its return type when the function is built, so it
+    is applied by the bind processor of the EWKB value, and only the SRID arguments whose value is
+    not known before the execution are compiled.
+    """
+    srid = element.type.srid
+    if len(clauses) < 2:
+        return srid, None
+
+    srid_clause = clauses[1]
+    if literal_binds:
+        return getattr(srid_clause, "value", srid), None
+    if (
+        not include_srid
+        and isinstance(srid_clause, BindParameter)
+        and srid_clause.callable is None
+        and srid_clause.value is not None
+    ):
+        return srid, None
+    return srid, srid_clause
+
+
 def _is_auto_constructor_bindparam(clause, constructor_name):
     return (
         isinstance(clause, BindParameter)
@@ -6,7 +6,6 @@ See GeoPackage specifications here: http://www.geopackage.org/spec/
 import re
 
 from sqlalchemy import text
-from sqlalchemy.dialects import registry
 from sqlalchemy.dialects.sqlite.pysqlite import SQLiteDialect_pysqlite
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import func
@@ -19,6 +18,8 @@ from geoalchemy2.admin.dialects.common import _spatial_idx_name
 from geoalchemy2.admin.dialects.common import setup_create_drop
 from geoalchemy2.admin.dialects.sqlite import _SQLITE_FUNCTIONS
 from geoalchemy2.admin.dialects.sqlite import _compile_GeomFromWKB_SQLite
+from geoalchemy2.admin.dialects.sqlite import _find_spatial_column
+from geoalchemy2.admin.dialects.sqlite import _is_registered
 from geoalchemy2.admin.dialects.sqlite import get_col_dim
 from geoalchemy2.admin.dialects.sqlite import load_spatialite_driver
 from geoalchemy2.types import Geography
@@ -36,9 +37,6 @@ class GeoPackageDialect(SQLiteDialect_pysqlite):
     """Enable caching for GeoPackage dialect."""
 
 
-registry.register("gpkg", "geoalchemy2.admin.dialects.geopackage", "GeoPackageDialect")
-
-
 def load_geopackage_driver(dbapi_conn, *args):
     """Load SpatiaLite extension in GeoPackage connection and set VirtualGpkg and Amphibious modes.
 
@@ -85,42 +83,62 @@ def load_spatialite_gpkg(dbapi_conn, *args, **kwargs):
     init_geopackage(dbapi_conn, **kwargs)
 
 
-def _get_spatialite_attrs(bind, table_name, col_name):
-    attrs = bind.execute(
-        text(
+def get_spatial_columns(bind, info_cache=None):
+    """Get the attributes of all the spatial columns registered in the GeoPackage metadata.
+
+    The ``gpkg_geometry_columns`` table and the R-Tree status of the columns are read with one
+    query. When an ``info_cache`` is given, e.g. the one of an inspector, the result is stored in it
+    and reused by the reflection of all the columns and indexes.
+
+    Returns:
+        A dict mapping each lower-cased table name to a list of ``(column_name, attributes)``
+        tuples, where the attributes are the geometry type, the coordinate dimension, the SRID and
+        the spatial index status.
+    """
+    cache_key = "geoalchemy2_geopackage_columns"
+    if info_cache is not None and cache_key in info_cache:
+        return info_cache[cache_key]
+
+    spatial_columns = {}
+    if _is_registered(bind, "gpkg_geometry_columns"):
+        query = text(
             """SELECT
+                A.table_name,
+                A.column_name,
                 A.geometry_type_name,
                 A.srs_id,
                 A.z,
                 A.m,
-                IFNULL(B.has_index, 0) AS has_index
-            FROM gpkg_geometry_columns
-            AS A
-            LEFT JOIN (
-                SELECT table_name, column_name, COUNT(*) AS has_index
-                FROM gpkg_extensions
-                WHERE LOWER(table_name) = LOWER(:table_name)
-                    AND column_name = :column_name
-                    AND extension_name = 'gpkg_rtree_index'
-            ) AS B
-            ON LOWER(A.table_name) = LOWER(B.table_name)
-                AND A.column_name = B.column_name
-            WHERE LOWER(A.table_name) = LOWER(:table_name)
-                AND A.column_name = :column_name;
-        """
-        ).bindparams(table_name=table_name, column_name=col_name)
-    ).fetchone()
-    if attrs is None:
-        # If the column is not registered as a spatial column we ignore it
-        return None
-    geometry_type, srid, has_z, has_m, has_index = attrs
-    coord_dimension = "XY"
-    if has_z:
-        coord_dimension += "Z"
-    if has_m:
-        coord_dimension += "M"
-    col_attributes = geometry_type, coord_dimension, srid, has_index
-    return col_attributes
+                EXISTS (
+                    SELECT 1
+                    FROM gpkg_extensions AS B
+                    WHERE LOWER(A.table_name) = LOWER(B.table_name)
+                        AND A.column_name = B.column_name
+                        AND B.extension_name = 'gpkg_rtree_index'
+                ) AS has_index
+            FROM gpkg_geometry_columns AS A
+            ORDER BY A.table_name, A.column_name"""
+        )
+        for table_name, column_name, geometry_type, srid, has_z, has_m, has_index in bind.execute(
+            query
+        ):
+            coord_dimension = "XY"
+            if has_z:
+                coord_dimension += "Z"
+            if has_m:
+                coord_dimension += "M"
+            spatial_columns.setdefault(table_name.lower(), []).append(
+                (column_name, (geometry_type, coord_dimension, srid, has_index))
+            )
+
+    if info_cache is not None:
+        info_cache[cache_key] = spatial_columns
+    return spatial_columns
+
+
+def _get_spatialite_attrs(bind, table_name, col_name, info_cache=None):
+    # If the column is not registered as a spatial column None is returned and it is ignored
+    return _find_spatial_column(get_spatial_columns(bind, info_cache), table_name, col_name)
 
 
 def _setup_dummy_type(table, gis_cols):
@@ -162,7 +180,9 @@ def reflect_geometry_column(inspector, table, column_info):
     # Get geometry type, SRID and spatial index from the SpatiaLite metadata
     if not isinstance(column_info.get("type"), Geometry):
         return
-    col_attributes = _get_spatialite_attrs(inspector.bind, table.name, column_info["name"])
+    col_attributes = _get_spatialite_attrs(
+        inspector.bind, table.name, column_info["name"], getattr(inspector, "info_cache", None)
+    )
     if col_attributes is not None:
         geometry_type, coord_dimension, srid, spatial_index = col_attributes
 
@@ -277,10 +297,9 @@ def after_create(table, bind, **kw):
     for col in table.columns:
         # Add spatial indexes for the Geometry and Geography columns
         # TODO: Check that the Geography type makes sense here
-        if (
-            _check_spatial_type(col.type, (Geometry, Geography), dialect)
-            and col.type.spatial_index is True
-        ):
+        if _check_spatial_type(
+            col.type, (Geometry, Geography), dialect
+        ) and col.type.spatial_index in (True, "deferred"):
             create_spatial_index(bind, table, col)
 
     for idx in table.info.pop("_after_create_indexes"):
@@ -1,7 +1,10 @@
 """This module defines specific functions for MariaDB dialect."""
 
+import binascii
+
 from sqlalchemy.ext.compiler import compiles
 
+from geoalchemy2 import _wkb_wkt
 from geoalchemy2 import functions
 from geoalchemy2.admin.dialects.common import compile_bin_literal
 from geoalchemy2.admin.dialects.common import unwrap_wkb_constructor_clauses
@@ -9,6 +12,7 @@ from geoalchemy2.admin.dialects.mysql import _coerce_ewkb_bind_clause_to_wkb
 from geoalchemy2.admin.dialects.mysql import _coerce_ewkb_clause_to_wkb
 from geoalchemy2.admin.dialects.mysql import _coerce_known_ewkb_clause_to_wkb
 from geoalchemy2.admin.dialects.mysql import _compile_srid_arg
+from geoalchemy2.admin.dialects.mysql import _convert_cursor_parameters
 from geoalchemy2.admin.dialects.mysql import _dynamic_ewkb_default_srid
 from geoalchemy2.admin.dialects.mysql import _dynamic_ewkb_split_disabled
 from geoalchemy2.admin.dialects.mysql import _dynamic_inferred_srid_bind_clauses
@@ -28,12 +32,16 @@ from geoalchemy2.elements import WKTElement
 
 
 def _cast(param):
-    if isinstance(param, memoryview):
-        param = param.tobytes()
-    if isinstance(param, bytearray):
-        param = bytes(param)
-    if isinstance(param, bytes):
-        param = WKBElement(param)
+    # MariaDB does not support raw binary data so the WKB is given as hex, without any SRID
+    if isinstance(param, (bytes, bytearray, memoryview)):
+        if len(param) >= 5:
+            try:
+                header_srid = _wkb_wkt.wkb_srid(param, include_unknown=True)
+            except ValueError:
+                header_srid = None
+            if header_srid is not None:
+                param = _wkb_wkt.to_wkb_no_srid_header(param)
+        return binascii.hexlify(param).decode("utf-8")
     if isinstance(param, WKBElement):
         param = param.as_wkb().desc
     return param
@@ -46,11 +54,7 @@ def before_cursor_execute(conn, cursor, statement, parameters, context, executem
         convert (bool): Trigger the conversion.
     """
     if convert:
-        if isinstance(parameters, (tuple, list)):
-            parameters = tuple(_cast(x) for x in parameters)
-        elif isinstance(parameters, dict):
-            for k in parameters:
-                parameters[k] = _cast(parameters[k])
+        parameters = _convert_cursor_parameters(parameters, context, executemany, _cast)
 
     return statement, parameters
 
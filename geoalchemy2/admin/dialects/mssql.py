@@ -3,9 +3,9 @@
 import hashlib
 import math
 import re
+from collections import namedtuple
 from collections.abc import Mapping
 
-from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import text
 from sqlalchemy.dialects.mssql.base import ischema_names as _mssql_ischema_names
@@ -20,6 +20,7 @@ from sqlalchemy.sql.sqltypes import NullType
 from sqlalchemy.types import LargeBinary
 from sqlalchemy.types import TypeDecorator
 from sqlalchemy.types import UnicodeText
+from sqlalchemy.util import LRUCache
 
 from geoalchemy2 import _wkb_wkt
 from geoalchemy2 import functions
@@ -37,10 +38,6 @@ from geoalchemy2.types.dialects.mssql import bind_processor_process as _type_bin
 _mssql_ischema_names["geometry"] = Geometry
 _mssql_ischema_names["geography"] = Geography
 
-# Register GeoAlchemy's spatial index kwargs so SQLAlchemy accepts them on Index(...).
-for _dialect_kwarg in ("bounding_box", "cells_per_object", "grids", "using", "with"):
-    Index.argument_for("mssql", _dialect_kwarg, None)
-
 _MSSQL_WORLD_BOUNDING_BOX = (-180.0, -90.0, 180.0, 90.0)
 _MSSQL_DEFAULT_BOUNDING_BOX = (-1000000000.0, -1000000000.0, 1000000000.0, 1000000000.0)
 _MSSQL_GEOMETRY_TYPE_NAMES = {
@@ -62,6 +59,9 @@ _MSSQL_BOUNDING_BOX_ERROR = (
 _MSSQL_DYNAMIC_EWKT_KEY_PREFIX = "_geoalchemy2_mssql_ewkt"
 _MSSQL_DYNAMIC_EWKB_KEY_PREFIX = "_geoalchemy2_mssql_ewkb"
 _MSSQL_DISABLE_DYNAMIC_EWKT_SPLIT_OPTION = "geoalchemy2_mssql_disable_dynamic_ewkt_split"
+_MSSQL_BIND_MAPPING_CACHE_SIZE = 500
+
+BindMappingCacheInfo = namedtuple("BindMappingCacheInfo", ["hits", "misses", "maxsize", "currsize"])
 
 
 def _quote_mssql_identifier(name):
@@ -140,12 +140,6 @@ def _mssql_spatial_constraint_name(table_name, column_name, constraint_type):
     return f"ck_{table_name}_{column_name}_{constraint_type}"
 
 
-def _column_regex(column_name):
-    quoted_column = re.escape(column_name.replace("]", "]]"))
-    unquoted_column = re.escape(column_name)
-    return rf"(?:\[{quoted_column}\]|{unquoted_column})"
-
-
 def _default_mssql_bounding_box(col_type, is_geography=False):
     if is_geography:
         return None
@@ -169,68 +163,163 @@ def _get_mssql_column_type_name(bind, table_name, column_name, schema=None):
     ).scalar()
 
 
-def _get_mssql_spatial_column_constraints(bind, table_name, column_name, schema=None):
+_MSSQL_CONSTRAINT_COLUMN = r"(?:\[((?:[^\]]|\]\])+)\]|([^\s.\[\]()']+))"
+_MSSQL_SRID_CONSTRAINT = re.compile(
+    rf"{_MSSQL_CONSTRAINT_COLUMN}\s*\.\s*(?:\[STSrid\]|STSrid)\s*=\s*\(?\s*(-?\d+)\s*\)?",
+    re.IGNORECASE,
+)
+_MSSQL_GEOMETRY_TYPE_CONSTRAINT = re.compile(
+    rf"{_MSSQL_CONSTRAINT_COLUMN}\s*\.\s*(?:\[STGeometryType\]|STGeometryType)\s*"
+    rf"\(\s*\)\s*=\s*\(?\s*N?'([^']+)'",
+    re.IGNORECASE,
+)
+_MSSQL_GEOMETRY_TYPE_PREFIX_CONSTRAINT = re.compile(
+    rf"{_MSSQL_CONSTRAINT_COLUMN}\s*\.\s*(?:\[AsTextZM\]|AsTextZM)\s*\(\s*\)\s*\)*\s+"
+    rf"LIKE\s+\(?\s*N?'([^'%]+)%",
+    re.IGNORECASE,
+)
+_MSSQL_SPATIAL_METADATA_CACHE_KEY = "geoalchemy2_mssql_spatial_metadata"
+
+_MSSQLSpatialMetadata = namedtuple("_MSSQLSpatialMetadata", ["columns", "indexes"])
+"""The spatial metadata of the tables of a schema.
+
+The ``columns`` dict maps each lower-cased table name to a dict mapping each lower-cased column
+name to its ``(type_name, is_nullable, geometry_type, srid)`` tuple. The ``indexes`` dict maps each
+lower-cased table name to its spatial indexes, as returned by ``_get_mssql_spatial_indexes``.
+"""
+
+
+def _parse_mssql_constraint_matches(pattern, definition):
+    """Get the first value matched by the pattern for each column, keyed by lower-cased name."""
+    values = {}
+    for match in pattern.finditer(definition):
+        quoted_column, unquoted_column, value = match.groups()
+        column_name = unquoted_column if quoted_column is None else quoted_column.replace("]]", "]")
+        values.setdefault(column_name.lower(), value)
+    return values
+
+
+def _parse_mssql_spatial_constraints(definitions):
+    """Get the geometry type and SRID of the columns from the check constraints of a table.
+
+    Each definition is only parsed once, for all the columns of the table.
+
+    Returns:
+        A dict mapping each lower-cased column name to its ``(geometry_type, srid)`` tuple. The
+        columns without any spatial constraint are not in the dict.
+    """
+    constraints = {}
+    for definition in definitions:
+        srids = _parse_mssql_constraint_matches(_MSSQL_SRID_CONSTRAINT, definition)
+        geometry_types = _parse_mssql_constraint_matches(
+            _MSSQL_GEOMETRY_TYPE_CONSTRAINT, definition
+        )
+        geometry_type_prefixes = _parse_mssql_constraint_matches(
+            _MSSQL_GEOMETRY_TYPE_PREFIX_CONSTRAINT, definition
+        )
+        for column_name in srids.keys() | geometry_types.keys() | geometry_type_prefixes.keys():
+            geometry_type, srid = constraints.get(column_name, ("GEOMETRY", -1))
+            if column_name in srids:
+                srid = int(srids[column_name])
+            # The exact geometry type takes precedence over the prefix in the same definition
+            geometry_type_name = geometry_types.get(
+                column_name, geometry_type_prefixes.get(column_name)
+            )
+            if geometry_type_name is not None:
+                geometry_type = _MSSQL_GEOMETRY_TYPE_LOOKUP.get(
+                    geometry_type_name.upper(), geometry_type
+                )
+            constraints[column_name] = (geometry_type, srid)
+    return constraints
+
+
+def _get_mssql_spatial_metadata(bind, schema, info_cache=None):
+    """Get the spatial columns and indexes of all the tables of a schema.
+
+    The columns with their check constraints and the spatial indexes are fetched with two queries.
+    When an ``info_cache`` is given, e.g. the one of an inspector, the result is stored in it and
+    reused by the reflection of all the columns and indexes of the schema.
+    """
+    cache_key = (_MSSQL_SPATIAL_METADATA_CACHE_KEY, schema)
+    if info_cache is not None and cache_key in info_cache:
+        return info_cache[cache_key]
+
+    columns_query = text(
+        """SELECT
+            o.name AS table_name,
+            c.name AS column_name,
+            t.name AS type_name,
+            c.is_nullable,
+            cc.object_id AS constraint_id,
+            cc.definition
+        FROM sys.columns AS c
+        JOIN sys.types AS t
+            ON c.user_type_id = t.user_type_id
+        JOIN sys.objects AS o
+            ON c.object_id = o.object_id
+        JOIN sys.schemas AS s
+            ON o.schema_id = s.schema_id
+        LEFT JOIN sys.check_constraints AS cc
+            ON c.object_id = cc.parent_object_id
+        WHERE s.name = :schema AND t.name IN ('geometry', 'geography')
+        ORDER BY o.name, c.column_id, cc.object_id"""
+    )
+    spatial_columns = {}
+    definitions = {}
+    for row in bind.execute(columns_query, {"schema": schema}).mappings():
+        table_name = row["table_name"].lower()
+        spatial_columns.setdefault(table_name, {})[row["column_name"].lower()] = (
+            row["type_name"],
+            row["is_nullable"],
+        )
+        # The constraints of the table are joined to each of its spatial columns
+        if row["constraint_id"] is not None:
+            definitions.setdefault(table_name, {})[row["constraint_id"]] = row["definition"]
+
+    columns = {}
+    for table_name, table_columns in spatial_columns.items():
+        constraints = _parse_mssql_spatial_constraints(definitions.get(table_name, {}).values())
+        columns[table_name] = {
+            column_name: (type_name, is_nullable) + constraints.get(column_name, ("GEOMETRY", -1))
+            for column_name, (type_name, is_nullable) in table_columns.items()
+        }
+
+    indexes = {}
+    for row in _query_mssql_spatial_indexes(bind, ["s.name = :schema"], {"schema": schema}):
+        indexes.setdefault(row["table_name"].lower(), []).append(_mssql_spatial_index_from_row(row))
+
+    metadata = _MSSQLSpatialMetadata(columns, indexes)
+    if info_cache is not None:
+        info_cache[cache_key] = metadata
+    return metadata
+
+
+def _get_mssql_spatial_column_constraints(
+    bind, table_name, column_name, schema=None, info_cache=None
+):
+    if info_cache is not None:
+        metadata = _get_mssql_spatial_metadata(bind, schema, info_cache)
+        column = metadata.columns.get(table_name.lower(), {}).get(column_name.lower())
+        return ("GEOMETRY", -1) if column is None else column[2:]
+
     full_table_name = _get_mssql_full_table_name(table_name, schema=schema)
     constraints_query = text(
         """SELECT definition
         FROM sys.check_constraints
         WHERE parent_object_id = OBJECT_ID(:full_table_name)"""
     )
-    column_pattern = _column_regex(column_name)
-    srid_pattern = re.compile(
-        rf"{column_pattern}\s*\.\s*(?:\[STSrid\]|STSrid)\s*=\s*\(?\s*(-?\d+)\s*\)?",
-        re.IGNORECASE,
-    )
-    geometry_type_pattern = re.compile(
-        rf"{column_pattern}\s*\.\s*(?:\[STGeometryType\]|STGeometryType)\s*"
-        rf"\(\s*\)\s*=\s*\(?\s*N?'([^']+)'",
-        re.IGNORECASE,
-    )
-    geometry_type_prefix_pattern = re.compile(
-        rf"{column_pattern}\s*\.\s*(?:\[AsTextZM\]|AsTextZM)\s*\(\s*\)\s*\)*\s+"
-        rf"LIKE\s+\(?\s*N?'([^'%]+)%",
-        re.IGNORECASE,
-    )
-
-    srid = -1
-    geometry_type = "GEOMETRY"
-    for definition in bind.execute(
+    definitions = bind.execute(
         constraints_query,
         {"full_table_name": full_table_name},
-    ).scalars():
-        srid_match = srid_pattern.search(definition)
-        if srid_match:
-            srid = int(srid_match.group(1))
-
-        geometry_type_match = geometry_type_pattern.search(definition)
-        if geometry_type_match:
-            geometry_type = _MSSQL_GEOMETRY_TYPE_LOOKUP.get(
-                geometry_type_match.group(1).upper(),
-                geometry_type,
-            )
-            continue
-
-        geometry_type_prefix_match = geometry_type_prefix_pattern.search(definition)
-        if geometry_type_prefix_match:
-            geometry_type = _MSSQL_GEOMETRY_TYPE_LOOKUP.get(
-                geometry_type_prefix_match.group(1).upper(),
-                geometry_type,
-            )
+    ).scalars()
+    return _parse_mssql_spatial_constraints(definitions).get(column_name.lower(), ("GEOMETRY", -1))
 
-    return geometry_type, srid
-
-
-def _get_mssql_spatial_indexes(bind, table_name, schema=None, column_name=None):
-    full_table_name = _get_mssql_full_table_name(table_name, schema=schema)
-    where_clauses = ["i.object_id = OBJECT_ID(:full_table_name)", "i.type_desc = 'SPATIAL'"]
-    params = {"full_table_name": full_table_name}
-
-    if column_name is not None:
-        where_clauses.append("c.name = :column_name")
-        params["column_name"] = column_name
 
+def _query_mssql_spatial_indexes(bind, where_clauses, params):
+    """Query the spatial indexes matching the clauses and their tessellation settings."""
     spatial_index_query = text(
         f"""SELECT
+            o.name AS table_name,
             i.name AS index_name,
             c.name AS column_name,
             si.tessellation_scheme,
@@ -244,6 +333,10 @@ def _get_mssql_spatial_indexes(bind, table_name, schema=None, column_name=None):
             sit.level_3_grid_desc,
             sit.level_4_grid_desc
         FROM sys.indexes AS i
+        JOIN sys.objects AS o
+            ON i.object_id = o.object_id
+        JOIN sys.schemas AS s
+            ON o.schema_id = s.schema_id
         JOIN sys.index_columns AS ic
             ON i.object_id = ic.object_id
             AND i.index_id = ic.index_id
@@ -256,48 +349,70 @@ def _get_mssql_spatial_indexes(bind, table_name, schema=None, column_name=None):
         LEFT JOIN sys.spatial_index_tessellations AS sit
             ON i.object_id = sit.object_id
             AND i.index_id = sit.index_id
-        WHERE {" AND ".join(where_clauses)}
-        ORDER BY i.name"""
+        WHERE {" AND ".join(["i.type_desc = 'SPATIAL'"] + where_clauses)}
+        ORDER BY o.name, i.name"""
     )
 
-    spatial_indexes = []
-    for row in bind.execute(spatial_index_query, params).mappings():
-        dialect_options = {}
-
-        if row["tessellation_scheme"] is not None:
-            dialect_options["mssql_using"] = row["tessellation_scheme"]
-        if row["cells_per_object"] is not None:
-            dialect_options["mssql_cells_per_object"] = int(row["cells_per_object"])
-        if row["bounding_box_xmin"] is not None:
-            dialect_options["mssql_bounding_box"] = (
-                row["bounding_box_xmin"],
-                row["bounding_box_ymin"],
-                row["bounding_box_xmax"],
-                row["bounding_box_ymax"],
-            )
+    return bind.execute(spatial_index_query, params).mappings()
 
-        grids = tuple(
-            level
-            for level in (
-                row["level_1_grid_desc"],
-                row["level_2_grid_desc"],
-                row["level_3_grid_desc"],
-                row["level_4_grid_desc"],
-            )
-            if level is not None
+
+def _mssql_spatial_index_from_row(row):
+    """Build the reflected spatial index from a row of ``_query_mssql_spatial_indexes``."""
+    dialect_options = {}
+
+    if row["tessellation_scheme"] is not None:
+        dialect_options["mssql_using"] = row["tessellation_scheme"]
+    if row["cells_per_object"] is not None:
+        dialect_options["mssql_cells_per_object"] = int(row["cells_per_object"])
+    if row["bounding_box_xmin"] is not None:
+        dialect_options["mssql_bounding_box"] = (
+            row["bounding_box_xmin"],
+            row["bounding_box_ymin"],
+            row["bounding_box_xmax"],
+            row["bounding_box_ymax"],
         )
-        if len(grids) == 4:
-            dialect_options["mssql_grids"] = grids
 
-        spatial_indexes.append(
-            {
-                "name": row["index_name"],
-                "column_name": row["column_name"],
-                "dialect_options": dialect_options,
-            }
+    grids = tuple(
+        level
+        for level in (
+            row["level_1_grid_desc"],
+            row["level_2_grid_desc"],
+            row["level_3_grid_desc"],
+            row["level_4_grid_desc"],
         )
+        if level is not None
+    )
+    if len(grids) == 4:
+        dialect_options["mssql_grids"] = grids
+
+    return {
+        "name": row["index_name"],
+        "column_name": row["column_name"],
+        "dialect_options": dialect_options,
+    }
+
+
+def _get_mssql_spatial_indexes(bind, table_name, schema=None, column_name=None, info_cache=None):
+    if info_cache is not None:
+        metadata = _get_mssql_spatial_metadata(bind, schema, info_cache)
+        return [
+            spatial_index
+            for spatial_index in metadata.indexes.get(table_name.lower(), [])
+            if column_name is None or spatial_index["column_name"].lower() == column_name.lower()
+        ]
+
+    full_table_name = _get_mssql_full_table_name(table_name, schema=schema)
+    where_clauses = ["i.object_id = OBJECT_ID(:full_table_name)"]
+    params = {"full_table_name": full_table_name}
+
+    if column_name is not None:
+        where_clauses.append("c.name = :column_name")
+        params["column_name"] = column_name
 
-    return spatial_indexes
+    return [
+        _mssql_spatial_index_from_row(row)
+        for row in _query_mssql_spatial_indexes(bind, where_clauses, params)
+    ]
 
 
 def _get_mssql_spatial_index_with_clauses(col_type, idx_kwargs, is_geography=False):
@@ -452,39 +567,21 @@ def reflect_geometry_column(inspector, table, column_info):
 
     column_name = column_info["name"]
     schema = table.schema or inspector.default_schema_name
-    full_table_name = _get_mssql_full_table_name(table.name, schema=schema)
 
-    type_query = text(
-        """SELECT t.name, c.is_nullable
-        FROM sys.columns AS c
-        JOIN sys.types AS t ON c.user_type_id = t.user_type_id
-        WHERE c.object_id = OBJECT_ID(:full_table_name) AND c.name = :column_name"""
+    # The spatial metadata of the whole schema is fetched once per inspector
+    metadata = _get_mssql_spatial_metadata(
+        inspector.bind, schema, getattr(inspector, "info_cache", None)
     )
-    type_name, is_nullable = inspector.bind.execute(
-        type_query,
-        {"full_table_name": full_table_name, "column_name": column_name},
-    ).one()
-    type_name = type_name.lower()
-    if type_name not in ("geometry", "geography"):
+    column = metadata.columns.get(table.name.lower(), {}).get(column_name.lower())
+    if column is None:
         return
-
-    spatial_index = bool(
-        _get_mssql_spatial_indexes(
-            inspector.bind,
-            table.name,
-            schema=schema,
-            column_name=column_name,
-        )
+    type_name, is_nullable, geometry_type, srid = column
+    spatial_index = any(
+        spatial_index["column_name"].lower() == column_name.lower()
+        for spatial_index in metadata.indexes.get(table.name.lower(), [])
     )
 
-    geometry_type, srid = _get_mssql_spatial_column_constraints(
-        inspector.bind,
-        table.name,
-        column_name,
-        schema=schema,
-    )
-
-    spatial_type = Geography if type_name == "geography" else Geometry
+    spatial_type = Geography if type_name.lower() == "geography" else Geometry
     column_info["type"] = spatial_type(
         geometry_type=geometry_type,
         srid=srid,
@@ -1299,50 +1396,29 @@ def _get_mssql_dynamic_ewkb_bind_clauses(wkb_clause, compiler, default_srid=0):
     return cache[cache_key]
 
 
-def _collect_mssql_dynamic_ewkt_source_binds(clauseelement, dialect):
-    if not hasattr(clauseelement, "get_children"):
-        return ()
-
-    source_binds = []
-    seen_source_identifiers = set()
-    for element in visitors.iterate(clauseelement):
-        if not isinstance(element, functions.ST_GeomFromEWKT):
-            continue
-
-        clauses = list(element.clauses)
-        if len(clauses) != 1 or not _is_bindparam_clause(clauses[0]):
-            continue
+def _collect_mssql_dynamic_source_binds(clauseelement, dialect):
+    """Return the dynamic EWKT and EWKB source parameters of a statement.
 
-        candidate_spatial_type = _resolve_mssql_spatial_type(element.type, dialect)
-        if (
-            _check_spatial_type(candidate_spatial_type, (Geometry, Geography), dialect)
-            and getattr(candidate_spatial_type, "srid", -1) >= 0
-        ):
-            continue
-
-        source_identifier = _mssql_dynamic_ewkt_bind_identifier(clauses[0])
-        if source_identifier in seen_source_identifiers:
-            continue
-        seen_source_identifiers.add(source_identifier)
-        source_binds.append(clauses[0])
-
-    return tuple(source_binds)
-
-
-def _collect_mssql_dynamic_ewkb_source_binds(clauseelement, dialect):
+    The statement is traversed once and the ``ST_GeomFromEWKT`` and ``ST_GeomFromEWKB``
+    functions are collected together: the EWKT sources are returned as a tuple of parameters
+    and the EWKB sources as a tuple of ``(parameter, default_srid)`` pairs.
+    """
     if not hasattr(clauseelement, "get_children"):
-        return ()
+        return (), ()
 
-    source_binds = []
-    seen_bind_keys = set()
+    ewkt_source_binds = []
+    ewkb_source_binds = []
+    seen_ewkt_identifiers = set()
+    seen_ewkb_keys = set()
     for element in visitors.iterate(clauseelement):
-        if not isinstance(element, functions.ST_GeomFromEWKB):
+        is_ewkt = isinstance(element, functions.ST_GeomFromEWKT)
+        if not is_ewkt and not isinstance(element, functions.ST_GeomFromEWKB):
             continue
 
         clauses = list(element.clauses)
         if len(clauses) != 1 or not _is_bindparam_clause(clauses[0]):
             continue
-        if _is_mssql_auto_constructor_bindparam(clauses[0], "ST_GeomFromEWKB"):
+        if not is_ewkt and _is_mssql_auto_constructor_bindparam(clauses[0], "ST_GeomFromEWKB"):
             continue
 
         candidate_spatial_type = _resolve_mssql_spatial_type(element.type, dialect)
@@ -1352,14 +1428,21 @@ def _collect_mssql_dynamic_ewkb_source_binds(clauseelement, dialect):
         ):
             continue
 
-        default_srid = element.type.srid if element.type.srid >= 0 else 0
-        bind_key = (_mssql_dynamic_ewkt_bind_identifier(clauses[0]), default_srid)
-        if bind_key in seen_bind_keys:
-            continue
-        seen_bind_keys.add(bind_key)
-        source_binds.append((clauses[0], default_srid))
+        source_identifier = _mssql_dynamic_ewkt_bind_identifier(clauses[0])
+        if is_ewkt:
+            if source_identifier in seen_ewkt_identifiers:
+                continue
+            seen_ewkt_identifiers.add(source_identifier)
+            ewkt_source_binds.append(clauses[0])
+        else:
+            default_srid = element.type.srid if element.type.srid >= 0 else 0
+            bind_key = (source_identifier, default_srid)
+            if bind_key in seen_ewkb_keys:
+                continue
+            seen_ewkb_keys.add(bind_key)
+            ewkb_source_binds.append((clauses[0], default_srid))
 
-    return tuple(source_binds)
+    return tuple(ewkt_source_binds), tuple(ewkb_source_binds)
 
 
 def _compile_mssql_statement_bind_name_map(clauseelement, dialect):
@@ -1381,55 +1464,185 @@ def _compile_mssql_statement_bind_name_map(clauseelement, dialect):
     return bind_name_map
 
 
-def _get_mssql_dynamic_ewkt_bind_mappings(clauseelement, dialect):
-    source_binds = _collect_mssql_dynamic_ewkt_source_binds(clauseelement, dialect)
-    if not source_binds:
-        return ()
+def _mssql_dynamic_source_keys(source_bind, compiled_name=None):
+    candidate_keys = []
+    for candidate_key in (
+        source_bind.key,
+        getattr(source_bind, "_orig_key", None),
+        compiled_name,
+    ):
+        if candidate_key is not None and candidate_key not in candidate_keys:
+            candidate_keys.append(candidate_key)
+    return tuple(candidate_keys)
 
-    statement_bind_name_map = _compile_mssql_statement_bind_name_map(clauseelement, dialect)
-    dynamic_bind_mappings = []
-    for source_bind in source_binds:
-        source_identifier = _mssql_dynamic_ewkt_bind_identifier(source_bind)
-        candidate_keys = []
-        for candidate_key in (
-            source_bind.key,
-            getattr(source_bind, "_orig_key", None),
-            statement_bind_name_map.get(source_identifier),
-        ):
-            if candidate_key is not None and candidate_key not in candidate_keys:
-                candidate_keys.append(candidate_key)
 
-        text_key, srid_key = _mssql_dynamic_ewkt_bind_keys(source_bind)
-        dynamic_bind_mappings.append((tuple(candidate_keys), text_key, srid_key))
+def _make_mssql_dynamic_ewkt_bind_mapping(source_bind, compiled_name=None):
+    text_key, srid_key = _mssql_dynamic_ewkt_bind_keys(source_bind)
+    return _mssql_dynamic_source_keys(source_bind, compiled_name), text_key, srid_key
 
-    return tuple(dynamic_bind_mappings)
 
+def _make_mssql_dynamic_ewkb_bind_mapping(source_bind, default_srid=0, compiled_name=None):
+    wkb_key, srid_key = _mssql_dynamic_ewkb_bind_keys(source_bind, default_srid=default_srid)
+    return _mssql_dynamic_source_keys(source_bind, compiled_name), wkb_key, srid_key
 
-def _get_mssql_dynamic_ewkb_bind_mappings(clauseelement, dialect):
-    source_binds = _collect_mssql_dynamic_ewkb_source_binds(clauseelement, dialect)
-    if not source_binds:
+
+def _make_mssql_dynamic_bind_mappings(clauseelement, dialect, ewkt_source_binds, ewkb_source_binds):
+    """Return the dynamic EWKT and EWKB bind mappings of collected source parameters."""
+    if not ewkt_source_binds and not ewkb_source_binds:
         return ()
 
     statement_bind_name_map = _compile_mssql_statement_bind_name_map(clauseelement, dialect)
-    dynamic_bind_mappings = []
-    for source_bind, default_srid in source_binds:
-        source_identifier = _mssql_dynamic_ewkt_bind_identifier(source_bind)
-        candidate_keys = []
-        for candidate_key in (
-            source_bind.key,
-            getattr(source_bind, "_orig_key", None),
-            statement_bind_name_map.get(source_identifier),
-        ):
-            if candidate_key is not None and candidate_key not in candidate_keys:
-                candidate_keys.append(candidate_key)
 
-        wkb_key, srid_key = _mssql_dynamic_ewkb_bind_keys(
+    def compiled_name(source_bind):
+        return statement_bind_name_map.get(_mssql_dynamic_ewkt_bind_identifier(source_bind))
+
+    return tuple(
+        _make_mssql_dynamic_ewkt_bind_mapping(source_bind, compiled_name(source_bind))
+        for source_bind in ewkt_source_binds
+    ) + tuple(
+        _make_mssql_dynamic_ewkb_bind_mapping(
             source_bind,
             default_srid=default_srid,
+            compiled_name=compiled_name(source_bind),
+        )
+        for source_bind, default_srid in ewkb_source_binds
+    )
+
+
+class _MSSQLBindMappingCache(LRUCache):
+    """LRU cache of the dynamic bind mappings of the statements, with hit and miss counters."""
+
+    def __init__(self, capacity=_MSSQL_BIND_MAPPING_CACHE_SIZE):
+        super().__init__(capacity)
+        self.hits = 0
+        self.misses = 0
+
+
+class _MSSQLStatementBindMappings:
+    """The dynamic EWKT and EWKB bind mappings shared by the statements with the same cache key.
+
+    The source parameters are recorded by their position in the bound parameters of the cache
+    key, so the mappings can be rebuilt for the parameters of another statement with the same
+    cache key without traversing or compiling it.
+    """
+
+    def __init__(self, ewkt_sources, ewkb_sources, bindparams):
+        self.ewkt_sources = ewkt_sources
+        self.ewkb_sources = ewkb_sources
+        self._source_keys = self._get_source_keys(bindparams)
+        self._bind_mappings = self._make_bind_mappings(bindparams)
+
+    @classmethod
+    def from_statement(cls, clauseelement, dialect, bindparams, ewkt_binds, ewkb_binds):
+        """Build the mappings of a statement or return None if they can not be shared."""
+        positions = {id(bind): position for position, bind in enumerate(bindparams)}
+        source_binds = list(ewkt_binds) + [source_bind for source_bind, _ in ewkb_binds]
+        if any(id(source_bind) not in positions for source_bind in source_binds):
+            return None
+
+        statement_bind_name_map = {}
+        if source_binds:
+            statement_bind_name_map = _compile_mssql_statement_bind_name_map(clauseelement, dialect)
+
+        def compiled_name(source_bind):
+            return statement_bind_name_map.get(_mssql_dynamic_ewkt_bind_identifier(source_bind))
+
+        return cls(
+            tuple(
+                (positions[id(source_bind)], compiled_name(source_bind))
+                for source_bind in ewkt_binds
+            ),
+            tuple(
+                (positions[id(source_bind)], default_srid, compiled_name(source_bind))
+                for source_bind, default_srid in ewkb_binds
+            ),
+            bindparams,
         )
-        dynamic_bind_mappings.append((tuple(candidate_keys), wkb_key, srid_key))
 
-    return tuple(dynamic_bind_mappings)
+    def _get_source_keys(self, bindparams):
+        return tuple(bindparams[position].key for position, _ in self.ewkt_sources) + tuple(
+            bindparams[position].key for position, _, _ in self.ewkb_sources
+        )
+
+    def _make_bind_mappings(self, bindparams):
+        return tuple(
+            _make_mssql_dynamic_ewkt_bind_mapping(bindparams[position], compiled_name)
+            for position, compiled_name in self.ewkt_sources
+        ) + tuple(
+            _make_mssql_dynamic_ewkb_bind_mapping(
+                bindparams[position],
+                default_srid=default_srid,
+                compiled_name=compiled_name,
+            )
+            for position, default_srid, compiled_name in self.ewkb_sources
+        )
+
+    def bind_mappings(self, bindparams):
+        """Return the mappings for the bound parameters of the executed statement."""
+        if self._source_keys == self._get_source_keys(bindparams):
+            return self._bind_mappings
+        return self._make_bind_mappings(bindparams)
+
+
+def _get_mssql_bind_mapping_cache(dialect):
+    bind_mapping_cache = getattr(dialect, "_geoalchemy2_mssql_bind_mapping_cache", None)
+    if bind_mapping_cache is None:
+        bind_mapping_cache = _MSSQLBindMappingCache()
+        dialect._geoalchemy2_mssql_bind_mapping_cache = bind_mapping_cache
+    return bind_mapping_cache
+
+
+def bind_mapping_cache_info(dialect):
+    """Return the statistics of the cache of the dynamic EWKT and EWKB bind mappings.
+
+    Args:
+        dialect: The SQL Server dialect whose cache is inspected.
+
+    Returns:
+        A ``BindMappingCacheInfo`` named tuple with the ``hits``, ``misses``, ``maxsize`` and
+        ``currsize`` fields.
+    """
+    bind_mapping_cache = _get_mssql_bind_mapping_cache(dialect)
+    return BindMappingCacheInfo(
+        bind_mapping_cache.hits,
+        bind_mapping_cache.misses,
+        bind_mapping_cache.capacity,
+        len(bind_mapping_cache),
+    )
+
+
+def _get_mssql_dynamic_bind_mappings(clauseelement, dialect):
+    """Return the dynamic EWKT and EWKB bind mappings of a statement.
+
+    The mappings are memoized per statement cache key, so the statements executed several times
+    are only traversed and compiled once.
+    """
+    if not hasattr(clauseelement, "get_children"):
+        return ()
+
+    generate_cache_key = getattr(clauseelement, "_generate_cache_key", None)
+    cache_key = generate_cache_key() if generate_cache_key is not None else None
+    if cache_key is None:
+        return _make_mssql_dynamic_bind_mappings(
+            clauseelement, dialect, *_collect_mssql_dynamic_source_binds(clauseelement, dialect)
+        )
+
+    bind_mapping_cache = _get_mssql_bind_mapping_cache(dialect)
+    statement_mappings = bind_mapping_cache.get(cache_key.key)
+    if statement_mappings is not None:
+        bind_mapping_cache.hits += 1
+        return statement_mappings.bind_mappings(cache_key.bindparams)
+
+    bind_mapping_cache.misses += 1
+    source_binds = _collect_mssql_dynamic_source_binds(clauseelement, dialect)
+    statement_mappings = _MSSQLStatementBindMappings.from_statement(
+        clauseelement, dialect, cache_key.bindparams, *source_binds
+    )
+    if statement_mappings is None:
+        return _make_mssql_dynamic_bind_mappings(clauseelement, dialect, *source_binds)
+
+    bind_mapping_cache[cache_key.key] = statement_mappings
+    return statement_mappings.bind_mappings(cache_key.bindparams)
 
 
 def _expand_mssql_dynamic_ewkt_param_mapping(parameters, dynamic_bind_mappings):
@@ -1458,10 +1671,11 @@ def _expand_mssql_dynamic_ewkt_param_mapping(parameters, dynamic_bind_mappings):
 
 
 def before_execute(conn, clauseelement, multiparams, params, execution_options):
-    dynamic_bind_mappings = _get_mssql_dynamic_ewkt_bind_mappings(
-        clauseelement,
-        conn.dialect,
-    ) + _get_mssql_dynamic_ewkb_bind_mappings(clauseelement, conn.dialect)
+    if not functions._BUILT_EXTENDED_CONSTRUCTORS:
+        # No statement can contain an ST_GeomFromEWKT or ST_GeomFromEWKB function yet
+        return clauseelement, multiparams, params
+
+    dynamic_bind_mappings = _get_mssql_dynamic_bind_mappings(clauseelement, conn.dialect)
     if not dynamic_bind_mappings:
         return clauseelement, multiparams, params
 
@@ -13,9 +13,11 @@ from sqlalchemy.sql import visitors
 from sqlalchemy.sql.elements import BindParameter
 from sqlalchemy.sql.elements import Null
 from sqlalchemy.sql.sqltypes import NullType
+from sqlalchemy.sql.sqltypes import _Binary
 from sqlalchemy.types import LargeBinary
 from sqlalchemy.types import String
 from sqlalchemy.types import TypeDecorator
+from sqlalchemy.util import LRUCache
 
 from geoalchemy2 import _wkb_wkt
 from geoalchemy2 import functions
@@ -95,6 +97,93 @@ def reflect_geometry_column(inspector, table, column_info):
     )
 
 
+def _may_hold_binary_data(type_):
+    affinity = type_._type_affinity
+    return (
+        affinity is None
+        or issubclass(affinity, (_Binary, NullType))
+        or _check_spatial_type(type_, (Geometry, Geography))
+    )
+
+
+def _binary_parameter_targets(context):
+    """Return the keys and positions of the parameters which may hold binary spatial data.
+
+    They are found from the types of the binds of the compiled statement and stored on it, so they
+    are computed only once per cached statement. None is returned when the parameters can not be
+    matched to the binds, in which case all of them should be considered.
+    """
+    compiled = getattr(context, "compiled", None)
+    if compiled is None or not getattr(compiled, "bind_names", None):
+        return None
+    if (
+        getattr(compiled, "post_compile_params", None)
+        or getattr(compiled, "literal_execute_params", None)
+        or getattr(getattr(context, "execute_style", None), "name", None) == "INSERTMANYVALUES"
+    ):
+        return None
+
+    try:
+        return compiled._geoalchemy2_binary_parameter_targets
+    except AttributeError:
+        pass
+
+    names = {name for bind, name in compiled.bind_names.items() if _may_hold_binary_data(bind.type)}
+    escaped_bind_names = getattr(compiled, "escaped_bind_names", None) or {}
+    keys = frozenset(escaped_bind_names.get(name, name) for name in names)
+    positiontup = getattr(compiled, "positiontup", None) or ()
+    positions = tuple(position for position, name in enumerate(positiontup) if name in names)
+    targets = (keys, positions, len(positiontup))
+    compiled._geoalchemy2_binary_parameter_targets = targets
+    return targets
+
+
+def _convert_parameters(parameters, convert_value, targets=None):
+    """Convert the values of a parameter set, only at the given targets if they are known."""
+    if isinstance(parameters, (tuple, list)):
+        if targets is None or len(parameters) != targets[2]:
+            positions = range(len(parameters))
+        else:
+            positions = targets[1]
+        converted = None
+        for position in positions:
+            value = parameters[position]
+            new_value = convert_value(value)
+            if new_value is not value:
+                if converted is None:
+                    converted = list(parameters)
+                converted[position] = new_value
+        if converted is not None:
+            parameters = tuple(converted)
+    elif isinstance(parameters, dict):
+        keys = list(parameters) if targets is None else targets[0].intersection(parameters)
+        for key in keys:
+            value = parameters[key]
+            new_value = convert_value(value)
+            if new_value is not value:
+                parameters[key] = new_value
+    return parameters
+
+
+def _convert_cursor_parameters(parameters, context, executemany, convert_value):
+    """Convert the parameters given to the cursor, for a single execution or for executemany.
+
+    Args:
+        parameters: The parameters given to the cursor.
+        context: The execution context of the statement.
+        executemany: Whether the parameters are a sequence of parameter sets.
+        convert_value: The function called on each value which may hold binary spatial data.
+    """
+    targets = _binary_parameter_targets(context)
+    if executemany:
+        return [_convert_parameters(params, convert_value, targets) for params in parameters]
+    return _convert_parameters(parameters, convert_value, targets)
+
+
+def _memoryview_to_bytes(value):
+    return value.tobytes() if isinstance(value, memoryview) else value
+
+
 def before_cursor_execute(conn, cursor, statement, parameters, context, executemany, convert=True):  # noqa: D417
     """Event handler to cast the parameters properly.
 
@@ -102,12 +191,11 @@ def before_cursor_execute(conn, cursor, statement, parameters, context, executem
         convert (bool): Trigger the conversion.
     """
     if convert:
-        if isinstance(parameters, (tuple, list)):
-            parameters = tuple(x.tobytes() if isinstance(x, memoryview) else x for x in parameters)
-        elif isinstance(parameters, dict):
-            for k in parameters:
-                if isinstance(parameters[k], memoryview):
-                    parameters[k] = parameters[k].tobytes()
+        # The MySQL drivers do not accept memoryview objects, so only they are copied, and the
+        # parameters are left untouched when there is none of them
+        parameters = _convert_cursor_parameters(
+            parameters, context, executemany, _memoryview_to_bytes
+        )
 
     return statement, parameters
 
@@ -144,7 +232,7 @@ def after_create(table, bind, **kw):
         # Add spatial indices for the Geometry and Geography columns
         if (
             _check_spatial_type(col.type, (Geometry, Geography), dialect)
-            and col.type.spatial_index is True
+            and col.type.spatial_index in (True, "deferred")
             and col.computed is None
             and not [i for i in table.indexes if col in i.columns.values()]
         ):
@@ -167,6 +255,7 @@ def after_drop(table, bind, **kw):
 _MYSQL_FUNCTIONS = {"ST_AsEWKB": "ST_AsBinary", "ST_SetSRID": "ST_SRID"}
 _MYSQL_DYNAMIC_EWKB_KEY_PREFIX = "_geoalchemy2_mysql_ewkb"
 _MYSQL_DISABLE_DYNAMIC_EWKB_SPLIT_OPTION = "geoalchemy2_mysql_disable_dynamic_ewkb_split"
+_MYSQL_EWKB_STATEMENT_CACHE_SIZE = 500
 
 
 def _compiles_mysql(cls, fn):
@@ -207,9 +296,6 @@ def _compile_GeomFromText_MySql(element, compiler, **kw):
 
 
 def _known_wkb_bindvalue_srids(bindvalue):
-    if isinstance(bindvalue, bytearray):
-        bindvalue = bytes(bindvalue)
-
     srids = []
     if isinstance(bindvalue, WKBElement):
         if is_known_srid(bindvalue.srid):
@@ -292,9 +378,6 @@ def _ewkb_to_wkb_data(
                 "a fixed column SRID or an explicit SRID argument for MySQL/MariaDB compilation"
             )
 
-    if isinstance(value, bytearray):
-        value = bytes(value)
-
     if isinstance(value, WKBElement):
         value = value.data
     if as_hex:
@@ -797,19 +880,23 @@ def _dynamic_ewkb_split_disabled(compiler):
     )
 
 
-def _collect_mysql_dynamic_ewkb_source_binds(clauseelement, dialect):
-    if not hasattr(clauseelement, "get_children"):
-        return ()
-
-    source_binds = []
-    seen_bind_keys = set()
+def _collect_mysql_ewkb_constructors(clauseelement):
+    """Return the ST_GeomFromEWKB constructors of a statement whose value is a bound parameter."""
+    constructors = []
     for element in visitors.iterate(clauseelement):
         if not isinstance(element, functions.ST_GeomFromEWKB):
             continue
 
         clauses = list(element.clauses)
-        if len(clauses) < 1 or not _is_bindparam_clause(clauses[0]):
-            continue
+        if len(clauses) >= 1 and _is_bindparam_clause(clauses[0]):
+            constructors.append((element, clauses))
+    return constructors
+
+
+def _collect_mysql_dynamic_ewkb_source_binds(constructors):
+    source_binds = []
+    seen_bind_keys = set()
+    for element, clauses in constructors:
         if _has_effective_srid_argument(clauses):
             continue
 
@@ -845,12 +932,110 @@ def _compile_mysql_statement_bind_name_map(clauseelement, dialect):
     return bind_name_map
 
 
+class _MySQLEWKBStatementInfo:
+    """The ST_GeomFromEWKB constructors of a statement.
+
+    The information is shared by the statements with the same cache key: their bound parameters
+    are given in the same order by their cache keys, so the parameters of the constructors found
+    in the first statement are replaced by the ones of the executed statement.
+    """
+
+    def __init__(self, constructors, bindparams=None):
+        self.constructors = constructors
+        self._bindparams = bindparams
+        self._bind_positions = None
+        self._compiled_names = None
+        if bindparams is not None:
+            self._bind_positions = {id(bind): position for position, bind in enumerate(bindparams)}
+
+    @property
+    def shareable(self):
+        """Whether all the parameters of the constructors are found in the cache key."""
+        return self._bind_positions is not None and all(
+            id(clause) in self._bind_positions
+            for _, clauses in self.constructors
+            for clause in clauses
+            if _is_bindparam_clause(clause)
+        )
+
+    def current_constructors(self, bindparams):
+        if bindparams is None or bindparams is self._bindparams:
+            return self.constructors
+
+        positions = self._bind_positions
+        return [
+            (
+                element,
+                [
+                    bindparams[positions[id(clause)]] if _is_bindparam_clause(clause) else clause
+                    for clause in clauses
+                ],
+            )
+            for element, clauses in self.constructors
+        ]
+
+    def bind_name_map(self, clauseelement, dialect, bindparams):
+        if bindparams is None:
+            return _compile_mysql_statement_bind_name_map(clauseelement, dialect)
+
+        if self._compiled_names is None:
+            bind_name_map = _compile_mysql_statement_bind_name_map(clauseelement, dialect)
+            compiled_names = {}
+            for position, bind in enumerate(bindparams):
+                compiled_name = bind_name_map.get(_runtime_bind_identifier(bind))
+                if compiled_name is not None:
+                    compiled_names[position] = compiled_name
+            self._compiled_names = compiled_names
+
+        return {
+            _runtime_bind_identifier(bindparams[position]): compiled_name
+            for position, compiled_name in self._compiled_names.items()
+        }
+
+
+def _get_mysql_ewkb_statement_info(clauseelement, dialect):
+    """Return the ST_GeomFromEWKB constructors of a statement and its bound parameters.
+
+    The constructors are memoized per statement cache key in a LRU cache attached to the
+    dialect, so the statements executed several times are only traversed once.
+    """
+    generate_cache_key = getattr(clauseelement, "_generate_cache_key", None)
+    cache_key = generate_cache_key() if generate_cache_key is not None else None
+    if cache_key is None:
+        return _MySQLEWKBStatementInfo(_collect_mysql_ewkb_constructors(clauseelement)), None
+
+    statement_infos = getattr(dialect, "_geoalchemy2_mysql_ewkb_statement_infos", None)
+    if statement_infos is None:
+        statement_infos = LRUCache(_MYSQL_EWKB_STATEMENT_CACHE_SIZE)
+        dialect._geoalchemy2_mysql_ewkb_statement_infos = statement_infos
+
+    statement_info = statement_infos.get(cache_key.key)
+    if statement_info is None:
+        statement_info = _MySQLEWKBStatementInfo(
+            _collect_mysql_ewkb_constructors(clauseelement),
+            cache_key.bindparams,
+        )
+        if not statement_info.shareable:
+            return _MySQLEWKBStatementInfo(statement_info.constructors), None
+        statement_infos[cache_key.key] = statement_info
+    return statement_info, cache_key.bindparams
+
+
 def _get_mysql_dynamic_ewkb_bind_mappings(clauseelement, dialect):
-    source_binds = _collect_mysql_dynamic_ewkb_source_binds(clauseelement, dialect)
+    if not hasattr(clauseelement, "get_children"):
+        return ()
+
+    statement_info, bindparams = _get_mysql_ewkb_statement_info(clauseelement, dialect)
+    if not statement_info.constructors:
+        return ()
+
+    source_binds = _collect_mysql_dynamic_ewkb_source_binds(
+        statement_info.current_constructors(bindparams)
+    )
     if not source_binds:
         return ()
 
-    statement_bind_name_map = _compile_mysql_statement_bind_name_map(clauseelement, dialect)
+    statement_bind_name_map = statement_info.bind_name_map(clauseelement, dialect, bindparams)
     dynamic_bind_mappings = []
     unique_source_ordinals = {}
     for source_bind, default_srid in source_binds:
@@ -915,6 +1100,10 @@ def _expand_mysql_dynamic_ewkb_param_mapping(parameters, dynamic_bind_mappings):
 
 
 def before_execute(conn, clauseelement, multiparams, params, execution_options):
+    if "ST_GeomFromEWKB" not in functions._BUILT_EXTENDED_CONSTRUCTORS:
+        # No statement can contain an ST_GeomFromEWKB function yet
+        return clauseelement, multiparams, params
+
     dynamic_bind_mappings = _get_mysql_dynamic_ewkb_bind_mappings(
         clauseelement,
         conn.dialect,
@@ -1,14 +1,23 @@
 """This module defines specific functions for Postgresql dialect."""
 
+import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
 import sqlalchemy
 from packaging import version
 from sqlalchemy import Index
+from sqlalchemy import bindparam
 from sqlalchemy import text
 from sqlalchemy.dialects.postgresql.base import ischema_names as _postgresql_ischema_names
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.schema import DropIndex
 from sqlalchemy.sql import expression
 from sqlalchemy.sql import func
 from sqlalchemy.sql import select
+from sqlalchemy.sql.functions import FunctionElement
 from sqlalchemy.types import LargeBinary
 from sqlalchemy.types import TypeDecorator
 
@@ -16,8 +25,13 @@ from geoalchemy2 import _wkb_wkt
 from geoalchemy2 import functions
 from geoalchemy2.admin.dialects.common import _check_spatial_type
 from geoalchemy2.admin.dialects.common import _format_select_args
+from geoalchemy2.admin.dialects.common import _get_gis_cols
 from geoalchemy2.admin.dialects.common import _spatial_idx_name
+from geoalchemy2.admin.dialects.common import _spatial_index_kwargs
 from geoalchemy2.admin.dialects.common import compile_bin_literal
+from geoalchemy2.admin.dialects.common import compile_srid_arg
+from geoalchemy2.admin.dialects.common import get_spatial_ddl_batch
+from geoalchemy2.admin.dialects.common import get_wkb_constructor_srid
 from geoalchemy2.admin.dialects.common import setup_create_drop
 from geoalchemy2.admin.dialects.common import unwrap_wkb_constructor_clauses
 from geoalchemy2.elements import WKBElement
@@ -73,13 +87,11 @@ def check_management(column):
 
 def create_spatial_index(bind, table, col):
     """Create spatial index on the given column."""
-    postgresql_ops = {col.name: "gist_geometry_ops_nd"} if col.type.use_N_D_index else {}
     col_func = func.ST_ConvexHull(col) if _check_spatial_type(col.type, Raster) else col
     idx = Index(
         _spatial_idx_name(table.name, col.name),
         col_func,
-        postgresql_using="gist",
-        postgresql_ops=postgresql_ops,
+        **_spatial_index_kwargs(col.type, col.name),
         _column_flag=True,
     )
     if bind is not None:
@@ -87,6 +99,88 @@ def create_spatial_index(bind, table, col):
     return idx
 
 
+_SPATIAL_INDEXES_QUERY = """SELECT
+    t.relname,
+    ARRAY(
+        SELECT a.attname::text
+        FROM pg_attribute a
+        WHERE a.attrelid = t.oid
+        AND a.attnum = ANY(ix.indkey)
+    ),
+    pg_get_indexdef(ix.indexrelid),
+    am.amname,
+    i.reloptions
+FROM pg_class t
+JOIN pg_namespace n ON n.oid = t.relnamespace
+JOIN pg_index ix ON t.oid = ix.indrelid
+JOIN pg_class i ON i.oid = ix.indexrelid
+JOIN pg_am am ON i.relam = am.oid
+WHERE am.amname IN ('gist', 'spgist', 'brin') AND {schema_filter}"""
+
+
+_SpatialIndex = namedtuple(
+    "_SpatialIndex", ["column_names", "definition", "method", "storage_parameters"]
+)
+
+
+def _get_spatial_indexes(inspector, schema):
+    """Get the GiST, SP-GiST and BRIN indexes of all the tables of a schema.
+
+    The indexes are fetched with one query per schema and cached on the inspector, so reflecting
+    many spatial columns, e.g. with ``MetaData.reflect()`` or Alembic autogenerate, does not send
+    one query per column.
+
+    Returns:
+        A dict mapping each table name to a list of ``_SpatialIndex`` tuples.
+    """
+    info_cache = getattr(inspector, "info_cache", None)
+    cache_key = ("geoalchemy2_postgresql_spatial_indexes", schema)
+    if info_cache is not None and cache_key in info_cache:
+        return info_cache[cache_key]
+
+    if schema is None:
+        # Only consider the tables found through the search path, like the reflection does
+        query = text(_SPATIAL_INDEXES_QUERY.format(schema_filter="pg_table_is_visible(t.oid)"))
+    else:
+        query = text(_SPATIAL_INDEXES_QUERY.format(schema_filter="n.nspname = :schema")).bindparams(
+            schema=schema
+        )
+
+    spatial_indexes = {}
+    for table_name, column_names, definition, method, reloptions in inspector.bind.execute(query):
+        storage_parameters = tuple(sorted(tuple(i.split("=", 1)) for i in reloptions or []))
+        spatial_indexes.setdefault(table_name, []).append(
+            _SpatialIndex(set(column_names), definition, method, storage_parameters or None)
+        )
+
+    if info_cache is not None:
+        info_cache[cache_key] = spatial_indexes
+    return spatial_indexes
+
+
+def _get_spatial_index(inspector, table, col_name):
+    """Get the spatial index of the column, or ``None`` if it has no spatial index.
+
+    The regular expression checks for the column name in the index definition, which is required
+    for functional indexes.
+    """
+    col_name_pattern = re.compile(rf'(^|[^a-zA-Z0-9_])("?{re.escape(col_name)}"?)($|[^a-zA-Z0-9_])')
+    for spatial_index in _get_spatial_indexes(inspector, table.schema).get(table.name, []):
+        if col_name in spatial_index.column_names or col_name_pattern.search(
+            spatial_index.definition
+        ):
+            return spatial_index
+    return None
+
+
+def _get_spatial_index_opclass(spatial_index, col_name):
+    """Get the operator class given in the definition of the index, which omits the default one."""
+    match = re.search(
+        rf'\("?{re.escape(col_name)}"?\s+([a-zA-Z0-9_.]+)[,)]', spatial_index.definition
+    )
+    return match.group(1) if match is not None else None
+
+
 def reflect_geometry_column(inspector, table, column_info):
     """Reflect a column of type Geometry with Postgresql dialect."""
     if not _check_spatial_type(column_info.get("type"), (Geometry, Geography, Raster)):
@@ -100,41 +194,19 @@ def reflect_geometry_column(inspector, table, column_info):
         elif geometry_type[-1] in ["Z", "M"]:
             coord_dimension = 3
 
-    # Query to check a given column has spatial index
-    schema_part = f" AND nspname = '{table.schema}'" if table.schema is not None else ""
-
-    # Check if the column has a spatial index (the regular expression checks for the column name
-    # in the index definition, which is required for functional indexes)
-    has_index_query = """SELECT EXISTS (
-        SELECT 1
-        FROM pg_class t
-        JOIN pg_namespace n ON n.oid = t.relnamespace
-        JOIN pg_index ix ON t.oid = ix.indrelid
-        JOIN pg_class i ON i.oid = ix.indexrelid
-        JOIN pg_am am ON i.relam = am.oid
-        WHERE
-            t.relname = '{table_name}'{schema_part}
-            AND am.amname = 'gist'
-            AND (
-                EXISTS (
-                    SELECT 1
-                    FROM pg_attribute a
-                    WHERE a.attrelid = t.oid
-                    AND a.attnum = ANY(ix.indkey)
-                    AND a.attname = '{col_name}'
-                )
-                OR pg_get_indexdef(
-                    ix.indexrelid
-                ) ~ '(^|[^a-zA-Z0-9_])("?{col_name}"?)($|[^a-zA-Z0-9_])'
-            )
-    );""".format(table_name=table.name, col_name=column_info["name"], schema_part=schema_part)
-    spatial_index = inspector.bind.execute(text(has_index_query)).scalar()
+    spatial_index = _get_spatial_index(inspector, table, column_info["name"])
 
     # Set attributes
     if not _check_spatial_type(column_info["type"], Raster):
         column_info["type"].geometry_type = geometry_type
         column_info["type"].dimension = coord_dimension
-    column_info["type"].spatial_index = bool(spatial_index)
+    column_info["type"].spatial_index = spatial_index is not None
+    if spatial_index is not None:
+        column_info["type"].spatial_index_method = spatial_index.method
+        column_info["type"].spatial_index_opclass = _get_spatial_index_opclass(
+            spatial_index, column_info["name"]
+        )
+        column_info["type"].spatial_index_with = spatial_index.storage_parameters
 
     # Spatial indexes are automatically reflected with PostgreSQL dialect
     column_info["type"]._spatial_index_reflected = True
@@ -144,6 +216,14 @@ def before_create(table, bind, **kw):
     """Handle spatial indexes during the before_create event."""
     dialect, gis_cols, regular_cols = setup_create_drop(table, bind, check_management)
 
+    # Remove the deferred spatial indexes from the table metadata because they are built later by
+    # build_deferred_spatial_indexes()
+    table.info["_deferred_spatial_indexes"] = _get_deferred_spatial_indexes(
+        table, table.info["_saved_columns"], dialect
+    )
+    for idx in table.info["_deferred_spatial_indexes"]:
+        table.indexes.discard(idx)
+
     # Remove the spatial indexes from the table metadata because they should not be
     # created during the table.create() step since the associated columns do not exist
     # at this time.
@@ -165,6 +245,7 @@ def after_create(table, bind, **kw):
     """Handle spatial indexes during the after_create event."""
     # Restore original column list including managed Geometry columns
     dialect = bind.dialect
+    batch = get_spatial_ddl_batch(bind, **kw)
 
     table.columns = table.info.pop("_saved_columns")
 
@@ -177,9 +258,12 @@ def after_create(table, bind, **kw):
             if col.type.use_typmod is not None:
                 args.append(col.type.use_typmod)
 
-            stmt = select(*_format_select_args(func.AddGeometryColumn(*args)))
-            stmt = stmt.execution_options(autocommit=True)
-            bind.execute(stmt)
+            if batch is not None:
+                batch.append(func.AddGeometryColumn(*args))
+            else:
+                stmt = select(*_format_select_args(func.AddGeometryColumn(*args)))
+                stmt = stmt.execution_options(autocommit=True)
+                bind.execute(stmt)
 
         # Add spatial indices for the Geometry, Geography and Raster columns
         if (
@@ -188,30 +272,204 @@ def after_create(table, bind, **kw):
             and not [i for i in table.indexes if col in i.columns.values()]
             and check_management(col)
         ):
-            create_spatial_index(bind, table, col)
+            if batch is not None:
+                batch.append(CreateIndex(create_spatial_index(None, table, col)))
+            else:
+                create_spatial_index(bind, table, col)
 
     for idx in table.info.pop("_after_create_indexes"):
         table.indexes.add(idx)
-        idx.create(bind=bind)
+        if batch is not None:
+            batch.append(CreateIndex(idx))
+        else:
+            idx.create(bind=bind)
 
+    table.indexes.update(table.info.pop("_deferred_spatial_indexes"))
 
-def before_drop(table, bind, **kw):
-    """Handle spatial indexes during the before_drop event."""
-    dialect, gis_cols, regular_cols = setup_create_drop(table, bind, check_management)
 
-    # Drop the managed Geometry columns
+def _drop_geometry_column_functions(table, gis_cols):
+    """Get the DropGeometryColumn() calls of the managed columns of the table."""
     for col in gis_cols:
         if _check_spatial_type(col.type, Raster):
             # Raster columns are dropped with the table, no need to drop them separately
             continue
         args = [table.schema] if table.schema else []
         args.extend([table.name, col.name])
+        yield func.DropGeometryColumn(*args)
+
+
+def _get_deferred_spatial_indexes(table, columns, dialect=None):
+    """Get the spatial indexes of the columns whose ``spatial_index`` is ``"deferred"``."""
+    indexes = []
+    for col in columns:
+        if not (
+            _check_spatial_type(col.type, (Geometry, Geography, Raster), dialect)
+            and getattr(col.type, "spatial_index", False) == "deferred"
+        ):
+            continue
+        idx_name = _spatial_idx_name(table.name, col.name)
+        idx = next((i for i in table.indexes if i.name == idx_name), None)
+        indexes.append(idx if idx is not None else create_spatial_index(None, table, col))
+    return indexes
+
+
+_INDEX_VALIDITY_QUERY = """SELECT c.relname, ix.indisvalid
+FROM pg_index ix
+JOIN pg_class c ON c.oid = ix.indexrelid
+JOIN pg_namespace n ON n.oid = c.relnamespace
+WHERE c.relname IN :names AND {schema_filter}"""
+
+
+def _get_index_validity(bind, schema, names):
+    """Get the ``indisvalid`` flag of the existing indexes with the given names, by name."""
+    if schema is None:
+        query = text(_INDEX_VALIDITY_QUERY.format(schema_filter="pg_table_is_visible(c.oid)"))
+    else:
+        query = text(_INDEX_VALIDITY_QUERY.format(schema_filter="n.nspname = :schema")).bindparams(
+            schema=schema
+        )
+    query = query.bindparams(bindparam("names", expanding=True))
+    return dict(bind.execute(query, {"names": list(names)}).fetchall())
+
+
+_INDEX_DDL_PREFIX = re.compile(r"^(\s*(?:CREATE|DROP) INDEX)( CONCURRENTLY)?")
+
+
+def _compile_spatial_index_ddl(ddl, dialect, concurrently):
+    """Compile the ``CREATE INDEX`` or ``DROP INDEX`` statement of a deferred spatial index."""
+    # The option is applied to the rendered statement, as the index metadata is shared between the
+    # threads building the indexes and must not be altered
+    statement = str(ddl.compile(dialect=dialect))
+    return _INDEX_DDL_PREFIX.sub(r"\1 CONCURRENTLY" if concurrently else r"\1", statement, count=1)
+
+
+def _execute_spatial_index_statements(bind, statements, maintenance_work_mem):
+    if maintenance_work_mem is not None:
+        bind.execute(
+            text("SELECT set_config('maintenance_work_mem', :value, false)"),
+            {"value": str(maintenance_work_mem)},
+        )
+    try:
+        for stmt in statements:
+            bind.exec_driver_sql(stmt)
+    finally:
+        if maintenance_work_mem is not None:
+            bind.exec_driver_sql("RESET maintenance_work_mem")
+
+
+def _build_table_spatial_indexes(bind, table, indexes, concurrently, maintenance_work_mem):
+    """Build the deferred spatial indexes of a table which do not exist or are invalid.
+
+    A ``CREATE INDEX CONCURRENTLY`` which failed leaves an invalid index behind, which is not used
+    by the queries and would be skipped by ``IF NOT EXISTS``, so it is dropped and built again.
+    """
+    validity = _get_index_validity(bind, table.schema, [idx.name for idx in indexes])
+    statements = []
+    built = []
+    for idx in indexes:
+        valid = validity.get(idx.name)
+        if valid:
+            continue
+        if valid is not None:
+            drop_index = DropIndex(idx, if_exists=True)
+            statements.append(_compile_spatial_index_ddl(drop_index, bind.dialect, concurrently))
+        create_index = CreateIndex(idx, if_not_exists=True)
+        statements.append(_compile_spatial_index_ddl(create_index, bind.dialect, concurrently))
+        built.append(idx.name)
+
+    if statements:
+        _execute_spatial_index_statements(bind, statements, maintenance_work_mem)
+    return built
+
+
+def build_deferred_spatial_indexes(
+    bind, metadata, concurrently=True, max_workers=None, maintenance_work_mem=None
+):
+    """Build the deferred spatial indexes of the tables of the metadata.
+
+    See :func:`geoalchemy2.admin.build_deferred_spatial_indexes` for details about arguments.
+    """
+    table_indexes = []
+    for table in metadata.sorted_tables:
+        indexes = _get_deferred_spatial_indexes(table, table.columns, bind.dialect)
+        if indexes:
+            table_indexes.append((table, indexes))
+
+    def build(table_and_indexes):
+        args = (*table_and_indexes, concurrently, maintenance_work_mem)
+        if not isinstance(bind, Engine):
+            return _build_table_spatial_indexes(bind, *args)
+        elif concurrently:
+            # CREATE INDEX CONCURRENTLY can not run inside a transaction block
+            with bind.connect() as conn:
+                conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+                return _build_table_spatial_indexes(conn, *args)
+        else:
+            with bind.begin() as conn:
+                return _build_table_spatial_indexes(conn, *args)
+
+    if max_workers is not None and max_workers > 1 and isinstance(bind, Engine):
+        # The indexes of each table are built in a separate connection
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            built = list(executor.map(build, table_indexes))
+    else:
+        built = [build(i) for i in table_indexes]
+
+    return [name for table_built in built for name in table_built]
+
+
+def before_drop(table, bind, **kw):
+    """Handle spatial indexes during the before_drop event."""
+    dialect, gis_cols, regular_cols = setup_create_drop(table, bind, check_management)
+
+    if get_spatial_ddl_batch(bind, **kw) is not None:
+        # The managed columns were already dropped by before_drop_all()
+        return
 
-        stmt = select(*_format_select_args(func.DropGeometryColumn(*args)))
+    # Drop the managed Geometry columns
+    for drop_func in _drop_geometry_column_functions(table, gis_cols):
+        stmt = select(*_format_select_args(drop_func))
         stmt = stmt.execution_options(autocommit=True)
         bind.execute(stmt)
 
 
+def after_create_all(metadata, bind, **kw):
+    """Execute the spatial DDL collected during ``MetaData.create_all()`` in one script."""
+    execute_spatial_ddl(bind, get_spatial_ddl_batch(bind, **kw) or [])
+
+
+def before_drop_all(metadata, bind, **kw):
+    """Drop the managed columns of all the tables in one script before they are dropped."""
+    batch = get_spatial_ddl_batch(bind, **kw)
+    if batch is None:
+        return
+    for table in kw["tables"]:
+        gis_cols = _get_gis_cols(table, Geometry, bind.dialect, check_management)
+        batch.extend(_drop_geometry_column_functions(table, gis_cols))
+    execute_spatial_ddl(bind, batch)
+
+
+def execute_spatial_ddl(bind, statements):
+    """Execute the given functions and DDL statements as one multi-statement script.
+
+    The functions are called in ``SELECT`` statements, which are compiled with their literal
+    values, so the driver must accept several statements in one execution, like psycopg2 and
+    psycopg do. The DDL statements have no bound parameters, so they are compiled as usual.
+    """
+    if not statements:
+        return
+    script = ";\n".join(
+        str(
+            select(stmt).compile(dialect=bind.dialect, compile_kwargs={"literal_binds": True})
+            if isinstance(stmt, FunctionElement)
+            else stmt.compile(dialect=bind.dialect)
+        )
+        for stmt in statements
+    )
+    bind.exec_driver_sql(script)
+    statements.clear()
+
+
 def after_drop(table, bind, **kw):
     """Handle spatial indexes during the after_drop event."""
     # Restore original column list including managed Geometry columns
@@ -221,17 +479,17 @@ def after_drop(table, bind, **kw):
 
 
 def _compile_GeomFromWKB_Postgresql(element, compiler, *, include_srid=True, **kw):
-    # Store the SRID
     clauses = list(element.clauses)
-    if kw.get("literal_binds", False):
+    literal_binds = kw.get("literal_binds", False)
+    if literal_binds:
         clauses, _ = unwrap_wkb_constructor_clauses(clauses)
-    try:
-        srid = clauses[1].value
-    except (IndexError, TypeError, ValueError):
-        srid = element.type.srid
+
+    srid, srid_clause = get_wkb_constructor_srid(
+        element, clauses, include_srid=include_srid, literal_binds=literal_binds
+    )
 
     skip_bind_expression = False
-    if kw.get("literal_binds", False):
+    if literal_binds:
         if not include_srid and hasattr(clauses[0], "value") and clauses[0].value is not None:
             value = clauses[0].value
             embedded_srid = None
@@ -251,30 +509,40 @@ def _compile_GeomFromWKB_Postgresql(element, compiler, *, include_srid=True, **k
         suffix = ", 'hex')"
     else:
         wkb_clause = clauses[0]
-        if (
-            not include_srid
-            and _wkb_wkt.is_known_srid(srid)
-            and not _uses_ewkb_geometry_bind_processor(wkb_clause)
-        ):
+        if not include_srid and _uses_ewkb_geometry_bind_processor(wkb_clause):
+            skip_bind_expression = True
+        elif not include_srid and (srid_clause is not None or _wkb_wkt.is_known_srid(srid)):
             wkb_clause = expression.type_coerce(
                 wkb_clause,
-                _PostgreSQLEWKBBindType(column_srid=srid),
+                _PostgreSQLEWKBBindType(column_srid=srid if srid_clause is None else None),
             )
-        elif not include_srid and _uses_ewkb_geometry_bind_processor(wkb_clause):
-            skip_bind_expression = True
         prefix = ""
         suffix = ""
 
     process_kw = dict(kw)
-    if not kw.get("literal_binds", False) and skip_bind_expression:
+    if not literal_binds and skip_bind_expression:
         process_kw["skip_bind_expression"] = True
     compiled = compiler.process(wkb_clause, **process_kw)
 
-    if include_srid and srid > 0:
-        return f"{element.identifier}({prefix}{compiled}{suffix}, {srid})"
-    else:
+    if srid_clause is None:
+        if include_srid and _wkb_wkt.is_known_srid(srid):
+            return f"{element.identifier}({prefix}{compiled}{suffix}, {srid})"
         return f"{element.identifier}({prefix}{compiled}{suffix})"
 
+    if include_srid:
+        compiled_srid = compile_srid_arg(srid_clause, compiler, unknown_srid=0, **kw)
+        return f"{element.identifier}({compiled}, {compiled_srid})"
+
+    # The SRID is only known when the statement is executed, so it can not be applied by the bind
+    # processor of the EWKB value. An unknown SRID is bound as NULL, so ST_SetSRID() returns NULL
+    # and the SRID embedded in the EWKB value is kept
+    compiled_srid = compile_srid_arg(srid_clause, compiler, **kw)
+    fallback = compiler.process(wkb_clause, **process_kw)
+    return (
+        f"COALESCE(ST_SetSRID({element.identifier}({compiled}), {compiled_srid}), "
+        f"{element.identifier}({fallback}))"
+    )
+
 
 @compiles(functions.ST_GeomFromWKB, "postgresql")  # type: ignore
 def _PostgreSQL_ST_GeomFromWKB(element, compiler, **kw):
@@ -5,17 +5,24 @@ import os
 from sqlalchemy import text
 from sqlalchemy.dialects.sqlite.base import ischema_names as _sqlite_ischema_names
 from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.sql import expression
 from sqlalchemy.sql import func
 from sqlalchemy.sql import select
+from sqlalchemy.sql.functions import FunctionElement
 from sqlalchemy.types import String
 from sqlalchemy.types import TypeDecorator
 
 from geoalchemy2 import functions
+from geoalchemy2._wkb_wkt import is_known_srid
 from geoalchemy2.admin.dialects.common import _check_spatial_type
 from geoalchemy2.admin.dialects.common import _format_select_args
+from geoalchemy2.admin.dialects.common import _get_gis_cols
 from geoalchemy2.admin.dialects.common import _spatial_idx_name
 from geoalchemy2.admin.dialects.common import compile_bin_literal
+from geoalchemy2.admin.dialects.common import compile_srid_arg
+from geoalchemy2.admin.dialects.common import get_spatial_ddl_batch
+from geoalchemy2.admin.dialects.common import get_wkb_constructor_srid
 from geoalchemy2.admin.dialects.common import setup_create_drop
 from geoalchemy2.admin.dialects.common import unwrap_wkb_constructor_clauses
 from geoalchemy2.types import Geography
@@ -157,19 +164,57 @@ def load_spatialite(dbapi_conn, *args, **kwargs):
     init_spatialite(dbapi_conn, **kwargs)
 
 
-def _get_spatialite_attrs(bind, table_name, col_name):
-    attrs = bind.execute(
-        text(
+def _is_registered(bind, metadata_table):
+    """Check if the table storing the spatial column metadata exists."""
+    return bool(bind.execute(text(f"PRAGMA main.table_info({metadata_table})")).fetchall())
+
+
+def _find_spatial_column(spatial_columns, table_name, col_name):
+    """Find the attributes of a column in the result of ``get_spatial_columns``."""
+    col_name = col_name.lower()
+    for column_name, attrs in spatial_columns.get(table_name.lower(), []):
+        if column_name.lower() == col_name:
+            return attrs
+    return None
+
+
+def get_spatial_columns(bind, info_cache=None):
+    """Get the attributes of all the spatial columns registered in the SpatiaLite metadata.
+
+    The ``geometry_columns`` table is read with one query. When an ``info_cache`` is given, e.g. the
+    one of an inspector, the result is stored in it and reused by the reflection of all the columns
+    and indexes.
+
+    Returns:
+        A dict mapping each lower-cased table name to a list of ``(column_name, attributes)``
+        tuples, where the attributes are the geometry type, the coordinate dimension, the SRID and
+        the spatial index status.
+    """
+    cache_key = "geoalchemy2_spatialite_columns"
+    if info_cache is not None and cache_key in info_cache:
+        return info_cache[cache_key]
+
+    spatial_columns = {}
+    if _is_registered(bind, "geometry_columns"):
+        query = text(
             """SELECT * FROM "geometry_columns"
-            WHERE LOWER(f_table_name) = LOWER(:table_name)
-                AND LOWER(f_geometry_column) = LOWER(:column_name)
-        """
-        ).bindparams(table_name=table_name, column_name=col_name)
-    ).fetchone()
-    if attrs is None:
-        # If the column is not registered as a spatial column we ignore it
-        return None
-    return attrs[2:]
+            ORDER BY f_table_name, f_geometry_column"""
+        )
+        for row in bind.execute(query):
+            spatial_columns.setdefault(row[0].lower(), []).append((row[1], tuple(row[2:])))
+
+    if info_cache is not None:
+        info_cache[cache_key] = spatial_columns
+    return spatial_columns
+
+
+def _get_spatialite_attrs(bind, table_name, col_name, info_cache=None):
+    # If the column is not registered as a spatial column None is returned and it is ignored
+    return _find_spatial_column(get_spatial_columns(bind, info_cache), table_name, col_name)
+
+
+_SPATIAL_DDL_CHUNK_SIZE = 500
+"""The maximum number of functions called in one statement by the batched spatial DDL."""
 
 
 def get_spatialite_version(bind):
@@ -235,7 +280,9 @@ def reflect_geometry_column(inspector, table, column_info):
     # Get geometry type, SRID and spatial index from the SpatiaLite metadata
     if not isinstance(column_info.get("type"), Geometry):
         return
-    col_attributes = _get_spatialite_attrs(inspector.bind, table.name, column_info["name"])
+    col_attributes = _get_spatialite_attrs(
+        inspector.bind, table.name, column_info["name"], getattr(inspector, "info_cache", None)
+    )
     if col_attributes is not None:
         geometry_type, coord_dimension, srid, spatial_index = col_attributes
 
@@ -312,6 +359,7 @@ def before_create(table, bind, **kw):
 def after_create(table, bind, **kw):
     """Handle spatial indexes during the after_create event."""
     dialect = bind.dialect
+    batch = get_spatial_ddl_batch(bind, **kw)
 
     table.columns = table.info.pop("_saved_columns")
     for col in table.columns:
@@ -328,28 +376,41 @@ def after_create(table, bind, **kw):
                 dimension,
             ]
 
-            stmt = select(*_format_select_args(func.RecoverGeometryColumn(*args)))
-            stmt = stmt.execution_options(autocommit=True)
-            bind.execute(stmt)
+            if batch is not None:
+                batch.append(func.RecoverGeometryColumn(*args))
+            else:
+                stmt = select(*_format_select_args(func.RecoverGeometryColumn(*args)))
+                stmt = stmt.execution_options(autocommit=True)
+                bind.execute(stmt)
 
     for col in table.columns:
         # Add spatial indexes for the Geometry and Geography columns
         # TODO: Check that the Geography type makes sense here
-        if (
-            _check_spatial_type(col.type, (Geometry, Geography), dialect)
-            and col.type.spatial_index is True
-        ):
-            create_spatial_index(bind, table, col)
+        if _check_spatial_type(
+            col.type, (Geometry, Geography), dialect
+        ) and col.type.spatial_index in (True, "deferred"):
+            if batch is not None:
+                if col.computed is None:
+                    batch.append(func.CreateSpatialIndex(table.name, col.name))
+            else:
+                create_spatial_index(bind, table, col)
 
     for idx in table.info.pop("_after_create_indexes"):
         table.indexes.add(idx)
-        idx.create(bind=bind)
+        if batch is not None:
+            batch.append(CreateIndex(idx))
+        else:
+            idx.create(bind=bind)
 
 
 def before_drop(table, bind, **kw):
     """Handle spatial indexes during the before_drop event."""
     dialect, gis_cols, regular_cols = setup_create_drop(table, bind)
 
+    if get_spatial_ddl_batch(bind, **kw) is not None:
+        # The managed columns were already discarded by before_drop_all()
+        return
+
     for col in gis_cols:
         if col.computed is not None:
             # Computed columns are not managed
@@ -364,6 +425,61 @@ def before_drop(table, bind, **kw):
         bind.execute(stmt)
 
 
+def after_create_all(metadata, bind, **kw):
+    """Execute the spatial DDL collected during ``MetaData.create_all()``."""
+    execute_spatial_ddl(bind, get_spatial_ddl_batch(bind, **kw) or [])
+
+
+def before_drop_all(metadata, bind, **kw):
+    """Discard the managed columns of all the tables before they are dropped."""
+    batch = get_spatial_ddl_batch(bind, **kw)
+    if batch is None:
+        return
+
+    # The spatial index status of all the columns is read with one query
+    spatial_columns = get_spatial_columns(bind)
+    disable_funcs = []
+    discard_funcs = []
+    for table in kw["tables"]:
+        for col in _get_gis_cols(table, Geometry, bind.dialect):
+            if col.computed is not None:
+                # Computed columns are not managed
+                continue
+            attrs = _find_spatial_column(spatial_columns, table.name, col.name)
+            if attrs is not None and attrs[3]:
+                disable_funcs.append(func.DisableSpatialIndex(table.name, col.name))
+                batch.append(
+                    text(f"DROP TABLE IF EXISTS {_spatial_idx_name(table.name, col.name)};")
+                )
+            discard_funcs.append(func.DiscardGeometryColumn(table.name, col.name))
+    batch[:0] = disable_funcs + discard_funcs
+    execute_spatial_ddl(bind, batch)
+
+
+def execute_spatial_ddl(bind, statements):
+    """Execute the given functions and DDL statements with as few statements as possible.
+
+    SQLite can not execute several statements at once, so the consecutive functions are called in
+    the same ``SELECT`` statement and the other statements are executed one by one.
+    """
+    functions_chunk = []
+
+    def flush_functions():
+        for i in range(0, len(functions_chunk), _SPATIAL_DDL_CHUNK_SIZE):
+            stmt = select(*functions_chunk[i : i + _SPATIAL_DDL_CHUNK_SIZE])
+            bind.execute(stmt.execution_options(autocommit=True))
+        functions_chunk.clear()
+
+    for stmt in statements:
+        if isinstance(stmt, FunctionElement):
+            functions_chunk.append(stmt)
+        else:
+            flush_functions()
+            bind.execute(stmt)
+    flush_functions()
+    statements.clear()
+
+
 def after_drop(table, bind, **kw):
     """Handle spatial indexes during the after_drop event."""
     table.columns = table.info.pop("_saved_columns")
@@ -440,24 +556,20 @@ def _coerce_ewkb_clause_to_hex(wkb_clause, *, literal=False, column_srid=None):
 def _compile_GeomFromWKB_SQLite(
     element, compiler, *, identifier, include_srid=True, coerce_ewkb=False, **kw
 ):
-    element.identifier = identifier
-
-    # Store the SRID
     clauses = list(element.clauses)
     literal_binds = kw.get("literal_binds", False)
     if literal_binds:
         clauses, _ = unwrap_wkb_constructor_clauses(clauses)
-    try:
-        srid = clauses[1].value
-        element.type.srid = srid
-    except (IndexError, TypeError, ValueError):
-        srid = element.type.srid
+
+    srid, srid_clause = get_wkb_constructor_srid(
+        element, clauses, include_srid=include_srid, literal_binds=literal_binds
+    )
 
     if coerce_ewkb:
         wkb_clause = _coerce_ewkb_clause_to_hex(
             clauses[0],
             literal=literal_binds,
-            column_srid=srid,
+            column_srid=srid if srid_clause is None else None,
         )
         prefix = ""
         suffix = ""
@@ -472,11 +584,22 @@ def _compile_GeomFromWKB_SQLite(
 
     compiled = compiler.process(wkb_clause, **kw)
 
-    if include_srid and srid > 0:
-        return f"{identifier}({prefix}{compiled}{suffix}, {srid})"
-    else:
+    if srid_clause is None:
+        if include_srid and is_known_srid(srid):
+            return f"{identifier}({prefix}{compiled}{suffix}, {srid})"
         return f"{identifier}({prefix}{compiled}{suffix})"
 
+    if include_srid:
+        compiled_srid = compile_srid_arg(srid_clause, compiler, unknown_srid=0, **kw)
+        return f"{identifier}({compiled}, {compiled_srid})"
+
+    # The SRID is only known when the statement is executed, so it can not be applied by the bind
+    # processor of the EWKB value. An unknown SRID is bound as NULL, so SetSRID() returns NULL and
+    # the SRID embedded in the EWKB value is kept
+    compiled_srid = compile_srid_arg(srid_clause, compiler, **kw)
+    fallback = compiler.process(wkb_clause, **kw)
+    return f"COALESCE(SetSRID({identifier}({compiled}), {compiled_srid}), {identifier}({fallback}))"
+
 
 @compiles(functions.ST_GeomFromWKB, "sqlite")  # type: ignore
 def _SQLite_ST_GeomFromWKB(element, compiler, **kw):
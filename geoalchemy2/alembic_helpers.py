@@ -35,9 +35,11 @@ from sqlalchemy.util import compat as sqlalchemy_compat
 from geoalchemy2 import Geography
 from geoalchemy2 import Geometry
 from geoalchemy2 import Raster
+from geoalchemy2.admin import select_dialect
 from geoalchemy2.admin.dialects.common import _check_spatial_type
 from geoalchemy2.admin.dialects.common import _get_gis_cols
 from geoalchemy2.admin.dialects.common import _spatial_idx_name
+from geoalchemy2.admin.dialects.common import _spatial_index_kwargs
 
 writer = rewriter.Rewriter()
 """Rewriter object for Alembic."""
@@ -79,52 +81,19 @@ def _monkey_patch_get_indexes_for_sqlite():
     def spatial_behavior(self, connection, table_name, schema=None, **kw):
         indexes = self._get_indexes_normal_behavior(connection, table_name, schema=None, **kw)
 
+        # The spatial columns of all the tables are fetched once and cached with the other
+        # reflected information
         is_gpkg = connection.dialect.name == "geopackage"
-
-        try:
-            # Check that SpatiaLite was loaded into the DB
-            is_spatial_db = connection.exec_driver_sql(
-                """PRAGMA main.table_info({})""".format(
-                    "gpkg_geometry_columns" if is_gpkg else "geometry_columns"
-                )
-            ).fetchall()
-            if not is_spatial_db:
-                return indexes
-        except AttributeError:
-            return indexes
-
-        # Get spatial indexes
-        if is_gpkg:
-            spatial_index_query = text(
-                f"""SELECT A.table_name, A.column_name, IFNULL(B.has_index, 0) AS has_index
-                FROM "gpkg_geometry_columns"
-                AS A
-                LEFT JOIN (
-                    SELECT table_name, column_name, COUNT(*) AS has_index
-                    FROM gpkg_extensions
-                    WHERE LOWER(table_name) = LOWER('{table_name}')
-                        AND extension_name = 'gpkg_rtree_index'
-                ) AS B
-                ON LOWER(A.table_name) = LOWER(B.table_name)
-                WHERE LOWER(A.table_name) = LOWER('{table_name}');
-            """
-            )
-        else:
-            spatial_index_query = text(
-                f"""SELECT *
-                FROM geometry_columns
-                WHERE f_table_name = '{table_name}'
-                ORDER BY f_table_name, f_geometry_column;"""
-            )
-
-        spatial_indexes = connection.execute(spatial_index_query).fetchall()
+        spatial_columns = select_dialect("geopackage" if is_gpkg else "sqlite").get_spatial_columns(
+            connection, kw.get("info_cache")
+        )
+        spatial_indexes = spatial_columns.get(table_name.lower(), [])
 
         if spatial_indexes:
             reflected_names = {i["name"] for i in indexes}
-            for idx in spatial_indexes:
-                idx_col = idx[1]
+            for idx_col, attrs in spatial_indexes:
                 idx_name = _spatial_idx_name(table_name, idx_col)
-                if not bool(idx[-1]) or idx_name in reflected_names:
+                if not bool(attrs[-1]) or idx_name in reflected_names:
                     continue
                 indexes.append(
                     {
@@ -198,7 +167,9 @@ def _monkey_patch_get_indexes_for_mssql():
 
         indexes = self._get_indexes_normal_behavior(connection, table_name, schema=schema, **kw)
         schema_name = schema or connection.dialect.default_schema_name
-        spatial_indexes = _get_mssql_spatial_indexes(connection, table_name, schema=schema_name)
+        spatial_indexes = _get_mssql_spatial_indexes(
+            connection, table_name, schema=schema_name, info_cache=kw.get("info_cache")
+        )
 
         if spatial_indexes:
             reflected_indexes = {i["name"]: i for i in indexes}
@@ -1018,9 +989,8 @@ def create_geo_index(context, revision, op):
             col.type, (Geometry, Geography, Raster), dialect
         ):
             # Fix index properties
-            op.kw["postgresql_using"] = op.kw.get("postgresql_using", "gist")
-            postgresql_ops = {col.name: "gist_geometry_ops_nd"} if col.type.use_N_D_index else {}
-            op.kw["postgresql_ops"] = op.kw.get("postgresql_ops", postgresql_ops)
+            for key, value in _spatial_index_kwargs(col.type, col.name).items():
+                op.kw.setdefault(key, value)
 
             return CreateGeospatialIndexOp(
                 op.index_name,
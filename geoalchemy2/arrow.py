@@ -0,0 +1,281 @@
+"""This module provides utility functions to stream query results to Arrow and GeoPandas.
+
+The results of a query are converted batch by batch, so the memory stays bounded when the
+query is executed with the ``yield_per`` execution option (or when ``batch_size`` is given)::
+
+    result = conn.execution_options(yield_per=10000).execute(select(Lake.id, Lake.geom))
+    for table in to_arrow_batches(result):
+        ...
+
+The spatial columns are found from the types of the result columns, and the SRID of their
+:class:`geoalchemy2.types.Geometry` or :class:`geoalchemy2.types.Geography` type is used as the
+CRS of the converted columns. When the column types are not known, e.g. for results built
+manually, the spatial columns are detected from their values, which are the
+:class:`geoalchemy2.elements.WKBElement` or :class:`geoalchemy2.elements.WKTElement` objects
+returned by the spatial types. When the SRID of a column is not known from its type, the SRID of
+its first element which has one is used.
+
+The spatial columns are the same in all the batches, and so is their CRS once it is known, even
+in the batches where a spatial column only contains ``NULL`` values.
+
+.. note::
+
+    As GeoAlchemy 2 itself has no dependency on `PyArrow` or `GeoPandas`, applications using
+    functions of this module have to ensure that they are available.
+"""
+
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy.engine import Result
+
+try:
+    import pyarrow as pa
+
+    HAS_PYARROW = True
+    _pyarrow_exc = None
+except ImportError as exc:
+    HAS_PYARROW = False
+    _pyarrow_exc = exc
+
+try:
+    import geopandas as gpd
+
+    HAS_GEOPANDAS = True
+    _geopandas_exc = None
+except ImportError as exc:
+    HAS_GEOPANDAS = False
+    _geopandas_exc = exc
+
+from geoalchemy2 import _wkb_wkt
+from geoalchemy2.admin.dialects.common import _check_spatial_type
+from geoalchemy2.elements import WKBElement
+from geoalchemy2.elements import WKTElement
+from geoalchemy2.shape import to_shapes
+from geoalchemy2.types import Geography
+from geoalchemy2.types import Geometry
+
+GEOARROW_WKB = "geoarrow.wkb"
+""" The name of the GeoArrow extension type used for the spatial columns. """
+
+
+@contextmanager
+def check_pyarrow():
+    if not HAS_PYARROW:
+        raise ImportError(
+            "This feature needs the optional PyArrow dependency. "
+            "Please install it with 'pip install pyarrow'."
+        ) from _pyarrow_exc
+    yield
+
+
+@contextmanager
+def check_geopandas():
+    if not HAS_GEOPANDAS:
+        raise ImportError(
+            "This feature needs the optional GeoPandas dependency. "
+            "Please install it with 'pip install geopandas'."
+        ) from _geopandas_exc
+    yield
+
+
+def _crs(srid: int | None) -> str | None:
+    """Return the CRS of the given SRID."""
+    if not _wkb_wkt.is_known_srid(srid):
+        return None
+    return f"EPSG:{srid}"
+
+
+def _result_column_types(result: Result) -> list[Any] | None:
+    """Return the SQL types of the columns of the result, or ``None`` if they are not known.
+
+    The types are read from the selected columns of the executed statement, or of the statement
+    of the underlying cursor result for the ORM results.
+    """
+    for source in (result, getattr(result, "raw", None)):
+        compiled = getattr(getattr(source, "context", None), "compiled", None)
+        selected_columns = getattr(getattr(compiled, "statement", None), "selected_columns", None)
+        if selected_columns:
+            return [column.type for column in selected_columns]
+    return None
+
+
+def _spatial_columns_from_types(keys: list[str], types: list[Any]) -> dict[str, int | None]:
+    """Return the spatial columns and the SRID of their type."""
+    return {
+        key: getattr(type_, "srid", None)
+        for key, type_ in zip(keys, types, strict=True)
+        if _check_spatial_type(type_, (Geometry, Geography))
+    }
+
+
+def _spatial_columns_from_values(
+    keys: list[str], columns: list[list[Any]], srids: dict[str, int | None]
+) -> dict[str, int | None]:
+    """Detect the spatial columns and their SRID from their first non-null value.
+
+    This is only used when the types of the result columns are not known. The columns detected
+    in the previous batches, given in ``srids``, are kept.
+    """
+    for key, values in zip(keys, columns, strict=True):
+        if key in srids:
+            continue
+        value = next((value for value in values if value is not None), None)
+        if isinstance(value, (WKBElement, WKTElement)):
+            srids[key] = value.srid
+    return srids
+
+
+def _srids_from_values(
+    keys: list[str], columns: list[list[Any]], srids: dict[str, int | None]
+) -> dict[str, int | None]:
+    """Set the unknown SRIDs of the spatial columns from the first element which has one.
+
+    The SRIDs found in the previous batches, given in ``srids``, are kept.
+    """
+    for key, values in zip(keys, columns, strict=True):
+        if key not in srids or _wkb_wkt.is_known_srid(srids[key]):
+            continue
+        srids[key] = next(
+            (
+                value.srid
+                for value in values
+                if isinstance(value, (WKBElement, WKTElement))
+                and _wkb_wkt.is_known_srid(value.srid)
+            ),
+            srids[key],
+        )
+    return srids
+
+
+def _batches(
+    result: Result, batch_size: int | None
+) -> Iterator[tuple[list[str], list[list[Any]], dict[str, int | None]]]:
+    """Yield the keys, the columns and the spatial columns of each partition of the result."""
+    keys = list(result.keys())
+    types = _result_column_types(result)
+    srids: dict[str, int | None] | None = None
+    if types is not None and len(types) == len(keys):
+        srids = _spatial_columns_from_types(keys, types)
+    detected_srids: dict[str, int | None] = {}
+    for partition in result.partitions(batch_size):
+        columns = [list(column) for column in zip(*partition, strict=True)]
+        if srids is None:
+            _spatial_columns_from_values(keys, columns, detected_srids)
+        batch_srids = srids if srids is not None else detected_srids
+        _srids_from_values(keys, columns, batch_srids)
+        yield keys, columns, batch_srids
+
+
+def _iso_wkb(element: WKBElement | WKTElement | None) -> bytes | None:
+    """Return the data of the given element as WKB without the EWKB SRID."""
+    if element is None:
+        return None
+    if isinstance(element, WKTElement):
+        return _wkb_wkt.to_wkb_no_srid(element.data)
+    data = element.data
+    if isinstance(data, str):
+        data = bytes.fromhex(data)
+    if element.extended:
+        return _wkb_wkt.to_wkb_no_srid_header(data)
+    return bytes(data)
+
+
+def _geoarrow_field(name: str, srid: int | None) -> Any:
+    """Return the Arrow field of a spatial column encoded as GeoArrow WKB."""
+    extension_metadata = {}
+    crs = _crs(srid)
+    if crs is not None:
+        extension_metadata = {"crs": crs, "crs_type": "authority_code"}
+    return pa.field(
+        name,
+        pa.binary(),
+        metadata={
+            "ARROW:extension:name": GEOARROW_WKB,
+            "ARROW:extension:metadata": json.dumps(extension_metadata),
+        },
+    )
+
+
+@check_pyarrow()
+def to_arrow_batches(result: Result, batch_size: int | None = None) -> Iterator[Any]:
+    """Convert the rows of a query result to ``pyarrow.Table`` objects, batch by batch.
+
+    The spatial columns are encoded as GeoArrow WKB columns (binary columns with the
+    ``geoarrow.wkb`` extension name in their field metadata), whose CRS is set from the SRID of
+    the column type. The other columns are converted by PyArrow, and the type found in the first
+    batch with non-null values is used for the next batches.
+
+    Args:
+        result: The result of a query.
+        batch_size: The maximum number of rows in each table. If ``None``, the value given to the
+            ``yield_per`` execution option is used (see ``Result.partitions()``).
+
+    Example::
+
+        result = conn.execution_options(yield_per=10000).execute(select(Lake.id, Lake.geom))
+        for table in to_arrow_batches(result):
+            pyarrow.parquet.write_table(table, ...)
+    """
+    arrow_types: dict[str, Any] = {}
+    for keys, columns, srids in _batches(result, batch_size):
+        fields = []
+        arrays = []
+        for key, values in zip(keys, columns, strict=True):
+            if key in srids:
+                field = _geoarrow_field(key, srids[key])
+                array = pa.array([_iso_wkb(value) for value in values], type=pa.binary())
+            else:
+                array = pa.array(values, type=arrow_types.get(key))
+                if array.null_count < len(array):
+                    arrow_types.setdefault(key, array.type)
+                field = pa.field(key, array.type)
+            fields.append(field)
+            arrays.append(array)
+        yield pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+@check_geopandas()
+def to_geodataframe_batches(
+    result: Result, batch_size: int | None = None, geometry: str | None = None
+) -> Iterator[Any]:
+    """Convert the rows of a query result to ``GeoDataFrame`` objects, batch by batch.
+
+    The spatial columns are converted to ``GeoSeries`` objects, whose CRS is set from the SRID
+    of the column type, using :func:`geoalchemy2.shape.to_shapes`.
+
+    Args:
+        result: The result of a query.
+        batch_size: The maximum number of rows in each data frame. If ``None``, the value given to
+            the ``yield_per`` execution option is used (see ``Result.partitions()``).
+        geometry: The name of the active geometry column of the data frames. If ``None``, the
+            first spatial column is used.
+
+    Example::
+
+        result = conn.execution_options(yield_per=10000).execute(select(Lake.id, Lake.geom))
+        lakes = pandas.concat(to_geodataframe_batches(result))
+    """
+    for keys, columns, srids in _batches(result, batch_size):
+        data: dict[str, Any] = {}
+        active_geometry = geometry
+        for key, values in zip(keys, columns, strict=True):
+            if key in srids:
+                data[key] = gpd.GeoSeries(to_shapes(values), crs=_crs(srids[key]))
+                if active_geometry is None:
+                    active_geometry = key
+            else:
+                data[key] = values
+        yield gpd.GeoDataFrame(data, geometry=active_geometry)
+
+
+__all__: list[str] = [
+    "to_arrow_batches",
+    "to_geodataframe_batches",
+]
+
+
+def __dir__() -> list[str]:
+    return __all__
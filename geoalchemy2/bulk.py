@@ -0,0 +1,423 @@
+"""This module provides functions to load large amounts of rows efficiently.
+
+With PostgreSQL, :func:`copy_into` streams the rows with a ``COPY ... FROM STDIN`` statement
+instead of binding the values of each row of an ``INSERT`` statement::
+
+    from geoalchemy2.bulk import copy_into
+
+    with engine.begin() as conn:
+        copy_into(conn, Lake.__table__, ({"name": name, "geom": geom} for name, geom in data))
+
+With the default text format, the spatial values are sent as hexadecimal EWKB strings, which is
+the text representation of the PostGIS types, so they are not parsed by a SQL function for each
+row. With the binary format (``binary=True``), they are sent as raw EWKB payloads, which halves
+their size on the wire and avoids their hexadecimal encoding.
+"""
+
+import datetime
+import re
+import struct
+import uuid
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from contextlib import nullcontext
+from decimal import Decimal
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import types as sqltypes
+
+from geoalchemy2 import shape as _shape
+from geoalchemy2.elements import RasterElement
+from geoalchemy2.elements import WKTElement
+from geoalchemy2.exc import ArgumentError
+from geoalchemy2.types import Raster
+from geoalchemy2.types import _GISType
+from geoalchemy2.types.dialects.common import as_binary_ewkb
+
+COPY_DRIVERS = ("psycopg", "psycopg2")
+""" The PostgreSQL drivers supported by :func:`copy_into`. """
+
+_HEX_PATTERN = re.compile("[0-9a-fA-F]+")
+
+
+def as_copy_ewkb(value: Any, column_srid: int | None = None) -> bytes | None:
+    """Convert a spatial value to the EWKB payload loaded by a binary ``COPY``.
+
+    The value can be a :class:`geoalchemy2.elements.WKBElement`, a
+    :class:`geoalchemy2.elements.WKTElement`, a Shapely geometry, a WKB or EWKB buffer, a WKT or
+    EWKT string or a hexadecimal WKB or EWKB string (like the values bound to an ``INSERT``
+    statement). The SRID embedded in the value or set on the element is checked against the SRID
+    of the column, which is embedded in the result when the value has no SRID.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        if _HEX_PATTERN.fullmatch(value) is None:
+            value = WKTElement(value)
+    elif _shape.HAS_SHAPELY and isinstance(value, _shape.ShapelyGeometry):
+        # Only the geometries of Shapely 2 have an SRID
+        get_srid = getattr(_shape.shapely, "get_srid", None)
+        srid = get_srid(value) if get_srid is not None else -1
+        value = _shape.from_shape(value, srid=srid if srid > 0 else -1)
+    if isinstance(value, WKTElement):
+        value = value.as_ewkb()
+    return bytes(as_binary_ewkb(value, column_srid=column_srid))
+
+
+def as_copy_ewkb_hex(value: Any, column_srid: int | None = None) -> str | None:
+    """Convert a spatial value to the hexadecimal EWKB string loaded by a text ``COPY``.
+
+    See :func:`as_copy_ewkb` for the accepted values.
+    """
+    ewkb = as_copy_ewkb(value, column_srid=column_srid)
+    if ewkb is None:
+        return None
+    return ewkb.hex()
+
+
+def _as_copy_raster(value: Any) -> bytes | None:
+    """Convert a raster value to the WKB payload loaded by a binary ``COPY``."""
+    if value is None:
+        return None
+    if isinstance(value, RasterElement):
+        value = value.data
+    if isinstance(value, str):
+        return bytes.fromhex(value)
+    return bytes(value)
+
+
+def _spatial_encoder(spatial_type: _GISType, binary: bool = False) -> Callable[[Any], Any]:
+    """Return the function encoding the values of a spatial column for ``COPY``."""
+    if isinstance(spatial_type, Raster):
+        if binary:
+            return _as_copy_raster
+
+        def encode_raster(value):
+            if isinstance(value, RasterElement):
+                return value.desc
+            return value
+
+        return encode_raster
+
+    column_srid = spatial_type.srid
+    as_copy_value = as_copy_ewkb if binary else as_copy_ewkb_hex
+
+    def encode(value):
+        return as_copy_value(value, column_srid=column_srid)
+
+    return encode
+
+
+def _row_encoder(
+    table, columns: list[str], dialect
+) -> Callable[[Mapping[str, Any]], tuple[Any, ...]]:
+    """Return the function converting a row into the tuple of values sent by a text ``COPY``.
+
+    The values of the non-spatial columns are processed by the bind processor of their type for
+    the given dialect, like the values bound to an ``INSERT`` statement, so the enums, the JSON
+    values or the ``TypeDecorator`` types are converted as usual.
+    """
+    encoders: list[Callable[[Any], Any] | None] = []
+    for name in columns:
+        column_type = table.c[name].type
+        if isinstance(column_type, _GISType):
+            encoders.append(_spatial_encoder(column_type))
+        else:
+            encoders.append(column_type.dialect_impl(dialect).bind_processor(dialect))
+
+    def encode_row(row):
+        return tuple(
+            row.get(name) if encoder is None else encoder(row.get(name))
+            for name, encoder in zip(columns, encoders, strict=True)
+        )
+
+    return encode_row
+
+
+def _copy_statement(dialect, table, columns: list[str], binary: bool = False) -> str:
+    """Return the ``COPY ... FROM STDIN`` statement loading the given columns of a table."""
+    preparer = dialect.identifier_preparer
+    quoted_columns = ", ".join(preparer.quote(table.c[name].name) for name in columns)
+    statement = f"COPY {preparer.format_table(table)} ({quoted_columns}) FROM STDIN"
+    if binary:
+        statement += " (FORMAT BINARY)"
+    return statement
+
+
+_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _format_array_element(value: Any) -> str:
+    """Format an element of an array literal."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, (list, tuple)):
+        return _format_array(value)
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (int, float, Decimal)):
+        return str(value)
+    if isinstance(value, (datetime.date, datetime.time, datetime.datetime)):
+        value = value.isoformat()
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        value = "\\x" + bytes(value).hex()
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _format_array(values: list[Any] | tuple[Any, ...]) -> str:
+    """Format a list in the text representation of the PostgreSQL arrays."""
+    return "{" + ",".join(_format_array_element(value) for value in values) + "}"
+
+
+def _format_text_value(value: Any) -> str:
+    """Format a value in the text format of ``COPY``.
+
+    Raises:
+        ArgumentError: If the value is a mapping, whose text representation is not known.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (int, float, Decimal, uuid.UUID)):
+        return str(value)
+    if isinstance(value, (datetime.date, datetime.time, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\\\x" + bytes(value).hex()
+    if isinstance(value, (list, tuple)):
+        value = _format_array(value)
+    elif isinstance(value, Mapping):
+        raise ArgumentError(
+            f"The mapping {value!r} can not be loaded by COPY, use a column type converting it"
+        )
+    return str(value).translate(_TEXT_ESCAPES)
+
+
+def _format_text_row(values: Iterable[Any]) -> str:
+    """Format a row in the text format of ``COPY``."""
+    return "\t".join(_format_text_value(value) for value in values) + "\n"
+
+
+BINARY_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+""" The header of the binary format of ``COPY`` (signature, flags and header extension). """
+
+BINARY_COPY_TRAILER = struct.pack(">h", -1)
+""" The trailer of the binary format of ``COPY``. """
+
+_PG_EPOCH_DATE = datetime.date(2000, 1, 1)
+_PG_EPOCH = datetime.datetime(2000, 1, 1)
+_PG_EPOCH_TZ = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _encode_text(value: Any) -> bytes:
+    return str(value).encode("utf-8")
+
+
+def _encode_date(value: datetime.date) -> bytes:
+    return struct.pack(">i", (value - _PG_EPOCH_DATE).days)
+
+
+def _encode_datetime(value: datetime.datetime) -> bytes:
+    delta = value - (_PG_EPOCH if value.tzinfo is None else _PG_EPOCH_TZ)
+    return struct.pack(">q", (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds)
+
+
+def _encode_uuid(value: uuid.UUID | str) -> bytes:
+    return (value if isinstance(value, uuid.UUID) else uuid.UUID(value)).bytes
+
+
+def _binary_encoder(column) -> Callable[[Any], bytes | None]:
+    """Return the function encoding the values of a column in the binary format of ``COPY``.
+
+    Raises:
+        ArgumentError: If the binary representation of the type of the column is not known.
+    """
+    column_type = column.type
+    if isinstance(column_type, _GISType):
+        return _spatial_encoder(column_type, binary=True)
+
+    encode: Callable[[Any], bytes]
+    if isinstance(column_type, sqltypes.BigInteger):
+        encode = struct.Struct(">q").pack
+    elif isinstance(column_type, sqltypes.SmallInteger):
+        encode = struct.Struct(">h").pack
+    elif isinstance(column_type, sqltypes.Integer):
+        encode = struct.Struct(">i").pack
+    elif isinstance(column_type, sqltypes.REAL) or (
+        # PostgreSQL creates the FLOAT(p) columns with p <= 24 as REAL columns
+        isinstance(column_type, sqltypes.Float)
+        and column_type.precision is not None
+        and column_type.precision <= 24
+    ):
+        encode = struct.Struct(">f").pack
+    elif isinstance(column_type, sqltypes.Float):
+        encode = struct.Struct(">d").pack
+    elif isinstance(column_type, sqltypes.Boolean):
+        encode = struct.Struct(">?").pack
+    elif isinstance(column_type, sqltypes.DateTime):
+        encode = _encode_datetime
+    elif isinstance(column_type, sqltypes.Date):
+        encode = _encode_date
+    elif isinstance(column_type, getattr(sqltypes, "Uuid", ())):
+        encode = _encode_uuid
+    elif isinstance(column_type, sqltypes._Binary):
+        encode = bytes
+    elif isinstance(column_type, sqltypes.String) and not isinstance(column_type, sqltypes.Enum):
+        encode = _encode_text
+    else:
+        raise ArgumentError(
+            f"The type {column_type!r} of the column {column.name!r} is not supported by the "
+            "binary format of COPY, use the text format instead"
+        )
+
+    def encode_value(value):
+        if value is None:
+            return None
+        return encode(value)
+
+    return encode_value
+
+
+def _binary_row_encoder(table, columns: list[str]) -> Callable[[Mapping[str, Any]], bytes]:
+    """Return the function converting a row into a tuple of the binary format of ``COPY``."""
+    encoders = [_binary_encoder(table.c[name]) for name in columns]
+    field_count = struct.pack(">h", len(columns))
+    pack_length = struct.Struct(">i").pack
+    null = pack_length(-1)
+
+    def encode_row(row):
+        fields = [field_count]
+        for name, encoder in zip(columns, encoders, strict=True):
+            payload = encoder(row.get(name))
+            if payload is None:
+                fields.append(null)
+            else:
+                fields.append(pack_length(len(payload)))
+                fields.append(payload)
+        return b"".join(fields)
+
+    return encode_row
+
+
+class _ChunksReader:
+    """A file-like object reading the data of ``COPY`` from an iterator of chunks.
+
+    The chunks are either all strings (text format) or all bytes (binary format).
+    """
+
+    def __init__(self, chunks: Iterator[Any], empty: str | bytes) -> None:
+        self._chunks = chunks
+        self._empty: Any = empty
+        self._buffer: Any = empty
+
+    def read(self, size: int = -1) -> Any:
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        while size < 0 or length < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            chunks.append(chunk)
+            length += len(chunk)
+        data = self._empty.join(chunks)
+        if size < 0:
+            self._buffer = self._empty
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+
+def copy_into(
+    conn,
+    table,
+    rows: Iterable[Mapping[str, Any]],
+    columns: Iterable[str] | None = None,
+    binary: bool = False,
+) -> int:
+    """Load rows into a PostgreSQL table with a ``COPY ... FROM STDIN`` statement.
+
+    The rows are given as mappings, like the parameters of an ``executemany`` ``INSERT``
+    statement, and can be given by a generator so they are streamed to the database without
+    being loaded in memory.
+
+    Args:
+        conn: The connection used to load the rows. The PostgreSQL dialect must use the
+            ``psycopg`` or ``psycopg2`` driver. If no transaction is in progress, the rows are
+            loaded in a transaction which is committed once they are all loaded (or rolled back
+            if the loading fails). Otherwise, the caller is responsible for committing.
+        table: The table in which the rows are loaded.
+        rows: The rows to load. The values of the spatial columns can be given as any value
+            accepted by :func:`as_copy_ewkb`.
+        columns: The names of the loaded columns. If ``None``, the columns of the table present
+            in the first row are loaded. The missing values are loaded as ``NULL``.
+        binary: Use the binary format of ``COPY``, in which the spatial values are sent as raw
+            EWKB. The other loaded columns must then have an integer, float, boolean, string,
+            binary, date, date time or UUID type, whose binary representation is known.
+
+    Returns:
+        The number of loaded rows.
+    """
+    dialect = conn.dialect
+    if dialect.name != "postgresql" or dialect.driver not in COPY_DRIVERS:
+        raise ArgumentError(
+            "copy_into() only supports the PostgreSQL dialect with one of the following "
+            f"drivers: {', '.join(COPY_DRIVERS)} (got {dialect.name}+{dialect.driver})"
+        )
+
+    rows = iter(rows)
+    first_row = next(rows, None)
+    if first_row is None:
+        return 0
+    if columns is None:
+        keys = [column.key for column in table.columns if column.key in first_row]
+    else:
+        keys = list(columns)
+    if not keys:
+        raise ArgumentError("No column of the table to load was found in the rows")
+
+    encode_row = _binary_row_encoder(table, keys) if binary else _row_encoder(table, keys, dialect)
+    nb_rows = 0
+
+    def encoded_rows():
+        nonlocal nb_rows
+        for row in chain((first_row,), rows):
+            nb_rows += 1
+            yield encode_row(row)
+
+    statement = _copy_statement(dialect, table, keys, binary=binary)
+    with nullcontext() if conn.in_transaction() else conn.begin():
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            if dialect.driver == "psycopg":
+                with cursor.copy(statement) as copy:
+                    if binary:
+                        for chunk in chain((BINARY_COPY_HEADER,), encoded_rows()):
+                            copy.write(chunk)
+                        copy.write(BINARY_COPY_TRAILER)
+                    else:
+                        for row in encoded_rows():
+                            copy.write_row(row)
+            elif binary:
+                chunks = chain((BINARY_COPY_HEADER,), encoded_rows(), (BINARY_COPY_TRAILER,))
+                cursor.copy_expert(statement, _ChunksReader(chunks, b""))
+            else:
+                lines = (_format_text_row(row) for row in encoded_rows())
+                cursor.copy_expert(statement, _ChunksReader(lines, ""))
+        finally:
+            cursor.close()
+    return nb_rows
+
+
+__all__: list[str] = [
+    "as_copy_ewkb",
+    "as_copy_ewkb_hex",
+    "copy_into",
+]
+
+
+def __dir__() -> list[str]:
+    return __all__
@@ -3,11 +3,13 @@ from __future__ import annotations
 import binascii
 import re
 import struct
+from collections.abc import Iterable
 from typing import Any
 
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import functions
 from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.sql.visitors import InternalTraversal
 from sqlalchemy.types import to_instance
 
 from geoalchemy2 import _wkb_wkt
@@ -193,6 +195,10 @@ class DynamicWKTElement(WKTElement):
     __slots__ = ("__dict__", "__weakref__")
 
 
+def _is_mutable_buffer(data) -> bool:
+    return isinstance(data, bytearray) or (isinstance(data, memoryview) and not data.readonly)
+
+
 class WKBElement(_SpatialElement):
     """Instances of this class wrap a WKB or EWKB value.
 
@@ -211,9 +217,25 @@ class WKBElement(_SpatialElement):
         preventing the creation of a dynamic ``__dict__`` for each instance.
         If you require dynamic attributes or support for weak references, use the
         ``DynamicWKBElement`` subclass, which provides these capabilities.
+
+    Note::
+        The elements are compared and hashed using their raw data. The hexadecimal form of the
+        data returned by :attr:`desc` is computed on each access, unless :attr:`memoize_desc` is
+        set to ``True``.
     """
 
-    __slots__ = ()
+    __slots__ = ("_desc",)
+
+    _desc: tuple[str | bytes | bytearray | memoryview, str]
+
+    memoize_desc: bool = False
+    """Keep the hexadecimal form returned by :attr:`desc` in the element once it is computed.
+
+    The cached string is twice as large as the WKB data and is kept as long as the element, so
+    this is disabled by default. It can be enabled for all the elements with
+    ``WKBElement.memoize_desc = True`` or in a subclass. The cache is not used for mutable buffers
+    and is invalidated when the data is replaced.
+    """
 
     geom_from: str = "ST_GeomFromWKB"
     geom_from_extended_version: str = "ST_GeomFromEWKB"
@@ -224,20 +246,115 @@ class WKBElement(_SpatialElement):
         srid: int = -1,
         extended: bool | None = None,
     ) -> None:
-        if srid == -1 or extended is None or extended:
-            wkb_srid = None
-            if (extended is True and srid == -1) or (extended is None and len(data) >= 5):
-                try:
-                    wkb_srid = _wkb_wkt.wkb_srid(data, include_unknown=extended is None)
-                except ValueError:
-                    if extended is True:
-                        raise
-            if extended is None:
-                extended = wkb_srid is not None
-            if extended and srid == -1 and _wkb_wkt.is_known_srid(wkb_srid):
-                srid = wkb_srid  # type: ignore[assignment]
+        if extended is None or (extended is True and srid == -1):
+            srid, extended = self._read_header(data, srid, extended)
         _SpatialElement.__init__(self, data, srid, extended)
 
+    @staticmethod
+    def _read_header(
+        data: str | bytes | bytearray | memoryview,
+        srid: int,
+        extended: bool | None,
+    ) -> tuple[int, bool]:
+        """Complete the SRID and the extended flag of an element using its EWKB header."""
+        wkb_srid = None
+        if extended is True or len(data) >= 5:
+            try:
+                wkb_srid = _wkb_wkt.wkb_srid(data, include_unknown=extended is None)
+            except ValueError:
+                if extended is True:
+                    raise
+        if extended is None:
+            extended = wkb_srid is not None
+        if extended and srid == -1 and _wkb_wkt.is_known_srid(wkb_srid):
+            srid = wkb_srid  # type: ignore[assignment]
+        return srid, extended
+
+    @classmethod
+    def _from_trusted_header(
+        cls,
+        data: str | bytes | bytearray | memoryview,
+        srid: int,
+        extended: bool,
+    ) -> WKBElement:
+        """Build an element whose SRID and extended flag are already known.
+
+        This skips the EWKB header parsing done in ``__init__``. It is used by the result
+        processors of the spatial types when the column definition already determines the
+        ``srid`` and ``extended`` values, so the caller is responsible for their consistency.
+        """
+        element = cls.__new__(cls)
+        element.srid = srid
+        element.data = data
+        element.extended = extended
+        return element
+
+    @classmethod
+    def from_many(
+        cls,
+        buffers: Iterable[str | bytes | bytearray | memoryview | None],
+        srid: int = -1,
+        extended: bool | None = None,
+    ) -> list[WKBElement | None]:
+        """Build elements from many WKB or EWKB values at once.
+
+        This is equivalent to ``[WKBElement(data, srid, extended) for data in buffers]``, except
+        that ``None`` values are kept as is. The checks that do not depend on the values are only
+        done once for the whole batch and the EWKB headers are only parsed when the SRID or the
+        ``extended`` flag has to be read from the data.
+
+        Usage example::
+
+            for partition in conn.execute(query).partitions(10000):
+                elements = WKBElement.from_many([row.raw_geom for row in partition], srid=4326)
+        """
+        if cls.__init__ is not WKBElement.__init__:
+            return [None if data is None else cls(data, srid, extended) for data in buffers]
+
+        new = cls.__new__
+        elements: list[WKBElement | None] = []
+        append = elements.append
+
+        if extended is False or (extended is True and srid != -1):
+            for data in buffers:
+                if data is None:
+                    append(None)
+                    continue
+                element = new(cls)
+                element.srid = srid
+                element.data = data
+                element.extended = extended
+                append(element)
+            return elements
+
+        wkb_srid = _wkb_wkt.wkb_srid
+        is_known_srid = _wkb_wkt.is_known_srid
+        for data in buffers:
+            if data is None:
+                append(None)
+                continue
+            element_srid = srid
+            element_extended: bool | None = extended
+            if extended is True:
+                header_srid = wkb_srid(data)
+            else:
+                if len(data) < 5:
+                    header_srid = None
+                else:
+                    try:
+                        header_srid = wkb_srid(data, include_unknown=True)
+                    except ValueError:
+                        header_srid = None
+                element_extended = header_srid is not None
+            if element_extended and srid == -1 and is_known_srid(header_srid):
+                element_srid = header_srid  # type: ignore[assignment]
+            element = new(cls)
+            element.srid = element_srid
+            element.data = data
+            element.extended = element_extended
+            append(element)
+        return elements
+
     @staticmethod
     def _wkb_to_hex(data: str | bytes | bytearray | memoryview) -> str:
         """Convert WKB to hex string."""
@@ -249,7 +366,47 @@ class WKBElement(_SpatialElement):
     @property
     def desc(self) -> str:
         """This element's description string."""
-        return self._wkb_to_hex(self.data)
+        data = self.data
+        if not self.memoize_desc:
+            return self._wkb_to_hex(data)
+        try:
+            desc_data, desc = self._desc
+            if desc_data is data:
+                return desc
+        except AttributeError:
+            pass
+        desc = self._wkb_to_hex(data)
+        if not _is_mutable_buffer(data):
+            self._desc = (data, desc)
+        return desc
+
+    @staticmethod
+    def _binary_key(
+        data: str | bytes | bytearray | memoryview,
+    ) -> str | bytes | bytearray | memoryview:
+        """Return the binary form of the data, used to compare and hash the elements."""
+        if isinstance(data, str):
+            try:
+                return binascii.unhexlify(data)
+            except ValueError:
+                # Not a hexadecimal string, so it can only be equal to the same string
+                return data.lower()
+        return data
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, WKBElement):
+            return _SpatialElement.__eq__(self, other)
+        return (
+            self.extended == other.extended
+            and self.srid == other.srid
+            and self._binary_key(self.data) == self._binary_key(other.data)
+        )
+
+    def __hash__(self):
+        key = self._binary_key(self.data)
+        if _is_mutable_buffer(key):
+            key = bytes(key)
+        return hash((key, self.srid, self.extended))
 
     @staticmethod
     def _data_from_desc(desc) -> bytes:
@@ -304,6 +461,100 @@ class DynamicWKBElement(WKBElement):
     __slots__ = ("__dict__", "__weakref__")
 
 
+_SRID_SLOT: Any = vars(_SpatialElement)["srid"]
+_EXTENDED_SLOT: Any = vars(_SpatialElement)["extended"]
+
+
+class LazyWKBElement(WKBElement):
+    """This is a subclass of ``WKBElement`` that only reads the EWKB header when needed.
+
+    The SRID and the extended flag of a ``WKBElement`` are read from the EWKB header of its
+    data when they are not given to the constructor. This class defers this parsing until the
+    ``srid`` or ``extended`` attributes are accessed for the first time, which is useful when
+    the raw data of the elements is just passed on to other systems. Apart from this, the
+    elements behave exactly like ``WKBElement`` objects (they compare, hash and pickle the same
+    way). Note that an invalid EWKB header is thus only reported when these attributes are read.
+
+    Geometry values read from the database are converted to instances of this type when the
+    column is defined with ``lazy_elements=True``.
+    """
+
+    __slots__ = ("_header_pending",)
+
+    def __init__(
+        self,
+        data: str | bytes | bytearray | memoryview,
+        srid: int = -1,
+        extended: bool | None = None,
+    ) -> None:
+        _SRID_SLOT.__set__(self, srid)
+        _EXTENDED_SLOT.__set__(self, extended)
+        self.data = data
+        self._header_pending = extended is None or (extended is True and srid == -1)
+
+    @classmethod
+    def _from_trusted_header(
+        cls,
+        data: str | bytes | bytearray | memoryview,
+        srid: int,
+        extended: bool,
+    ) -> LazyWKBElement:
+        return cls._deferred(data, srid, extended)
+
+    @classmethod
+    def _deferred(
+        cls,
+        data: str | bytes | bytearray | memoryview,
+        srid: int,
+        extended: bool | None,
+    ) -> LazyWKBElement:
+        """Build an element without calling ``__init__``, the header being parsed on access."""
+        element = cls.__new__(cls)
+        _SRID_SLOT.__set__(element, srid)
+        _EXTENDED_SLOT.__set__(element, extended)
+        element.data = data
+        element._header_pending = extended is None or (extended is True and srid == -1)
+        return element
+
+    def _parse_header(self) -> None:
+        srid, extended = self._read_header(
+            self.data, _SRID_SLOT.__get__(self), _EXTENDED_SLOT.__get__(self)
+        )
+        _SRID_SLOT.__set__(self, srid)
+        _EXTENDED_SLOT.__set__(self, extended)
+        self._header_pending = False
+
+    @property  # type: ignore[override]
+    def srid(self) -> int:
+        """The SRID of this element, read from the EWKB header on first access."""
+        if self._header_pending:
+            self._parse_header()
+        return _SRID_SLOT.__get__(self)
+
+    @srid.setter
+    def srid(self, value: int) -> None:
+        if self._header_pending:
+            self._parse_header()
+        _SRID_SLOT.__set__(self, value)
+
+    @property  # type: ignore[override]
+    def extended(self) -> bool | None:
+        """The extended flag of this element, read from the EWKB header on first access."""
+        if self._header_pending:
+            self._parse_header()
+        return _EXTENDED_SLOT.__get__(self)
+
+    @extended.setter
+    def extended(self, value: bool | None) -> None:
+        if self._header_pending:
+            self._parse_header()
+        _EXTENDED_SLOT.__set__(self, value)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._header_pending = False
+        super().__setstate__(state)
+
+
 class RasterElement(_SpatialElement):
     """Instances of this class wrap a ``raster`` value.
 
@@ -360,8 +611,11 @@ class CompositeElement(FunctionElement):
 
     __slots__ = ("name", "type")
 
-    inherit_cache: bool = False
-    """The cache is disabled for this class."""
+    _traverse_internals = FunctionElement._traverse_internals + [
+        ("name", InternalTraversal.dp_string),
+        ("type", InternalTraversal.dp_type),
+    ]
+    """The field name and its type are part of the cache key of this element."""
 
     def __init__(self, base, field, type_) -> None:
         self.name = field
@@ -384,6 +638,7 @@ __all__: list[str] = [
     "DynamicRasterElement",
     "DynamicWKBElement",
     "DynamicWKTElement",
+    "LazyWKBElement",
 ]
 
 
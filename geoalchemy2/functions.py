@@ -70,17 +70,22 @@ Reference
 """
 
 import re
+import threading
 
 from sqlalchemy import inspect
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import annotation
 from sqlalchemy.sql import functions
+from sqlalchemy.sql.elements import BindParameter
 from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.selectable import FromClause
+from sqlalchemy.sql.visitors import InternalTraversal
 
+from geoalchemy2 import _wkb_wkt
 from geoalchemy2 import elements
 from geoalchemy2._functions import _FUNCTIONS
 from geoalchemy2._functions_helpers import _get_docstring
+from geoalchemy2.types import Geometry
 
 _GeoFunctionBase: type[functions.GenericFunction]
 _GeoFunctionParent: type[functions.GenericFunction]
@@ -117,23 +122,55 @@ except ImportError:
 
         @classmethod
         def _register_geo_function(cls, clsname, clsdict) -> None:
-            # Check _register attribute status
+            # Check _register attribute status, which is reset for the child classes by
+            # sqlalchemy.sql.functions.GenericFunction._register_generic_function()
             cls._register = getattr(cls, "_register", True)
 
             # Register the function if required
             if cls._register:
                 elements.function_registry.add(clsname.lower())
-            else:
-                # Set _register to True to register child classes by default
-                cls._register = True
 
     _GeoFunctionBase = GeoGenericFunction
     _GeoFunctionParent = GeoGenericFunction
 
 
+_EWKB_CONSTRUCTORS = frozenset(["ST_GeomFromEWKB"])
+"""The functions building a geometry from an EWKB value and an optional SRID argument."""
+
+_EXTENDED_CONSTRUCTORS = frozenset(["ST_GeomFromEWKB", "ST_GeomFromEWKT"])
+"""The functions building a geometry from an EWKB or EWKT value."""
+
+_BUILT_EXTENDED_CONSTRUCTORS: set[str] = set()
+"""The names of the functions of ``_EXTENDED_CONSTRUCTORS`` which were built at least once.
+
+The ``before_execute`` listeners of the dialects only rewrite the statements containing these
+functions, so they can return at once while none of them was ever built.
+"""
+
+_LOADED_DIALECTS: set[str] = set()
+"""The names of the dialects whose admin module was selected by ``_compile_function``."""
+
+
+def _compile_function(element, compiler, **kw):
+    """Load the admin module of the dialect before the first function is compiled with it.
+
+    The dialect-specific compilation rules of the functions are registered by these modules, which
+    are imported on first use. This rule is the fallback of all the functions, so it is reached when
+    a statement is compiled with a dialect whose module is not loaded yet, e.g. without any engine.
+    """
+    dialect_name = compiler.dialect.name
+    if dialect_name not in _LOADED_DIALECTS:
+        from geoalchemy2.admin import select_dialect
+
+        select_dialect(dialect_name)
+        _LOADED_DIALECTS.add(dialect_name)
+        return element._compiler_dispatch(compiler, **kw)
+    return compiler.visit_function(element, **kw)
+
+
 class TableRowElement(ColumnElement):
-    inherit_cache: bool = False
-    """The cache is disabled for this class."""
+    _traverse_internals = [("selectable", InternalTraversal.dp_clauseelement)]
+    """The selectable is part of the cache key of this element."""
 
     def __init__(self, selectable: FromClause) -> None:
         self.selectable = selectable
@@ -256,9 +293,31 @@ class GenericFunction(_GeoFunctionBase):  # type: ignore
                     func_name = elem.geom_from
                     func_args = [elem.data, elem.srid]
                 args_list[idx] = getattr(functions.func, func_name)(*func_args)
+        if self.name in _EXTENDED_CONSTRUCTORS:
+            _BUILT_EXTENDED_CONSTRUCTORS.add(self.name)
+        if self.name in _EWKB_CONSTRUCTORS and len(args_list) == 2 and "type_" not in kwargs:
+            srid = _get_srid_value(args_list[1])
+            if _wkb_wkt.is_known_srid(srid):
+                # The SRID is applied by the bind processor of the EWKB value, so it is stored in
+                # the return type, which is part of the cache key of the statement
+                kwargs["type_"] = Geometry(srid=srid)
         _GeoFunctionParent.__init__(self, *args_list, **kwargs)
 
 
+def _get_srid_value(srid):
+    """Get the value of an SRID argument, or ``None`` if it is only known at execution time."""
+    if isinstance(srid, BindParameter):
+        return srid.value if srid.callable is None else None
+    if isinstance(srid, int) and not isinstance(srid, bool):
+        return srid
+    return None
+
+
+# The fallback rule is registered on the concrete base classes of the spatial functions: with
+# SQLAlchemy < 2, the class built by with_metaclass() is not part of their MRO.
+for _function_base in (ST_AsGeoJSON, GenericFunction):
+    compiles(_function_base)(_compile_function)
+
 __all__ = [
     "GenericFunction",
     "ST_AsGeoJSON",
@@ -266,24 +325,85 @@ __all__ = [
 ]
 
 
-def _create_dynamic_functions() -> None:
-    # Iterate through _FUNCTIONS and create GenericFunction classes dynamically
-    for name, type_, doc in _FUNCTIONS:
+_LAZY_FUNCTIONS: dict[str, tuple] = {}
+"""The definitions of the spatial functions whose class is not created yet, by lower-case name."""
+
+_LAZY_FUNCTIONS_LOCK = threading.Lock()
+
+
+def _create_function(identifier: str) -> type[GenericFunction] | None:
+    """Create the class of a spatial function.
+
+    The class is not registered in the SQLAlchemy registry, where the function is already
+    associated with a :class:`_LazyFunction` (or with a function registered by the user later
+    with the same name, which must keep precedence).
+    """
+    with _LAZY_FUNCTIONS_LOCK:
+        definition = _LAZY_FUNCTIONS.pop(identifier, None)
+        if definition is None:
+            # The class was created by another thread in the meantime
+            return globals().get(_FUNCTION_NAMES.get(identifier, ""))
+
+        name, type_, doc = definition
         attributes = {
             "name": name,
             "inherit_cache": True,
+            "_register": False,
             "__doc__": _get_docstring(name, doc, type_),
         }
 
         if type_ is not None:
             attributes["type"] = type_
 
-        globals()[name] = type(name, (GenericFunction,), attributes)
+        cls = type(name, (GenericFunction,), attributes)
+        globals()[name] = cls
+        return cls
+
+
+class _LazyFunction:
+    """The callable registered in SQLAlchemy for a spatial function whose class is created on use.
+
+    This is how ``func.ST_Xxx`` resolves to the spatial functions: the class is got through the
+    module-level ``__getattr__`` the first time the function is called.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __call__(self, *args, **kwargs) -> GenericFunction:
+        cls = globals().get(self.name)
+        if cls is None:
+            cls = __getattr__(self.name)
+        return cls(*args, **kwargs)
+
+
+_FUNCTION_NAMES: dict[str, str] = {}
+
+
+def _create_dynamic_functions() -> None:
+    # Declare the functions of _FUNCTIONS, whose GenericFunction classes are created on first use
+    for name, type_, doc in _FUNCTIONS:
+        identifier = name.lower()
+        _LAZY_FUNCTIONS[identifier] = (name, type_, doc)
+        _FUNCTION_NAMES[identifier] = name
+        elements.function_registry.add(identifier)
+        functions.register_function(identifier, _LazyFunction(name))  # type: ignore
         __all__.append(name)
 
 
 _create_dynamic_functions()
 
 
+def __getattr__(name: str) -> type[GenericFunction]:
+    identifier = name.lower()
+    if _FUNCTION_NAMES.get(identifier) == name:
+        cls = _create_function(identifier)
+        if cls is not None:
+            return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def __dir__() -> list[str]:
     return __all__
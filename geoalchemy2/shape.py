@@ -6,8 +6,10 @@
     functions of this module have to ensure that `Shapely` is available.
 """
 
+from collections.abc import Iterable
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
+from typing import Any
 
 try:
     import shapely.wkb
@@ -40,6 +42,14 @@ def check_shapely():
     yield
 
 
+def _check_vectorized_shapely():
+    # NumPy is a dependency of Shapely 2 only, so it is imported by the functions which need it
+    if not hasattr(shapely, "from_wkb"):
+        raise ImportError(
+            "This feature needs Shapely>=2. Please upgrade it with 'pip install -U shapely'."
+        )
+
+
 @check_shapely()
 def to_shape(element: WKBElement | WKTElement) -> ShapelyGeometry:
     """Convert a GeoAlchemy 2 WKB or WKT element to a Shapely geometry.
@@ -91,9 +101,98 @@ def from_shape(shape: ShapelyGeometry, srid: int = -1, extended: bool | None = F
     )
 
 
+@check_shapely()
+def to_shapes(elements: Iterable[WKBElement | WKTElement | None]) -> Any:
+    """Convert many GeoAlchemy 2 WKB or WKT elements to Shapely geometries at once.
+
+    This is equivalent to calling :func:`to_shape` on each element, except that ``None`` values
+    are kept as is, but the data of all the elements is parsed in one call to the vectorized
+    functions of Shapely 2.
+
+    Args:
+        elements: The :class:`geoalchemy2.elements.WKBElement` or
+            :class:`geoalchemy2.elements.WKTElement` objects to convert into ``Shapely`` objects.
+
+    Returns:
+        A NumPy array of ``Shapely`` geometries (with ``object`` dtype).
+
+    Example::
+
+        lakes = session.scalars(select(Lake.geom)).all()
+        polygons = to_shapes(lakes)
+    """
+    _check_vectorized_shapely()
+    import numpy as np
+
+    wkb_data: list[Any] = []
+    wkt_indices = []
+    wkt_data = []
+    for i, element in enumerate(elements):
+        if isinstance(element, WKBElement):
+            data = element.data
+            wkb_data.append(data if isinstance(data, (bytes, str)) else bytes(data))
+            continue
+        wkb_data.append(None)
+        if isinstance(element, WKTElement):
+            wkt_indices.append(i)
+            wkt_data.append(element.data.split(";", 1)[1] if element.extended else element.data)
+        elif element is not None:
+            raise TypeError("Only WKBElement and WKTElement objects are supported")
+
+    geoms = np.empty(len(wkb_data), dtype=object)
+    geoms[:] = wkb_data
+    geoms = shapely.from_wkb(geoms)
+    if wkt_indices:
+        wkts = np.empty(len(wkt_data), dtype=object)
+        wkts[:] = wkt_data
+        geoms[wkt_indices] = shapely.from_wkt(wkts)
+    return geoms
+
+
+@check_shapely()
+def from_shapes(
+    shapes: Iterable[ShapelyGeometry | None],
+    srid: int = -1,
+    extended: bool | None = False,
+) -> list[WKBElement | None]:
+    """Convert many Shapely geometries to :class:`geoalchemy2.elements.WKBElement` objects at once.
+
+    This is equivalent to calling :func:`from_shape` on each geometry, except that ``None``
+    values are kept as is and that the data of the elements are ``bytes`` objects, but all the
+    geometries are serialized in one call to the vectorized functions of Shapely 2.
+
+    Args:
+        shapes: The shapes to convert, e.g. a NumPy array of ``Shapely`` geometries.
+        srid: An integer representing the spatial reference system. E.g. ``4326``.
+            Default value is ``-1``, which means no/unknown reference system.
+        extended: A boolean to switch between WKB and EWKB.
+            Default value is False.
+
+    Example::
+
+        points = shapely.points(np.random.random((1000, 2)))
+        wkb_elements = from_shapes(points, srid=4326)
+    """
+    _check_vectorized_shapely()
+    import numpy as np
+
+    if isinstance(shapes, np.ndarray):
+        geoms = shapes
+    else:
+        shapes = list(shapes)
+        geoms = np.empty(len(shapes), dtype=object)
+        geoms[:] = shapes
+    if extended:
+        geoms = shapely.set_srid(geoms, srid)
+    wkbs = shapely.to_wkb(geoms, include_srid=bool(extended))
+    return WKBElement.from_many(wkbs.tolist(), srid=srid, extended=extended)
+
+
 __all__: list[str] = [
     "from_shape",
+    "from_shapes",
     "to_shape",
+    "to_shapes",
 ]
 
 
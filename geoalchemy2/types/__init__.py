@@ -8,6 +8,7 @@ columns/properties in models.
 import re
 import warnings
 from typing import Any
+from typing import Literal
 
 from sqlalchemy import Computed
 from sqlalchemy.dialects import postgresql
@@ -28,24 +29,28 @@ except ImportError:
 from geoalchemy2.comparator import BaseComparator
 from geoalchemy2.comparator import Comparator
 from geoalchemy2.elements import CompositeElement
+from geoalchemy2.elements import LazyWKBElement
 from geoalchemy2.elements import RasterElement
 from geoalchemy2.elements import WKBElement
 from geoalchemy2.exc import ArgumentError
 from geoalchemy2.types import dialects
 from geoalchemy2.types.dialects.mssql import _split_mssql_st_point_args
 
+_NO_EXTENDED_RESULT_DIALECTS = frozenset(("mysql", "mariadb", "mssql"))
+"""Dialects for which the ``extended`` flag of the returned elements is read from the data."""
+
+SPATIAL_INDEX_METHODS = ("gist", "spgist", "brin")
+"""The PostgreSQL access methods which can be used for the spatial indexes."""
+
 
 def select_dialect(dialect_name):
-    """Select the dialect from its name."""
-    known_dialects = {
-        "geopackage": dialects.geopackage,
-        "mysql": dialects.mysql,
-        "mariadb": dialects.mariadb,
-        "mssql": dialects.mssql,
-        "postgresql": dialects.postgresql,
-        "sqlite": dialects.sqlite,
-    }
-    return known_dialects.get(dialect_name, dialects.common)
+    """Select the dialect from its name.
+
+    The dialect module is imported on first use.
+    """
+    if dialect_name in dialects.DIALECT_MODULES:
+        return getattr(dialects, dialect_name)
+    return dialects.common
 
 
 class _GISType(UserDefinedType):
@@ -87,12 +92,28 @@ class _GISType(UserDefinedType):
 
         srid: The SRID for this column. E.g. 4326. Default is ``-1``.
         dimension: The dimension of the geometry. Default is ``2``.
-        spatial_index: Indicate if a spatial index should be created. Default is ``True``.
+        spatial_index: Indicate if a spatial index should be created. Default is ``True``. With
+            PostgreSQL, ``"deferred"`` can be used to not create the index with the table, so the
+            data can be loaded before building it with
+            :func:`geoalchemy2.admin.build_deferred_spatial_indexes`. The other dialects create
+            deferred indexes with the table.
         use_N_D_index: Use the N-D index instead of the standard 2-D index.
         use_typmod: By default PostgreSQL type modifiers are used to create the geometry
             column. To use check constraints instead set ``use_typmod`` to
             ``False``. By default this option is not included in the call to
             ``AddGeometryColumn``. Note that this option is only available for PostGIS 2.x.
+        lazy_elements: If ``True``, the values read from the database are converted to
+            :class:`geoalchemy2.elements.LazyWKBElement` objects, which only parse the EWKB
+            header when their ``srid`` or ``extended`` attributes are accessed. Default is
+            ``False``.
+        spatial_index_method: The PostgreSQL access method of the spatial index: ``"gist"``,
+            ``"spgist"`` or ``"brin"``. Default is ``"gist"``.
+        spatial_index_opclass: The PostgreSQL operator class of the spatial index, e.g.
+            ``"brin_geometry_inclusion_ops_2d"``. By default, the operator class of the access
+            method is used, or its N-D version if ``use_N_D_index`` is ``True``.
+        spatial_index_with: The storage parameters of the PostgreSQL spatial index, e.g.
+            ``{"pages_per_range": 32}`` for a BRIN index. They are stored as a tuple of
+            ``(name, value)`` pairs.
     """
 
     name: str | None = None
@@ -111,25 +132,33 @@ class _GISType(UserDefinedType):
     """ This is the way by which spatial operators are defined for
         geometry/geography columns. """
 
-    cache_ok = False
-    """ Disable cache for this type. """
+    cache_ok = True
+    """ Enable cache for this type, whose state is given by its constructor arguments. """
 
     def __init__(
         self,
         geometry_type: str | None = "GEOMETRY",
         srid: int = -1,
         dimension: int | None = None,
-        spatial_index: bool = True,
+        spatial_index: bool | Literal["deferred"] = True,
         use_N_D_index: bool = False,
         use_typmod: bool | None = None,
         from_text: str | None = None,
         name: str | None = None,
         nullable: bool = True,
+        lazy_elements: bool = False,
+        spatial_index_method: Literal["gist", "spgist", "brin"] = "gist",
+        spatial_index_opclass: str | None = None,
+        spatial_index_with: dict[str, Any] | tuple[tuple[str, Any], ...] | None = None,
         _spatial_index_reflected=None,
     ) -> None:
         geometry_type, srid, dimension = self.check_ctor_args(
             geometry_type, srid, dimension, use_typmod, nullable
         )
+        if spatial_index_method not in SPATIAL_INDEX_METHODS:
+            raise ArgumentError(
+                f"spatial_index_method must be one of {', '.join(SPATIAL_INDEX_METHODS)}"
+            )
         self.geometry_type = geometry_type
         self.srid = srid
         if name is not None:
@@ -142,6 +171,15 @@ class _GISType(UserDefinedType):
         self.use_typmod = use_typmod
         self.extended: bool | None = self.as_binary == "ST_AsEWKB"
         self.nullable = nullable
+        self.lazy_elements = lazy_elements
+        self.spatial_index_method = spatial_index_method
+        self.spatial_index_opclass = spatial_index_opclass
+        # The storage parameters are stored as a tuple so the type can be used in cache keys
+        self.spatial_index_with = (
+            tuple(sorted(dict(spatial_index_with).items()))
+            if spatial_index_with is not None
+            else None
+        )
         self._spatial_index_reflected = _spatial_index_reflected
 
     def get_col_spec(self):
@@ -157,34 +195,104 @@ class _GISType(UserDefinedType):
         else:
             return getattr(func, self.as_binary)(col, type_=self)
 
+    def _result_element_type(self):
+        """Return the class of the elements built from the values read from the database."""
+        if self.lazy_elements and self.ElementType is WKBElement:
+            return LazyWKBElement
+        return self.ElementType
+
+    def _result_element_args(self, dialect):
+        """Return the ``srid`` and ``extended`` arguments used to build the result elements."""
+        extended = None if dialect.name in _NO_EXTENDED_RESULT_DIALECTS else self.extended
+        return (self.srid if self.srid > 0 else -1), extended
+
     def result_processor(self, dialect, coltype):
-        """Specific result_processor that automatically process spatial elements."""
+        """Specific result_processor that automatically process spatial elements.
+
+        The processor is specialized once for the current type and dialect: the SRID and the
+        ``extended`` flag given to the elements are computed here instead of for each row. When
+        they are enough to describe the returned values, the EWKB header is not parsed at all.
+        """
+        element_type = self._result_element_type()
+        srid, extended = self._result_element_args(dialect)
+
+        if (
+            isinstance(element_type, type)
+            and issubclass(element_type, WKBElement)
+            and element_type.__init__ is WKBElement.__init__
+            and (extended is False or (extended is True and srid > 0))
+        ):
+            from_trusted_header = element_type._from_trusted_header
+
+            def process(value):
+                if value is not None:
+                    return from_trusted_header(value, srid, extended)
+
+            return process
+
+        if (
+            isinstance(element_type, type)
+            and issubclass(element_type, LazyWKBElement)
+            and element_type.__init__ is LazyWKBElement.__init__
+        ):
+            deferred = element_type._deferred
+
+            def process(value):
+                if value is not None:
+                    return deferred(value, srid, extended)
+
+            return process
+
+        kwargs = {}
+        if srid > 0:
+            kwargs["srid"] = srid
+        if extended is not None:
+            kwargs["extended"] = extended
 
         def process(value):
             if value is not None:
-                kwargs = {}
-                if self.srid > 0:
-                    kwargs["srid"] = self.srid
-                if self.extended is not None and dialect.name not in ["mysql", "mariadb", "mssql"]:
-                    kwargs["extended"] = self.extended
-                return self.ElementType(value, **kwargs)
+                return element_type(value, **kwargs)
 
         return process
 
+    def batch_result_processor(self, dialect):
+        """Return a function that converts a whole batch of raw values into spatial elements.
+
+        The returned function takes a sequence of values as returned by the database (e.g. the
+        spatial column of a chunk given by ``Result.partitions()`` on a query where this column is
+        not processed, like ``type_coerce(table.c.geom, LargeBinary)``) and returns the list of
+        the corresponding elements, which are the same as the ones built by the
+        ``result_processor`` of this type. For :class:`geoalchemy2.elements.WKBElement` results,
+        the whole batch is converted in one call to
+        :meth:`geoalchemy2.elements.WKBElement.from_many`.
+        """
+        element_type = self._result_element_type()
+        if isinstance(element_type, type) and issubclass(element_type, WKBElement):
+            srid, extended = self._result_element_args(dialect)
+
+            def process_many(values):
+                return element_type.from_many(values, srid=srid, extended=extended)
+
+            return process_many
+
+        process = self.result_processor(dialect, None)
+
+        def process_many(values):
+            return [process(value) for value in values]
+
+        return process_many
+
     def bind_expression(self, bindvalue):
         """Specific bind_expression that automatically adds a conversion function."""
         return getattr(func, self.from_text)(bindvalue, type_=self)
 
     def bind_processor(self, dialect):
-        """Specific bind_processor that automatically process spatial elements."""
+        """Specific bind_processor that automatically process spatial elements.
 
-        def process(bindvalue):
-            dialect_module = select_dialect(dialect.name)
-            if dialect.name == "mssql":
-                return dialect_module.bind_processor_process(self, bindvalue, dialect)
-            return dialect_module.bind_processor_process(self, bindvalue)
-
-        return process
+        The processor is built by the module of the current dialect, which resolves the
+        conversions required by the ``from_text`` constructor once instead of for each value.
+        """
+        return select_dialect(dialect.name).bind_processor_factory(self, dialect)
 
     @staticmethod
     def check_ctor_args(geometry_type, srid, dimension, use_typmod, nullable):
@@ -362,7 +470,8 @@ class Raster(_GISType):
     :class:`geoalchemy2.elements.RasterElement` objects.
 
     Args:
-        spatial_index: Indicate if a spatial index should be created. Default is ``True``.
+        spatial_index: Indicate if a spatial index should be created. Default is ``True``. See
+            :class:`geoalchemy2.types._GISType` for the ``"deferred"`` value.
     """
 
     comparator_factory = BaseComparator
@@ -420,6 +529,9 @@ class Raster(_GISType):
 class _DummyGeometry(Geometry):
     """A dummy type only used with SQLite."""
 
+    cache_ok = True
+    """ Enable cache for this type. """
+
     def get_col_spec(self):
         return self.geometry_type or "GEOMETRY"
 
@@ -488,6 +600,7 @@ __all__ = [
     "Geometry",
     "GeometryDump",
     "Raster",
+    "SPATIAL_INDEX_METHODS",
     "SummaryStats",
     "dialects",
     "select_dialect",
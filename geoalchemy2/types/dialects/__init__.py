@@ -1,9 +1,18 @@
-"""This module defines some dialect-specific functions used for Column types."""
+"""This module defines some dialect-specific functions used for Column types.
+
+The dialect modules are only imported when they are first used, see
+:func:`geoalchemy2.types.select_dialect`.
+"""
+
+import importlib
 
 from geoalchemy2.types.dialects import common  # noqa
-from geoalchemy2.types.dialects import geopackage  # noqa
-from geoalchemy2.types.dialects import mariadb  # noqa
-from geoalchemy2.types.dialects import mssql  # noqa
-from geoalchemy2.types.dialects import mysql  # noqa
-from geoalchemy2.types.dialects import postgresql  # noqa
-from geoalchemy2.types.dialects import sqlite  # noqa
+
+DIALECT_MODULES = ("geopackage", "mariadb", "mssql", "mysql", "postgresql", "sqlite")
+"""The names of the dialects with a specific module."""
+
+
+def __getattr__(name):
+    if name in DIALECT_MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,11 @@ from geoalchemy2._wkb_wkt import is_known_srid
 from geoalchemy2.elements import WKBElement
 from geoalchemy2.exc import ArgumentError
 
+BUFFER_DRIVERS = frozenset(
+    ("aiosqlite", "asyncpg", "psycopg", "psycopg2", "psycopg2cffi", "pysqlite")
+)
+"""DBAPI drivers that accept any buffer (``bytearray`` or ``memoryview``) as a binary parameter."""
+
 
 def is_wkb_constructor(spatial_type):
     return "wkb" in (getattr(spatial_type, "from_text", "") or "").lower()
@@ -14,13 +19,15 @@ def is_ewkb_constructor(spatial_type):
     return "ewkb" in (getattr(spatial_type, "from_text", "") or "").lower()
 
 
+def accepts_buffers(dialect):
+    """Check if the DBAPI driver of the given dialect can bind buffers without copying them."""
+    return getattr(dialect, "driver", None) in BUFFER_DRIVERS
+
+
 def _validate_wkb_bindvalue_srid(bindvalue, column_srid):
     if not is_known_srid(column_srid):
         return
 
-    if isinstance(bindvalue, bytearray):
-        bindvalue = bytes(bindvalue)
-
     srids = []
     if isinstance(bindvalue, WKBElement):
         if is_known_srid(bindvalue.srid):
@@ -36,26 +43,36 @@ def _validate_wkb_bindvalue_srid(bindvalue, column_srid):
         validate_wkb_srid(column_srid, srid)
 
 
-def as_binary_wkb(bindvalue, *, strip_srid=False, column_srid=None):
+def as_binary_wkb(bindvalue, *, strip_srid=False, column_srid=None, keep_buffers=False):
+    """Return the given WKB value as a binary parameter.
+
+    The buffers (``bytearray`` or ``memoryview`` objects) are copied into ``bytes`` objects,
+    unless ``keep_buffers`` is ``True``, in which case they are returned unchanged. This should
+    only be used with the DBAPI drivers listed in ``BUFFER_DRIVERS``.
+    """
     if bindvalue is None:
         return None
     if strip_srid:
         _validate_wkb_bindvalue_srid(bindvalue, column_srid)
         if isinstance(bindvalue, WKBElement):
             bindvalue = bindvalue.data
-        if isinstance(bindvalue, bytearray):
-            bindvalue = bytes(bindvalue)
         return _wkb_wkt.to_wkb_no_srid(bindvalue)
     elif isinstance(bindvalue, WKBElement):
         bindvalue = bindvalue.data
-    if isinstance(bindvalue, memoryview):
-        return bindvalue.tobytes()
     if isinstance(bindvalue, str):
         return WKBElement._data_from_desc(bindvalue)
+    if keep_buffers or isinstance(bindvalue, bytes):
+        return bindvalue
+    if isinstance(bindvalue, memoryview):
+        return bindvalue.tobytes()
     return bytes(bindvalue)
 
 
-def as_binary_ewkb(bindvalue, *, column_srid=None):
+def as_binary_ewkb(bindvalue, *, column_srid=None, keep_buffers=False):
+    """Return the given WKB value as a binary EWKB parameter.
+
+    See :func:`as_binary_wkb` for the ``keep_buffers`` argument.
+    """
     if bindvalue is None:
         return None
 
@@ -64,8 +81,6 @@ def as_binary_ewkb(bindvalue, *, column_srid=None):
         if is_known_srid(bindvalue.srid):
             element_srid = bindvalue.srid
         bindvalue = bindvalue.data
-    if isinstance(bindvalue, bytearray):
-        bindvalue = bytes(bindvalue)
 
     embedded_srid = None
     if isinstance(bindvalue, (bytes, bytearray, memoryview, str)):
@@ -78,20 +93,20 @@ def as_binary_ewkb(bindvalue, *, column_srid=None):
     elif is_known_srid(embedded_srid):
         validate_wkb_srid(column_srid, embedded_srid)
 
-    if is_known_srid(element_srid):
+    if is_known_srid(element_srid) and element_srid != embedded_srid:
         return _wkb_wkt.to_ewkb_header(bindvalue, element_srid)
 
     if is_known_srid(embedded_srid):
-        return as_binary_wkb(bindvalue)
+        return as_binary_wkb(bindvalue, keep_buffers=keep_buffers)
 
     if is_known_srid(column_srid):
         return _wkb_wkt.to_ewkb_header(bindvalue, column_srid)
 
-    return as_binary_wkb(bindvalue)
+    return as_binary_wkb(bindvalue, keep_buffers=keep_buffers)
 
 
 def as_ewkb_hex(bindvalue, *, column_srid=None):
-    ewkb = as_binary_ewkb(bindvalue, column_srid=column_srid)
+    ewkb = as_binary_ewkb(bindvalue, column_srid=column_srid, keep_buffers=True)
     if ewkb is None:
         return None
     return ewkb.hex()
@@ -101,8 +116,6 @@ def as_wkb_hex(bindvalue, *, column_srid=None):
     _validate_wkb_bindvalue_srid(bindvalue, column_srid)
     if isinstance(bindvalue, WKBElement):
         bindvalue = bindvalue.data
-    if isinstance(bindvalue, bytearray):
-        bindvalue = bytes(bindvalue)
     return _wkb_wkt.to_hex_wkb_no_srid(bindvalue).lower()
 
 
@@ -120,5 +133,10 @@ def validate_wkb_srid(column_srid, srid, *, has_fixed_srid=True):
         )
 
 
+def bind_processor_factory(spatial_type, dialect=None):
+    """Return the bind processor of the given spatial type (no processing is needed here)."""
+    return None
+
+
 def bind_processor_process(spatial_type, bindvalue):
     return bindvalue  # pragma: no cover
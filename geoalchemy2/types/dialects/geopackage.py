@@ -1,22 +1,42 @@
 """This module defines specific functions for GeoPackage dialect."""
 
 from geoalchemy2.elements import WKBElement
+from geoalchemy2.types.dialects.common import accepts_buffers
 from geoalchemy2.types.dialects.common import as_binary_wkb
 from geoalchemy2.types.dialects.common import as_ewkb_hex
 from geoalchemy2.types.dialects.common import is_ewkb_constructor
 from geoalchemy2.types.dialects.common import is_wkb_constructor
 from geoalchemy2.types.dialects.sqlite import (
-    bind_processor_process as sqlite_bind_processor_process,
+    bind_processor_factory as sqlite_bind_processor_factory,
 )
 
-__all__ = ["bind_processor_process"]
+__all__ = ["bind_processor_factory", "bind_processor_process"]
 
 
-def bind_processor_process(spatial_type, bindvalue):
-    if is_wkb_constructor(spatial_type) and isinstance(
-        bindvalue, (WKBElement, bytes, bytearray, memoryview, str)
-    ):
-        if is_ewkb_constructor(spatial_type):
+def bind_processor_factory(spatial_type, dialect=None):
+    """Return a bind processor specialized on the constructor of the given spatial type."""
+    keep_buffers = accepts_buffers(dialect)
+    sqlite_process = sqlite_bind_processor_factory(spatial_type, dialect)
+    if not is_wkb_constructor(spatial_type):
+        return sqlite_process
+
+    if is_ewkb_constructor(spatial_type):
+
+        def as_binary(bindvalue):
             return as_ewkb_hex(bindvalue, column_srid=spatial_type.srid)
-        return as_binary_wkb(bindvalue)
-    return sqlite_bind_processor_process(spatial_type, bindvalue)
+
+    else:
+
+        def as_binary(bindvalue):
+            return as_binary_wkb(bindvalue, keep_buffers=keep_buffers)
+
+    def process(bindvalue):
+        if isinstance(bindvalue, (WKBElement, bytes, bytearray, memoryview, str)):
+            return as_binary(bindvalue)
+        return sqlite_process(bindvalue)
+
+    return process
+
+
+def bind_processor_process(spatial_type, bindvalue):
+    return bind_processor_factory(spatial_type)(bindvalue)
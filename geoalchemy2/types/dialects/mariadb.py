@@ -26,41 +26,51 @@ def _normalize_mariadb_wkt(wkt):
     return wkt
 
 
-def bind_processor_process(spatial_type, bindvalue):
-    if isinstance(bindvalue, str):
-        if is_wkb_constructor(spatial_type):
-            return as_wkb_hex(bindvalue, column_srid=spatial_type.srid)
+def bind_processor_factory(spatial_type, dialect=None):
+    """Return a bind processor specialized on the constructor of the given spatial type."""
+    wkb_constructor = is_wkb_constructor(spatial_type)
 
-        wkt_match = WKTElement._REMOVE_SRID.match(bindvalue)
-        srid = wkt_match.group(2)
-        try:
-            if srid is not None:
-                srid = int(srid)
-        except (ValueError, TypeError):  # pragma: no cover
-            raise ArgumentError(
-                f"The SRID ({srid}) of the supplied value can not be casted to integer"
-            ) from None
+    def process(bindvalue):
+        if isinstance(bindvalue, str):
+            if wkb_constructor:
+                return as_wkb_hex(bindvalue, column_srid=spatial_type.srid)
 
-        validate_wkb_srid(spatial_type.srid, srid)
-        return wkt_match.group(3)
+            wkt_match = WKTElement._REMOVE_SRID.match(bindvalue)
+            srid = wkt_match.group(2)
+            try:
+                if srid is not None:
+                    srid = int(srid)
+            except (ValueError, TypeError):  # pragma: no cover
+                raise ArgumentError(
+                    f"The SRID ({srid}) of the supplied value can not be casted to integer"
+                ) from None
 
-    if isinstance(bindvalue, _SpatialElement):
-        validate_wkb_srid(spatial_type.srid, bindvalue.srid)
+            validate_wkb_srid(spatial_type.srid, srid)
+            return wkt_match.group(3)
 
-    if isinstance(bindvalue, WKTElement):
-        bindvalue = bindvalue.as_wkt()
-        if not is_known_srid(bindvalue.srid):
-            bindvalue.srid = spatial_type.srid
-        return bindvalue
-    elif isinstance(bindvalue, WKBElement):
-        if not is_wkb_constructor(spatial_type):
-            return _normalize_mariadb_wkt(_wkb_wkt.to_wkt_no_srid(bindvalue.data))
-        # MariaDB does not support raw binary data so we use the hex representation
-        return as_wkb_hex(bindvalue, column_srid=spatial_type.srid)
-    elif isinstance(bindvalue, (bytes, bytearray, memoryview)):
-        if is_wkb_constructor(spatial_type):
+        if isinstance(bindvalue, _SpatialElement):
+            validate_wkb_srid(spatial_type.srid, bindvalue.srid)
+
+        if isinstance(bindvalue, WKTElement):
+            bindvalue = bindvalue.as_wkt()
+            if not is_known_srid(bindvalue.srid):
+                bindvalue.srid = spatial_type.srid
+            return bindvalue
+        elif isinstance(bindvalue, WKBElement):
+            if not wkb_constructor:
+                return _normalize_mariadb_wkt(_wkb_wkt.to_wkt_no_srid(bindvalue.data))
+            # MariaDB does not support raw binary data so we use the hex representation
             return as_wkb_hex(bindvalue, column_srid=spatial_type.srid)
-        wkt, srid = _wkb_wkt.split_wkb_srid(bindvalue)
-        validate_wkb_srid(spatial_type.srid, srid)
-        return _normalize_mariadb_wkt(wkt)
-    return bindvalue
+        elif isinstance(bindvalue, (bytes, bytearray, memoryview)):
+            if wkb_constructor:
+                return as_wkb_hex(bindvalue, column_srid=spatial_type.srid)
+            wkt, srid = _wkb_wkt.split_wkb_srid(bindvalue)
+            validate_wkb_srid(spatial_type.srid, srid)
+            return _normalize_mariadb_wkt(wkt)
+        return bindvalue
+
+    return process
+
+
+def bind_processor_process(spatial_type, bindvalue):
+    return bind_processor_factory(spatial_type)(bindvalue)
@@ -172,8 +172,22 @@ def _resolve_mssql_spatial_type(spatial_type, dialect):
     return spatial_type
 
 
+def bind_processor_factory(spatial_type, dialect=None):
+    """Return a bind processor for the given spatial type, resolved once for the dialect."""
+    spatial_type = _resolve_mssql_spatial_type(spatial_type, dialect)
+
+    def process(bindvalue):
+        return _process_bindvalue(spatial_type, bindvalue)
+
+    return process
+
+
 def bind_processor_process(spatial_type, bindvalue, dialect=None):
     spatial_type = _resolve_mssql_spatial_type(spatial_type, dialect)
+    return _process_bindvalue(spatial_type, bindvalue)
+
+
+def _process_bindvalue(spatial_type, bindvalue):
     column_srid = spatial_type.srid
     has_fixed_srid = column_srid >= 0
     if isinstance(bindvalue, str):
@@ -11,41 +11,51 @@ from geoalchemy2.types.dialects.common import is_wkb_constructor
 from geoalchemy2.types.dialects.common import validate_wkb_srid
 
 
-def bind_processor_process(spatial_type, bindvalue):
-    if isinstance(bindvalue, str):
-        if is_wkb_constructor(spatial_type):
-            return as_binary_wkb(bindvalue, strip_srid=True, column_srid=spatial_type.srid)
-
-        wkt_match = WKTElement._REMOVE_SRID.match(bindvalue)
-        srid = wkt_match.group(2)
-        try:
-            if srid is not None:
-                srid = int(srid)
-        except (ValueError, TypeError):  # pragma: no cover
-            raise ArgumentError(
-                f"The SRID ({srid}) of the supplied value can not be casted to integer"
-            ) from None
-
-        validate_wkb_srid(spatial_type.srid, srid)
-        return wkt_match.group(3)
-
-    if isinstance(bindvalue, _SpatialElement):
-        validate_wkb_srid(spatial_type.srid, bindvalue.srid)
-
-    if isinstance(bindvalue, WKTElement):
-        bindvalue = bindvalue.as_wkt()
-        if not is_known_srid(bindvalue.srid):
-            bindvalue.srid = spatial_type.srid
+def bind_processor_factory(spatial_type, dialect=None):
+    """Return a bind processor specialized on the constructor of the given spatial type."""
+    wkb_constructor = is_wkb_constructor(spatial_type)
+
+    def process(bindvalue):
+        if isinstance(bindvalue, str):
+            if wkb_constructor:
+                return as_binary_wkb(bindvalue, strip_srid=True, column_srid=spatial_type.srid)
+
+            wkt_match = WKTElement._REMOVE_SRID.match(bindvalue)
+            srid = wkt_match.group(2)
+            try:
+                if srid is not None:
+                    srid = int(srid)
+            except (ValueError, TypeError):  # pragma: no cover
+                raise ArgumentError(
+                    f"The SRID ({srid}) of the supplied value can not be casted to integer"
+                ) from None
+
+            validate_wkb_srid(spatial_type.srid, srid)
+            return wkt_match.group(3)
+
+        if isinstance(bindvalue, _SpatialElement):
+            validate_wkb_srid(spatial_type.srid, bindvalue.srid)
+
+        if isinstance(bindvalue, WKTElement):
+            bindvalue = bindvalue.as_wkt()
+            if not is_known_srid(bindvalue.srid):
+                bindvalue.srid = spatial_type.srid
+            return bindvalue
+        elif isinstance(bindvalue, WKBElement):
+            if wkb_constructor:
+                return as_binary_wkb(bindvalue, strip_srid=True, column_srid=spatial_type.srid)
+            else:
+                return _wkb_wkt.to_wkt_no_srid(bindvalue.data)
+        elif isinstance(bindvalue, (bytes, bytearray, memoryview)):
+            if wkb_constructor:
+                return as_binary_wkb(bindvalue, strip_srid=True, column_srid=spatial_type.srid)
+            wkt, srid = _wkb_wkt.split_wkb_srid(bindvalue)
+            validate_wkb_srid(spatial_type.srid, srid)
+            return wkt
         return bindvalue
-    elif isinstance(bindvalue, WKBElement):
-        if is_wkb_constructor(spatial_type):
-            return as_binary_wkb(bindvalue, strip_srid=True, column_srid=spatial_type.srid)
-        else:
-            return _wkb_wkt.to_wkt_no_srid(bindvalue.data)
-    elif isinstance(bindvalue, (bytes, bytearray, memoryview)):
-        if is_wkb_constructor(spatial_type):
-            return as_binary_wkb(bindvalue, strip_srid=True, column_srid=spatial_type.srid)
-        wkt, srid = _wkb_wkt.split_wkb_srid(bindvalue)
-        validate_wkb_srid(spatial_type.srid, srid)
-        return wkt
-    return bindvalue
+
+    return process
+
+
+def bind_processor_process(spatial_type, bindvalue):
+    return bind_processor_factory(spatial_type)(bindvalue)
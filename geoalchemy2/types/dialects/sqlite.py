@@ -7,6 +7,7 @@ from geoalchemy2 import _wkb_wkt
 from geoalchemy2.elements import RasterElement
 from geoalchemy2.elements import WKBElement
 from geoalchemy2.elements import WKTElement
+from geoalchemy2.types.dialects.common import accepts_buffers
 from geoalchemy2.types.dialects.common import as_binary_wkb
 from geoalchemy2.types.dialects.common import as_ewkb_hex
 from geoalchemy2.types.dialects.common import is_ewkb_constructor
@@ -37,40 +38,54 @@ def format_geom_type(wkt, default_srid=None):
         return f"{geom_type}{coords}"
 
 
-def bind_processor_process(spatial_type, bindvalue):
-    use_ewkb_constructor = is_ewkb_constructor(spatial_type)
-    if isinstance(bindvalue, WKTElement):
-        return format_geom_type(
-            bindvalue.data,
-            default_srid=bindvalue.srid if bindvalue.srid >= 0 else spatial_type.srid,
-        )
-    elif isinstance(bindvalue, WKBElement):
-        if is_wkb_constructor(spatial_type):
-            if use_ewkb_constructor:
-                return as_ewkb_hex(bindvalue, column_srid=spatial_type.srid)
-            return as_binary_wkb(bindvalue)
-        res = format_geom_type(
-            _wkb_wkt.to_wkt_no_srid(bindvalue.data),
-            default_srid=bindvalue.srid if bindvalue.srid >= 0 else spatial_type.srid,
-        )
-        return res
-    elif isinstance(bindvalue, RasterElement):
-        return f"{bindvalue.data}"
-    elif isinstance(bindvalue, str):
-        if is_wkb_constructor(spatial_type):
-            if use_ewkb_constructor:
-                return as_ewkb_hex(bindvalue, column_srid=spatial_type.srid)
-            return as_binary_wkb(bindvalue)
-        return format_geom_type(bindvalue, default_srid=spatial_type.srid)
-    elif isinstance(bindvalue, (bytes, bytearray, memoryview)):
-        if is_wkb_constructor(spatial_type):
-            if use_ewkb_constructor:
-                return as_ewkb_hex(bindvalue, column_srid=spatial_type.srid)
-            return as_binary_wkb(bindvalue)
-        wkt, srid = _wkb_wkt.split_wkb_srid(bindvalue)
-        return format_geom_type(
-            wkt,
-            default_srid=srid if srid is not None and srid >= 0 else spatial_type.srid,
-        )
+def bind_processor_factory(spatial_type, dialect=None):
+    """Return a bind processor specialized on the constructor of the given spatial type."""
+    keep_buffers = accepts_buffers(dialect)
+    if is_ewkb_constructor(spatial_type):
+
+        def as_binary(bindvalue):
+            return as_ewkb_hex(bindvalue, column_srid=spatial_type.srid)
+
+    elif is_wkb_constructor(spatial_type):
+
+        def as_binary(bindvalue):
+            return as_binary_wkb(bindvalue, keep_buffers=keep_buffers)
     else:
-        return bindvalue
+        as_binary = None
+
+    def process(bindvalue):
+        if isinstance(bindvalue, WKTElement):
+            return format_geom_type(
+                bindvalue.data,
+                default_srid=bindvalue.srid if bindvalue.srid >= 0 else spatial_type.srid,
+            )
+        elif isinstance(bindvalue, WKBElement):
+            if as_binary is not None:
+                return as_binary(bindvalue)
+            res = format_geom_type(
+                _wkb_wkt.to_wkt_no_srid(bindvalue.data),
+                default_srid=bindvalue.srid if bindvalue.srid >= 0 else spatial_type.srid,
+            )
+            return res
+        elif isinstance(bindvalue, RasterElement):
+            return f"{bindvalue.data}"
+        elif isinstance(bindvalue, str):
+            if as_binary is not None:
+                return as_binary(bindvalue)
+            return format_geom_type(bindvalue, default_srid=spatial_type.srid)
+        elif isinstance(bindvalue, (bytes, bytearray, memoryview)):
+            if as_binary is not None:
+                return as_binary(bindvalue)
+            wkt, srid = _wkb_wkt.split_wkb_srid(bindvalue)
+            return format_geom_type(
+                wkt,
+                default_srid=srid if srid is not None and srid >= 0 else spatial_type.srid,
+            )
+        else:
+            return bindvalue
+
+    return process
+
+
+def bind_processor_process(spatial_type, bindvalue):
+    return bind_processor_factory(spatial_type)(bindvalue)
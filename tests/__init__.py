@@ -105,6 +105,18 @@ def select(args):
         return raw_select(*args)
 
 
+def compile_w_cache(stmt, dialect, compiled_cache):
+    """Compile a statement with the given compiled cache and return the cache status."""
+    _, _, cache_status = stmt._compile_w_cache(
+        dialect,
+        compiled_cache=compiled_cache,
+        column_keys=[],
+        for_executemany=False,
+        schema_translate_map=None,
+    )
+    return cache_status
+
+
 def format_wkt(wkt):
     return wkt.replace(", ", ",").replace(" (", "(")
 
@@ -0,0 +1,85 @@
+import re
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| +(\S+)")
+
+
+def run_python(code, *options):
+    """Run the given code in a new interpreter, so the modules are imported from scratch."""
+    return subprocess.run(
+        [sys.executable, *options, "-c", code], check=True, capture_output=True, text=True
+    )
+
+
+def parse_importtime(output):
+    """Parse the output of ``python -X importtime`` into the self and cumulative times in seconds.
+
+    Returns:
+        A dict mapping each imported module to its ``(self_time, cumulative_time)`` tuple.
+    """
+    times = {}
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is not None:
+            self_us, cumulative_us, module = match.groups()
+            times[module] = (int(self_us) / 1e6, int(cumulative_us) / 1e6)
+    return times
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        pytest.param("import geoalchemy2.functions", id="import"),
+        pytest.param(
+            "import geoalchemy2.functions as functions\n"
+            "for name in functions.__all__:\n"
+            "    getattr(functions, name)",
+            id="import_and_create_all",
+        ),
+    ],
+)
+def test_import_functions(benchmark, code):
+    """Benchmark the import of the spatial functions, whose classes are created on first use."""
+    benchmark.pedantic(run_python, args=(code,), iterations=1, rounds=5, warmup_rounds=1)
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "geoalchemy2",
+        "geoalchemy2.types",
+        "geoalchemy2.elements",
+    ],
+)
+def test_cold_import(benchmark, module):
+    """Benchmark the import of a module in a new interpreter and record the cost of each module.
+
+    The self times of the GeoAlchemy2 modules are stored in the ``module_import_times`` extra info,
+    which can be compared with ``tools/compare_benchmarks.py --extra-info-timings
+    module_import_times``. The GeoAlchemy2 modules loaded by the import are stored in the
+    ``loaded_modules`` extra info.
+    """
+    rounds = []
+
+    def import_module():
+        result = run_python(f"import {module}", "-X", "importtime")
+        rounds.append(parse_importtime(result.stderr))
+
+    benchmark.pedantic(import_module, iterations=1, rounds=5, warmup_rounds=1)
+
+    loaded_modules = sorted(
+        {name for times in rounds for name in times if name.split(".")[0] == "geoalchemy2"}
+    )
+    benchmark.extra_info["loaded_modules"] = loaded_modules
+    benchmark.extra_info["module_import_times"] = {
+        name: statistics.median(times[name][0] for times in rounds if name in times)
+        for name in loaded_modules
+    }
+    benchmark.extra_info["cumulative_import_time"] = statistics.median(
+        times[module][1] for times in rounds
+    )
+    assert module in loaded_modules
@@ -1,16 +1,28 @@
 import pytest
 from sqlalchemy import Column
 from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Table
+from sqlalchemy.dialects import mssql
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.sql import func
 
 from geoalchemy2 import Geometry
+from geoalchemy2.bulk import _binary_row_encoder
+from geoalchemy2.bulk import _format_text_row
+from geoalchemy2.bulk import _row_encoder
+from geoalchemy2.bulk import copy_into
 from geoalchemy2.elements import WKBElement
 from geoalchemy2.elements import WKTElement
 
+from .. import compile_w_cache
 from .. import create_points
 from .. import select
+from .. import test_only_with_dialects
 
 
 class SuccessfulTest(BaseException):
@@ -452,3 +464,145 @@ def test_insert_select(
     except _insert_select_fail_or_success_type:
         # Handle the expected exception
         pytest.xfail(reason=f"Expected exception: {_insert_select_fail_or_success_type}")
+
+
+@pytest.mark.parametrize(
+    "dialect",
+    [
+        pytest.param(postgresql.dialect(), id="postgresql"),
+        pytest.param(sqlite.dialect(), id="sqlite"),
+        pytest.param(mysql.dialect(), id="mysql"),
+        pytest.param(mssql.dialect(), id="mssql"),
+    ],
+)
+@pytest.mark.parametrize("from_text", ["ST_GeomFromEWKT", "ST_GeomFromEWKB"])
+def test_bind_processor(benchmark, dialect, from_text):
+    """Benchmark the conversion of the values bound to an executemany() insert."""
+    points = create_points(100, convert_wkb=from_text == "ST_GeomFromEWKB", extended=True)
+    processor = Geometry(geometry_type="POINT", srid=4326, from_text=from_text).bind_processor(
+        dialect
+    )
+
+    values = benchmark(lambda: [processor(point) for point in points])
+
+    assert len(values) == len(points)
+
+
+@pytest.mark.parametrize(
+    "dialect",
+    [
+        pytest.param(postgresql.dialect(), id="postgresql"),
+        pytest.param(sqlite.dialect(), id="sqlite"),
+    ],
+)
+@pytest.mark.parametrize("extended", [False, True], ids=["WKB", "EWKB"])
+def test_compile_wkb_constructor(benchmark, dialect, extended):
+    """Benchmark the compilation of WKB constructors with varying SRIDs and a compiled cache."""
+    srids = [4326, 3857, 2154, 32631, -1] * 20
+    wkb = bytes.fromhex("0101000000000000000000f03f0000000000000040")
+    if extended:
+        stmts = [select([func.ST_GeomFromEWKB(wkb, srid)]) for srid in srids]
+    else:
+        stmts = [select([WKBElement(wkb, srid=srid).ST_Buffer(1)]) for srid in srids]
+    cache_statuses = []
+
+    def compile_all():
+        cache = {}
+        cache_statuses[:] = [compile_w_cache(stmt, dialect, cache) for stmt in stmts]
+
+    benchmark(compile_all)
+
+    hit_rate = cache_statuses.count(dialect.CACHE_HIT) / len(stmts)
+    benchmark.extra_info["cache_hit_rate"] = hit_rate
+    # The SRID of ST_GeomFromEWKB is applied by the bind processor of the EWKB value, so there is
+    # one compiled statement per distinct SRID
+    compiled_count = len(set(srids)) if extended else 1
+    assert hit_rate == (len(stmts) - compiled_count) / len(stmts)
+
+
+@pytest.fixture
+def BulkPointTable(base, schema):
+    class BulkPointTable(base):
+        __tablename__ = "bulk_point_table"
+        __table_args__ = {"schema": schema}
+        id = Column(Integer, primary_key=True)
+        geom = Column(Geometry(geometry_type="POINT", srid=4326))
+
+    return BulkPointTable
+
+
+def copy_all_points(conn, table, points):
+    """Load all points into the database with a COPY statement."""
+    return copy_into(conn, table, ({"geom": point} for point in points))
+
+
+def copy_all_points_binary(conn, table, points):
+    """Load all points into the database with a COPY statement in binary format."""
+    return copy_into(conn, table, ({"geom": point} for point in points), binary=True)
+
+
+@test_only_with_dialects("postgresql")
+@pytest.mark.parametrize(
+    "N",
+    [
+        10,
+        pytest.param(100, marks=pytest.mark.long_benchmark),
+        pytest.param(300, marks=pytest.mark.long_benchmark),
+    ],
+)
+@pytest.mark.parametrize(
+    "load_points",
+    [insert_all_points, copy_all_points, copy_all_points_binary],
+    ids=["insert", "copy", "binary copy"],
+)
+@pytest.mark.parametrize("input_representation", ["WKT input", "WKB input"])
+def test_bulk_load(
+    insert_select_rounds,
+    benchmark,
+    BulkPointTable,
+    conn,
+    metadata,
+    N,
+    load_points,
+    input_representation,
+):
+    """Benchmark the loading of many points with INSERT or COPY statements."""
+    if load_points is not insert_all_points and conn.dialect.driver not in ("psycopg", "psycopg2"):
+        pytest.skip("COPY is only supported with psycopg and psycopg2")
+    points = create_points(N, convert_wkb=input_representation == "WKB input", extended=True)
+
+    benchmark.pedantic(
+        load_points,
+        setup=lambda: _benchmark_setup(conn, BulkPointTable, metadata, points),
+        iterations=1,
+        rounds=insert_select_rounds,
+        warmup_rounds=1,
+    )
+
+    table = BulkPointTable.__table__
+    assert (
+        conn.execute(
+            select([func.count()]).select_from(table).where(table.c.geom.is_not(None))
+        ).scalar()
+        == N * N
+    )
+
+
+@pytest.mark.parametrize("binary", [False, True], ids=["text", "binary"])
+@pytest.mark.parametrize("convert_wkb", [False, True], ids=["WKT input", "WKB input"])
+def test_copy_encoder(benchmark, convert_wkb, binary):
+    """Benchmark the encoding of the rows loaded by a COPY statement in text or binary format."""
+    points = create_points(100, convert_wkb=convert_wkb, extended=True)
+    table = Table("t", MetaData(), Column("geom", Geometry(geometry_type="POINT", srid=4326)))
+    if binary:
+        encode_row = _binary_row_encoder(table, ["geom"])
+    else:
+        text_encoder = _row_encoder(table, ["geom"], postgresql.psycopg2.dialect())
+
+        def encode_row(row):
+            return _format_text_row(text_encoder(row)).encode()
+
+    chunks = benchmark(lambda: [encode_row({"geom": point}) for point in points])
+
+    assert len(chunks) == len(points)
+    benchmark.extra_info["size"] = sum(len(chunk) for chunk in chunks)
@@ -0,0 +1,186 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+import shapely
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+
+from geoalchemy2 import Geometry
+from geoalchemy2.elements import WKBElement
+from geoalchemy2.shape import from_shape
+
+from .. import create_points
+from .test_insert_select import insert_all_points
+from .test_insert_select import select_all_points
+
+EWKB_POINT = bytes.fromhex("0101000020e6100000000000000000f03f0000000000000040")
+
+
+def _record_rows_per_second(benchmark, nb_rows):
+    """Report the throughput of the benchmarked function in the benchmark results."""
+    if benchmark.stats is None:
+        # The benchmarks are disabled
+        return
+    benchmark.extra_info["rows"] = nb_rows
+    benchmark.extra_info["rows_per_second"] = nb_rows / benchmark.stats.stats.mean
+
+
+def _peak_memory(func, *args):
+    """Return the result of the given function and the peak memory allocated during its call."""
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+@pytest.fixture
+def PointTable(base, schema):
+    class PointTable(base):
+        __tablename__ = "point_table"
+        __table_args__ = {"schema": schema}
+        id = Column(Integer, primary_key=True)
+        geom = Column(Geometry(geometry_type="POINT", srid=4326))
+
+    return PointTable
+
+
+@pytest.mark.parametrize(
+    "N",
+    [
+        10,
+        pytest.param(100, marks=pytest.mark.long_benchmark),
+        pytest.param(300, marks=pytest.mark.long_benchmark),
+    ],
+)
+def test_select(insert_select_rounds, benchmark, PointTable, conn, metadata, N):
+    """Benchmark a large select() of geometries."""
+    metadata.drop_all(conn, checkfirst=True)
+    metadata.create_all(conn)
+    table = PointTable.__table__
+    insert_all_points(conn, table, create_points(N, convert_wkb=True, extended=True))
+
+    rows = benchmark.pedantic(
+        select_all_points,
+        args=(conn, table),
+        iterations=1,
+        rounds=insert_select_rounds,
+        warmup_rounds=1,
+    )
+
+    assert len(rows) == N * N
+    assert all(isinstance(row.geom, WKBElement) for row in rows)
+    assert all(row.geom.srid == 4326 for row in rows)
+    _record_rows_per_second(benchmark, len(rows))
+
+
+@pytest.mark.parametrize(
+    "dialect",
+    [
+        pytest.param(postgresql.dialect(), id="postgresql"),
+        pytest.param(sqlite.dialect(), id="sqlite"),
+        pytest.param(mysql.dialect(), id="mysql"),
+    ],
+)
+@pytest.mark.parametrize(
+    "srid", [pytest.param(4326, id="fixed SRID"), pytest.param(-1, id="no SRID")]
+)
+@pytest.mark.parametrize(
+    "lazy_elements", [pytest.param(False, id="eager"), pytest.param(True, id="lazy")]
+)
+def test_result_processor(benchmark, dialect, srid, lazy_elements):
+    """Benchmark the conversion of raw query results into elements."""
+    nb_rows = 100_000
+    values = [EWKB_POINT] * nb_rows
+    processor = Geometry(
+        geometry_type="POINT", srid=srid, lazy_elements=lazy_elements
+    ).result_processor(dialect, None)
+
+    elements = benchmark(lambda: [processor(value) for value in values])
+
+    assert len(elements) == nb_rows
+    assert elements[0].srid == 4326
+    _record_rows_per_second(benchmark, nb_rows)
+
+
+@pytest.mark.parametrize(
+    "srid", [pytest.param(4326, id="fixed SRID"), pytest.param(-1, id="no SRID")]
+)
+def test_batch_result_processor(benchmark, srid):
+    """Benchmark the conversion of raw query results into elements by batches."""
+    nb_rows = 100_000
+    batch_size = 10_000
+    batches = [[EWKB_POINT] * batch_size for _ in range(nb_rows // batch_size)]
+    processor = Geometry(geometry_type="POINT", srid=srid).batch_result_processor(
+        postgresql.dialect()
+    )
+
+    elements = benchmark(lambda: [processor(batch) for batch in batches])
+
+    assert sum(len(batch) for batch in elements) == nb_rows
+    assert elements[0][0].srid == 4326
+    _record_rows_per_second(benchmark, nb_rows)
+
+
+@pytest.mark.parametrize(
+    "dialect",
+    [
+        pytest.param(postgresql.psycopg2.dialect(), id="psycopg2"),
+        pytest.param(postgresql.pg8000.dialect(), id="pg8000"),
+    ],
+)
+def test_large_multipolygons_memory(benchmark, dialect):
+    """Benchmark the memory used to load large multipolygons and bind them back.
+
+    The values are given as ``memoryview`` objects, as returned by psycopg2. They are passed
+    through unchanged to the drivers accepting buffers and copied for the other ones, which
+    is reported in the ``peak_memory`` extra info (in bytes).
+    """
+    nb_rows = 20
+    coords = np.arange(100, dtype=float)
+    x, y = np.meshgrid(coords, coords)
+    boxes = shapely.box(x.ravel(), y.ravel(), x.ravel() + 0.5, y.ravel() + 0.5)
+    ewkb = from_shape(shapely.MultiPolygon(list(boxes)), srid=4326, extended=True).data
+    values = [memoryview(bytes(ewkb)) for _ in range(nb_rows)]
+    spatial_type = Geometry(geometry_type="MULTIPOLYGON", from_text="ST_GeomFromEWKB")
+    result_processor = spatial_type.result_processor(dialect, None)
+    bind_processor = spatial_type.bind_processor(dialect)
+
+    def load_and_bind():
+        return [bind_processor(result_processor(value)) for value in values]
+
+    bound, peak = _peak_memory(load_and_bind)
+    benchmark(load_and_bind)
+
+    assert len(bound) == nb_rows
+    assert all(bytes(value) == ewkb for value in bound)
+    benchmark.extra_info["row_size"] = len(ewkb)
+    benchmark.extra_info["peak_memory"] = peak
+    _record_rows_per_second(benchmark, nb_rows)
+
+
+@pytest.mark.parametrize("data_type", [bytes, memoryview, str])
+def test_deduplicate_elements(benchmark, data_type):
+    """Benchmark the deduplication of many elements, e.g. fetched from a join."""
+    nb_rows = 10_000
+    nb_distinct = 100
+    polygons = [
+        shapely.buffer(shapely.Point(i, i), 1, quad_segs=32).wkb for i in range(nb_distinct)
+    ]
+    if data_type is str:
+        polygons = [polygon.hex() for polygon in polygons]
+    elements = [
+        WKBElement(data_type(polygons[i % nb_distinct]), srid=4326, extended=False)
+        for i in range(nb_rows)
+    ]
+
+    distinct = benchmark(set, elements)
+
+    assert len(distinct) == nb_distinct
+    _record_rows_per_second(benchmark, nb_rows)
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+import shapely
+
+from geoalchemy2.elements import WKBElement
+from geoalchemy2.shape import from_shape
+from geoalchemy2.shape import from_shapes
+from geoalchemy2.shape import to_shape
+from geoalchemy2.shape import to_shapes
+
+NB_GEOMS = 100_000
+
+
+@pytest.fixture(scope="module")
+def points():
+    return shapely.points(np.random.default_rng(0).random((NB_GEOMS, 2)))
+
+
+@pytest.mark.parametrize(
+    "vectorized", [pytest.param(False, id="loop"), pytest.param(True, id="vectorized")]
+)
+def test_to_shapes(benchmark, points, vectorized):
+    """Benchmark the conversion of query results into Shapely geometries."""
+    elements = WKBElement.from_many(shapely.to_wkb(points, include_srid=True).tolist())
+
+    if vectorized:
+        shapes = benchmark(to_shapes, elements)
+    else:
+        shapes = benchmark(lambda: [to_shape(element) for element in elements])
+
+    assert len(shapes) == NB_GEOMS
+
+
+@pytest.mark.parametrize(
+    "vectorized", [pytest.param(False, id="loop"), pytest.param(True, id="vectorized")]
+)
+def test_from_shapes(benchmark, points, vectorized):
+    """Benchmark the conversion of Shapely geometries into elements."""
+    if vectorized:
+        elements = benchmark(from_shapes, points, srid=4326)
+    else:
+        elements = benchmark(lambda: [from_shape(point, srid=4326) for point in points])
+
+    assert len(elements) == NB_GEOMS
@@ -1,11 +1,22 @@
 import importlib
+import subprocess
+import sys
+import textwrap
 
 from sqlalchemy import Column
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
 from sqlalchemy import Table
+from sqlalchemy import create_engine
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.sql import func
 
+from geoalchemy2 import Geometry
 from geoalchemy2.admin.dialects import common
+from geoalchemy2.admin.dialects import postgresql as postgresql_admin
+from geoalchemy2.admin.dialects import sqlite as sqlite_admin
 
 
 class _RecordingColumnCollection:
@@ -69,3 +80,128 @@ def test_update_table_for_dispatch_uses_selected_column_collection(monkeypatch):
     assert table.info["_saved_columns"] is original_columns
     assert isinstance(table.columns, _WriteableColumnCollection)
     assert table.columns.columns == [regular_col]
+
+
+def test_before_execute_listener_is_not_attached_to_engines_without_hook():
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert not engine.dispatch.before_execute
+
+
+def test_before_execute_listener_is_attached_once_per_engine(monkeypatch):
+    statements = []
+
+    def before_execute(conn, clauseelement, multiparams, params, execution_options):
+        statements.append(clauseelement.text)
+        return clauseelement, multiparams, params
+
+    monkeypatch.setattr(sqlite_admin, "before_execute", before_execute, raising=False)
+    engine = create_engine("sqlite://")
+    with engine.execution_options(isolation_level="AUTOCOMMIT").connect() as conn:
+        conn.execute(text("SELECT 1"))
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 2"))
+
+    assert len(engine.dispatch.before_execute) == 1
+    assert statements == ["SELECT 1", "SELECT 2"]
+
+
+def test_spatial_ddl_batch_requires_the_execution_option():
+    engine = create_engine("sqlite://")
+    ddl_runner = object.__new__(type("DDLRunner", (), {}))
+
+    with engine.connect() as conn:
+        assert common.get_spatial_ddl_batch(conn, _ddl_runner=ddl_runner) is None
+
+        conn = conn.execution_options(geoalchemy2_batch_spatial_ddl=True)
+        batch = common.get_spatial_ddl_batch(conn, _ddl_runner=ddl_runner)
+        assert batch == []
+        assert common.get_spatial_ddl_batch(conn, _ddl_runner=ddl_runner) is batch
+        # Table.create() is not batched
+        assert (
+            common.get_spatial_ddl_batch(conn, _ddl_runner=ddl_runner, _is_metadata_operation=False)
+            is None
+        )
+        assert common.get_spatial_ddl_batch(conn) is None
+
+
+class _RecordingBind:
+    def __init__(self):
+        self.dialect = postgresql.dialect()
+        self.scripts = []
+
+    def exec_driver_sql(self, statement):
+        self.scripts.append(statement)
+
+
+def test_postgresql_spatial_ddl_is_executed_in_one_script():
+    table = Table("lake", MetaData(), Column("geom", Geometry("POINT", 4326, spatial_index=False)))
+    idx = postgresql_admin.create_spatial_index(None, table, table.c.geom)
+    statements = [
+        func.AddGeometryColumn("lake", "geom", 4326, "POINT", 2),
+        CreateIndex(idx),
+    ]
+    bind = _RecordingBind()
+
+    postgresql_admin.execute_spatial_ddl(bind, statements)
+    postgresql_admin.execute_spatial_ddl(bind, statements)
+
+    assert bind.scripts == [
+        "SELECT AddGeometryColumn('lake', 'geom', 4326, 'POINT', 2) AS \"AddGeometryColumn_1\";\n"
+        "CREATE INDEX idx_lake_geom ON lake USING gist (geom)"
+    ]
+    assert statements == []
+
+
+def _run_python(code):
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)], check=True, capture_output=True, text=True
+    )
+    return result.stdout.splitlines()
+
+
+def test_dialect_modules_are_loaded_on_first_use():
+    output = _run_python(
+        """
+        import sys
+
+        import geoalchemy2
+
+        def loaded():
+            return sorted(
+                name.rsplit(".", 1)[1]
+                for name in sys.modules
+                if name.startswith("geoalchemy2.admin.dialects.") and not name.endswith("common")
+            )
+
+        print(loaded())
+        geoalchemy2.admin.select_dialect("postgresql")
+        print(loaded())
+        """
+    )
+
+    assert output == ["[]", "['postgresql']"]
+
+
+def test_dialect_module_is_loaded_when_compiling_without_engine():
+    output = _run_python(
+        """
+        import sys
+
+        from sqlalchemy import Column, MetaData, Table, select
+        from sqlalchemy.dialects import mssql
+
+        from geoalchemy2 import Geometry
+
+        table = Table("t", MetaData(), Column("geom", Geometry("POINT", 4326)))
+        print("geoalchemy2.admin.dialects.mssql" in sys.modules)
+        print(select(table.c.geom.ST_Buffer(2).label("geom")).compile(dialect=mssql.dialect()))
+        print("geoalchemy2.admin.dialects.mssql" in sys.modules)
+        """
+    )
+
+    assert output[0] == "False"
+    assert "STBuffer" in "\n".join(output[1:-1])
+    assert output[-1] == "True"
@@ -16,6 +16,7 @@ from sqlalchemy import MetaData
 from sqlalchemy import Table
 from sqlalchemy import text
 from sqlalchemy.dialects import mssql
+from sqlalchemy.dialects import postgresql
 
 from geoalchemy2 import Geometry
 from geoalchemy2 import alembic_helpers
@@ -33,6 +34,31 @@ def test_sqlalchemy_integer_repr_is_safe_after_alembic_helper_import():
     assert repr(Integer()) == "Integer()"
 
 
+def test_create_geo_index_uses_spatial_index_options():
+    class Bind:
+        dialect = postgresql.dialect()
+
+    class Context:
+        bind = Bind()
+
+    geom_type = Geometry(
+        geometry_type="POINT",
+        srid=4326,
+        spatial_index_method="brin",
+        spatial_index_with={"pages_per_range": 32},
+    )
+    index_op = ops.CreateIndexOp("idx_gps_geom", "gps", [Column("geom", geom_type)])
+
+    rewritten_op = alembic_helpers.create_geo_index(Context(), None, index_op)
+
+    assert isinstance(rewritten_op, alembic_helpers.CreateGeospatialIndexOp)
+    assert rewritten_op.kw == {
+        "postgresql_using": "brin",
+        "postgresql_ops": {},
+        "postgresql_with": {"pages_per_range": 32},
+    }
+
+
 class TestAutogenerate:
     def test_no_diff(self, conn, Lake, setup_tables, use_alembic_monkeypatch, dialect_name):
         """Check that the autogeneration detects spatial types properly."""
@@ -0,0 +1,190 @@
+import importlib
+import json
+import sys
+
+import pytest
+from sqlalchemy import Integer
+from sqlalchemy import create_engine
+from sqlalchemy import text
+from sqlalchemy.engine.result import IteratorResult
+from sqlalchemy.engine.result import SimpleResultMetaData
+
+import geoalchemy2.arrow
+from geoalchemy2.elements import WKBElement
+from geoalchemy2.elements import WKTElement
+from geoalchemy2.types import Geometry
+
+pa = pytest.importorskip("pyarrow")
+gpd = pytest.importorskip("geopandas")
+
+EWKB = bytes.fromhex("0101000020e6100000000000000000f03f0000000000000040")
+WKB = bytes.fromhex("0101000000000000000000f03f0000000000000040")
+
+
+def to_wkt(geoseries):
+    return [None if geom is None else geom.wkt for geom in geoseries]
+
+
+def create_result(rows, keys=("id", "name", "geom")):
+    return IteratorResult(SimpleResultMetaData(list(keys)), iter(rows))
+
+
+@pytest.fixture
+def rows():
+    return [(i, f"point_{i}", WKBElement(EWKB, extended=True) if i % 3 else None) for i in range(7)]
+
+
+@pytest.fixture
+def conn():
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        connection.execute(text("CREATE TABLE points (id INTEGER, geom BLOB)"))
+        connection.execute(
+            text("INSERT INTO points VALUES (:id, :geom)"),
+            [{"id": i, "geom": EWKB if i >= 3 else None} for i in range(5)],
+        )
+        yield connection
+
+
+def execute_typed_query(conn, srid=3857):
+    """Execute a query whose spatial column type is known, the first batch only has NULL values."""
+    query = text("SELECT id, geom FROM points ORDER BY id").columns(
+        id=Integer, geom=Geometry(srid=srid)
+    )
+    return conn.execute(query)
+
+
+class TestToArrowBatches:
+    def test_batches(self, rows):
+        tables = list(geoalchemy2.arrow.to_arrow_batches(create_result(rows), batch_size=3))
+
+        assert [table.num_rows for table in tables] == [3, 3, 1]
+        for table in tables:
+            assert table.schema.names == ["id", "name", "geom"]
+            assert table.schema.field("id").type == pa.int64()
+            assert table.schema.field("name").type == pa.string()
+            field = table.schema.field("geom")
+            assert field.type == pa.binary()
+            assert field.metadata[b"ARROW:extension:name"] == b"geoarrow.wkb"
+            assert json.loads(field.metadata[b"ARROW:extension:metadata"]) == {
+                "crs": "EPSG:4326",
+                "crs_type": "authority_code",
+            }
+
+        # The last batch only contains a null geometry
+        assert tables[-1].column("geom").to_pylist() == [None]
+        assert pa.concat_tables(tables).column("geom").to_pylist() == [
+            None if i % 3 == 0 else WKB for i in range(7)
+        ]
+
+    @pytest.mark.parametrize(
+        "element",
+        [
+            WKBElement(WKB),
+            WKBElement(EWKB.hex(), extended=True),
+            WKBElement(memoryview(EWKB), extended=True),
+            WKTElement("SRID=4326;POINT(1 2)", extended=True),
+        ],
+    )
+    def test_elements(self, element):
+        (table,) = geoalchemy2.arrow.to_arrow_batches(
+            create_result([(element,)], keys=["geom"]), batch_size=10
+        )
+
+        assert table.column("geom").to_pylist() == [WKB]
+        crs = json.loads(table.schema.field("geom").metadata[b"ARROW:extension:metadata"])
+        assert crs.get("crs") == ("EPSG:4326" if element.srid == 4326 else None)
+
+    def test_schema_from_column_types(self, conn):
+        tables = list(geoalchemy2.arrow.to_arrow_batches(execute_typed_query(conn), batch_size=3))
+
+        assert [table.num_rows for table in tables] == [3, 2]
+        assert tables[0].schema == tables[1].schema
+        field = tables[0].schema.field("geom")
+        assert field.metadata[b"ARROW:extension:name"] == b"geoarrow.wkb"
+        # The CRS is the SRID of the column, not the one of the EWKB values
+        assert json.loads(field.metadata[b"ARROW:extension:metadata"])["crs"] == "EPSG:3857"
+        assert pa.concat_tables(tables).column("geom").to_pylist() == [None] * 3 + [WKB] * 2
+
+    def test_crs_from_elements(self, conn):
+        tables = list(
+            geoalchemy2.arrow.to_arrow_batches(execute_typed_query(conn, srid=-1), batch_size=3)
+        )
+
+        field = tables[0].schema.field("geom")
+        assert field.metadata[b"ARROW:extension:name"] == b"geoarrow.wkb"
+        # The SRID of the column is not known and the first batch only has NULL values
+        assert json.loads(field.metadata[b"ARROW:extension:metadata"]) == {}
+        # The SRID of the EWKB values is used once it is found
+        field = tables[1].schema.field("geom")
+        assert json.loads(field.metadata[b"ARROW:extension:metadata"])["crs"] == "EPSG:4326"
+
+    def test_read_by_geopandas(self, rows):
+        tables = geoalchemy2.arrow.to_arrow_batches(create_result(rows), batch_size=10)
+        df = gpd.GeoDataFrame.from_arrow(next(tables))
+
+        assert df.crs == "EPSG:4326"
+        assert to_wkt(df.geometry) == [None if i % 3 == 0 else "POINT (1 2)" for i in range(7)]
+
+
+class TestToGeoDataFrameBatches:
+    def test_batches(self, rows):
+        dfs = list(geoalchemy2.arrow.to_geodataframe_batches(create_result(rows), batch_size=3))
+
+        assert [len(df) for df in dfs] == [3, 3, 1]
+        for df in dfs:
+            assert isinstance(df, gpd.GeoDataFrame)
+            assert df.geometry.name == "geom"
+            assert df.crs == "EPSG:4326"
+        df = dfs[0]
+        assert df["id"].tolist() == [0, 1, 2]
+        assert df["name"].tolist() == ["point_0", "point_1", "point_2"]
+        assert to_wkt(df.geometry) == [None, "POINT (1 2)", "POINT (1 2)"]
+
+    def test_columns_from_column_types(self, conn):
+        dfs = list(
+            geoalchemy2.arrow.to_geodataframe_batches(execute_typed_query(conn), batch_size=3)
+        )
+
+        assert [len(df) for df in dfs] == [3, 2]
+        for df in dfs:
+            assert df.geometry.name == "geom"
+            assert df.crs == "EPSG:3857"
+        assert to_wkt(dfs[0].geometry) == [None] * 3
+
+    def test_crs_from_elements(self, conn):
+        dfs = list(
+            geoalchemy2.arrow.to_geodataframe_batches(
+                execute_typed_query(conn, srid=-1), batch_size=3
+            )
+        )
+
+        assert [df.crs for df in dfs] == [None, "EPSG:4326"]
+
+    def test_active_geometry(self):
+        rows = [(WKBElement(EWKB), WKTElement("POINT(3 4)", srid=3857))]
+        (df,) = geoalchemy2.arrow.to_geodataframe_batches(
+            create_result(rows, keys=["geom", "other_geom"]), geometry="other_geom"
+        )
+
+        assert df.geometry.name == "other_geom"
+        assert df.crs == "EPSG:3857"
+        assert df["geom"].crs == "EPSG:4326"
+        assert to_wkt(df.geometry) == ["POINT (3 4)"]
+
+
+@pytest.mark.parametrize(
+    ("module_name", "func_name", "match"),
+    [
+        ("pyarrow", "to_arrow_batches", "optional PyArrow dependency"),
+        ("geopandas", "to_geodataframe_batches", "optional GeoPandas dependency"),
+    ],
+)
+def test_missing_dependency(monkeypatch, module_name, func_name, match):
+    with monkeypatch.context() as m:
+        m.setitem(sys.modules, module_name, None)
+        module = importlib.reload(geoalchemy2.arrow)
+        with pytest.raises(ImportError, match=match):
+            getattr(module, func_name)(create_result([]))
+
+    importlib.reload(geoalchemy2.arrow)
@@ -0,0 +1,393 @@
+import datetime
+import enum
+import struct
+import uuid
+from types import SimpleNamespace
+
+import pytest
+import shapely
+from shapely.geometry import Point
+from sqlalchemy import REAL
+from sqlalchemy import Boolean
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import Enum
+from sqlalchemy import Float
+from sqlalchemy import Integer
+from sqlalchemy import LargeBinary
+from sqlalchemy import MetaData
+from sqlalchemy import Numeric
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import TypeDecorator
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from geoalchemy2 import Geography
+from geoalchemy2 import Geometry
+from geoalchemy2 import Raster
+from geoalchemy2.bulk import BINARY_COPY_HEADER
+from geoalchemy2.bulk import BINARY_COPY_TRAILER
+from geoalchemy2.bulk import _binary_row_encoder
+from geoalchemy2.bulk import _ChunksReader
+from geoalchemy2.bulk import _copy_statement
+from geoalchemy2.bulk import _format_text_row
+from geoalchemy2.bulk import _row_encoder
+from geoalchemy2.bulk import as_copy_ewkb
+from geoalchemy2.bulk import as_copy_ewkb_hex
+from geoalchemy2.bulk import copy_into
+from geoalchemy2.elements import RasterElement
+from geoalchemy2.elements import WKBElement
+from geoalchemy2.elements import WKTElement
+from geoalchemy2.exc import ArgumentError
+from geoalchemy2.shape import to_shape
+
+from . import test_only_with_dialects
+
+WKB_HEX = "0101000000000000000000f03f0000000000000040"
+EWKB_HEX = "0101000020e6100000000000000000f03f0000000000000040"
+
+
+@pytest.fixture
+def copy_table():
+    return Table(
+        "copy table",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("name", String),
+        Column("geom", Geometry(geometry_type="POINT", srid=4326)),
+        schema="gis",
+    )
+
+
+class TestAsCopyEwkbHex:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            WKBElement(bytes.fromhex(EWKB_HEX)),
+            WKBElement(bytes.fromhex(WKB_HEX), srid=4326),
+            WKBElement(bytes.fromhex(WKB_HEX)),
+            WKTElement("POINT(1 2)"),
+            WKTElement("POINT(1 2)", srid=4326),
+            WKTElement("SRID=4326;POINT(1 2)", extended=True),
+            "POINT(1 2)",
+            "SRID=4326;POINT(1 2)",
+            EWKB_HEX,
+            WKB_HEX,
+            bytes.fromhex(EWKB_HEX),
+            memoryview(bytes.fromhex(WKB_HEX)),
+            Point(1, 2),
+            shapely.set_srid(Point(1, 2), 4326),
+        ],
+    )
+    def test_values(self, value):
+        assert as_copy_ewkb_hex(value, column_srid=4326) == EWKB_HEX
+
+    def test_none(self):
+        assert as_copy_ewkb_hex(None, column_srid=4326) is None
+        assert as_copy_ewkb(None, column_srid=4326) is None
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            WKBElement(memoryview(bytes.fromhex(WKB_HEX))),
+            "POINT(1 2)",
+            Point(1, 2),
+        ],
+    )
+    def test_binary(self, value):
+        ewkb = as_copy_ewkb(value, column_srid=4326)
+        assert type(ewkb) is bytes
+        assert ewkb == bytes.fromhex(EWKB_HEX)
+
+    def test_shapely_geometry_without_srid_support(self, monkeypatch):
+        # The geometries of Shapely 1 have no SRID
+        monkeypatch.delattr(shapely, "get_srid")
+        assert as_copy_ewkb_hex(Point(1, 2), column_srid=4326) == EWKB_HEX
+
+    def test_no_srid(self):
+        assert as_copy_ewkb_hex(WKTElement("POINT(1 2)")) == WKB_HEX
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            WKBElement(bytes.fromhex(EWKB_HEX)),
+            WKTElement("POINT(1 2)", srid=4326),
+            "SRID=4326;POINT(1 2)",
+            shapely.set_srid(Point(1, 2), 4326),
+        ],
+    )
+    def test_srid_mismatch(self, value):
+        with pytest.raises(ArgumentError, match=r"column \(3857\)"):
+            as_copy_ewkb_hex(value, column_srid=3857)
+
+
+class TestCopyFormat:
+    def test_statement(self, copy_table):
+        assert (
+            _copy_statement(postgresql.dialect(), copy_table, ["name", "geom"])
+            == 'COPY gis."copy table" (name, geom) FROM STDIN'
+        )
+
+    def test_binary_statement(self, copy_table):
+        assert (
+            _copy_statement(postgresql.dialect(), copy_table, ["geom"], binary=True)
+            == 'COPY gis."copy table" (geom) FROM STDIN (FORMAT BINARY)'
+        )
+
+    def test_row_encoder(self):
+        table = Table(
+            "t",
+            MetaData(),
+            Column("name", String),
+            Column("geom", Geometry(srid=4326)),
+            Column("geog", Geography(srid=4326)),
+            Column("rast", Raster()),
+        )
+        encode_row = _row_encoder(
+            table, ["name", "geom", "geog", "rast"], postgresql.psycopg2.dialect()
+        )
+
+        assert encode_row(
+            {"name": "a", "geom": "POINT(1 2)", "geog": Point(1, 2), "rast": "01"}
+        ) == ("a", EWKB_HEX, EWKB_HEX, "01")
+        assert encode_row({"name": "a"}) == ("a", None, None, None)
+
+    def test_format_text_row(self):
+        values = [
+            None,
+            True,
+            1,
+            1.5,
+            "a\tb\nc\\d",
+            b"\x01\xff",
+            datetime.date(2020, 1, 2),
+            uuid.UUID(int=1),
+            EWKB_HEX,
+        ]
+        assert _format_text_row(values) == (
+            "\\N\tt\t1\t1.5\ta\\tb\\nc\\\\d\t\\\\x01ff\t2020-01-02\t"
+            f"00000000-0000-0000-0000-000000000001\t{EWKB_HEX}\n"
+        )
+
+    def test_row_encoder_bind_processors(self):
+        class Color(enum.Enum):
+            RED = 1
+
+        class Upper(TypeDecorator):
+            impl = String
+            cache_ok = True
+
+            def process_bind_param(self, value, dialect):
+                return value.upper()
+
+        table = Table(
+            "t",
+            MetaData(),
+            Column("color", Enum(Color)),
+            Column("data", postgresql.JSONB),
+            Column("tags", postgresql.ARRAY(String)),
+            Column("name", Upper),
+        )
+        encode_row = _row_encoder(
+            table, ["color", "data", "tags", "name"], postgresql.psycopg2.dialect()
+        )
+
+        values = encode_row(
+            {"color": Color.RED, "data": {"a": 1}, "tags": ["a", 'b"\\', None], "name": "a"}
+        )
+        assert values == ("RED", '{"a": 1}', ["a", 'b"\\', None], "A")
+        assert _format_text_row(values) == 'RED\t{"a": 1}\t{"a","b\\\\"\\\\\\\\",NULL}\tA\n'
+
+    def test_format_text_array(self):
+        assert _format_text_row([[[1, 2], [3, None]], [True, 1.5]]) == "{{1,2},{3,NULL}}\t{t,1.5}\n"
+
+    def test_format_text_mapping(self):
+        with pytest.raises(ArgumentError, match="can not be loaded by COPY"):
+            _format_text_row([{"a": 1}])
+
+    def test_binary_row_encoder(self):
+        raster = RasterElement(
+            "0100000100000000000000F03F000000000000F0BF0000000000000000000000000000000000000000"
+            "00000000000000000000000000000000000000000000E610000001000100440001"
+        )
+        table = Table(
+            "t",
+            MetaData(),
+            Column("id", Integer),
+            Column("name", String),
+            Column("value", Float),
+            Column("valid", Boolean),
+            Column("created", DateTime),
+            Column("data", LargeBinary),
+            Column("geom", Geometry(srid=4326)),
+            Column("rast", Raster()),
+        )
+        encode_row = _binary_row_encoder(
+            table, ["id", "name", "value", "valid", "created", "data", "geom", "rast"]
+        )
+
+        ewkb = bytes.fromhex(EWKB_HEX)
+        raster_wkb = bytes.fromhex(raster.data)
+        assert encode_row(
+            {
+                "id": 1,
+                "name": "é",
+                "value": 1.5,
+                "valid": True,
+                "created": datetime.datetime(2000, 1, 2, 0, 0, 1),
+                "data": b"\x01",
+                "geom": "POINT(1 2)",
+                "rast": raster,
+            }
+        ) == b"".join(
+            [
+                struct.pack(">h", 8),
+                struct.pack(">ii", 4, 1),
+                struct.pack(">i", 2) + "é".encode(),
+                struct.pack(">id", 8, 1.5),
+                struct.pack(">i?", 1, True),
+                struct.pack(">iq", 8, 86_401_000_000),
+                struct.pack(">i", 1) + b"\x01",
+                struct.pack(">i", len(ewkb)) + ewkb,
+                struct.pack(">i", len(raster_wkb)) + raster_wkb,
+            ]
+        )
+        assert encode_row({"id": 1}) == struct.pack(">hii", 8, 4, 1) + struct.pack(">i", -1) * 7
+
+    @pytest.mark.parametrize(
+        "column_type,fmt",
+        [(Float(precision=24), ">f"), (Float(precision=53), ">d"), (REAL(), ">f")],
+    )
+    def test_binary_float_precision(self, column_type, fmt):
+        table = Table("t", MetaData(), Column("value", column_type))
+        encode_row = _binary_row_encoder(table, ["value"])
+
+        payload = struct.pack(fmt, 1.5)
+        assert encode_row({"value": 1.5}) == struct.pack(">hi", 1, len(payload)) + payload
+
+    def test_binary_unsupported_type(self):
+        table = Table("t", MetaData(), Column("price", Numeric))
+        with pytest.raises(ArgumentError, match="not supported by the binary format"):
+            _binary_row_encoder(table, ["price"])
+
+    @pytest.mark.parametrize("size", [-1, 1, 7, 1000])
+    def test_chunks_reader(self, size):
+        lines = (f"{i}\tname_{i}\n" for i in range(20))
+        reader = _ChunksReader(lines, "")
+
+        chunks = []
+        while chunk := reader.read(size):
+            assert size < 0 or len(chunk) <= size
+            chunks.append(chunk)
+
+        assert "".join(chunks) == "".join(f"{i}\tname_{i}\n" for i in range(20))
+
+    @pytest.mark.parametrize("size", [-1, 1, 7, 1000])
+    def test_chunks_reader_binary(self, size):
+        data = [BINARY_COPY_HEADER, struct.pack(">hii", 1, 4, 1), BINARY_COPY_TRAILER]
+        reader = _ChunksReader(iter(data), b"")
+
+        chunks = []
+        while chunk := reader.read(size):
+            assert size < 0 or len(chunk) <= size
+            chunks.append(chunk)
+
+        assert b"".join(chunks) == b"".join(data)
+
+
+class TestCopyInto:
+    @pytest.mark.parametrize(
+        "dialect",
+        [postgresql.pg8000.dialect(), postgresql.asyncpg.dialect()],
+        ids=["pg8000", "asyncpg"],
+    )
+    def test_unsupported_driver(self, copy_table, dialect):
+        class _Connection:
+            pass
+
+        conn = _Connection()
+        conn.dialect = dialect
+        with pytest.raises(ArgumentError, match="only supports the PostgreSQL dialect"):
+            copy_into(conn, copy_table, [{"geom": "POINT(1 2)"}])
+
+    @pytest.mark.parametrize("in_transaction", [False, True])
+    def test_transaction(self, copy_table, in_transaction):
+        events = []
+
+        class _Cursor:
+            def copy_expert(self, statement, file):
+                events.append(("copy", file.read()))
+
+            def close(self):
+                events.append("close")
+
+        class _Transaction:
+            def __enter__(self):
+                events.append("begin")
+
+            def __exit__(self, exc_type, exc, tb):
+                events.append("commit" if exc_type is None else "rollback")
+
+        class _Connection:
+            dialect = postgresql.psycopg2.dialect()
+            connection = SimpleNamespace(dbapi_connection=SimpleNamespace(cursor=_Cursor))
+
+            def in_transaction(self):
+                return in_transaction
+
+            def begin(self):
+                return _Transaction()
+
+        assert copy_into(_Connection(), copy_table, [{"id": 1}]) == 1
+
+        copy_events = [("copy", "1\n"), "close"]
+        assert events == (copy_events if in_transaction else ["begin", *copy_events, "commit"])
+
+    @pytest.mark.parametrize("binary", [False, True], ids=["text", "binary"])
+    @test_only_with_dialects("postgresql")
+    def test_copy_into(self, conn, metadata, schema, binary):
+        table = Table(
+            "copy_into",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String),
+            Column("geom", Geometry(geometry_type="POINT", srid=4326)),
+            schema=schema,
+        )
+        if conn.dialect.driver not in ("psycopg", "psycopg2"):
+            pytest.skip("COPY is only supported with psycopg and psycopg2")
+        metadata.drop_all(conn, checkfirst=True)
+        metadata.create_all(conn)
+
+        rows = (
+            {"id": i, "name": f"point\t{i}", "geom": value}
+            for i, value in enumerate(
+                [
+                    WKTElement("POINT(1 2)", srid=4326),
+                    WKBElement(bytes.fromhex(EWKB_HEX)),
+                    Point(1, 2),
+                    "SRID=4326;POINT(1 2)",
+                    None,
+                ]
+            )
+        )
+        assert copy_into(conn, table, rows, binary=binary) == 5
+
+        results = conn.execute(select(table.c.id, table.c.name, table.c.geom).order_by("id"))
+        for i, (row_id, name, geom) in enumerate(results):
+            assert row_id == i
+            assert name == f"point\t{i}"
+            if i == 4:
+                assert geom is None
+            else:
+                assert geom.srid == 4326
+                assert to_shape(geom).equals(Point(1, 2))
+
+        with pytest.raises(ArgumentError, match=r"column \(4326\)"):
+            copy_into(
+                conn,
+                table,
+                [{"id": 10, "geom": WKTElement("POINT(1 2)", srid=3857)}],
+                binary=binary,
+            )
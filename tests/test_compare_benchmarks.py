@@ -151,6 +151,58 @@ def test_parse_args_requires_both_junitxml_paths(tmp_path: Path) -> None:
     assert exc_info.value.code == 2
 
 
+def test_main_flags_extra_info_timing_regressions(tmp_path: Path) -> None:
+    nodeid = "tests/benchmarks/test_import.py::test_cold_import[geoalchemy2]"
+    base_json = tmp_path / "base.json"
+    compare_json = tmp_path / "compare.json"
+    for path, functions_time in [(base_json, 0.01), (compare_json, 0.02)]:
+        path.write_text(
+            json.dumps(
+                {
+                    "benchmarks": [
+                        {
+                            "fullname": nodeid,
+                            "stats": {"mean": 1.0},
+                            "extra_info": {
+                                "module_import_times": {
+                                    "geoalchemy2.functions": functions_time,
+                                    "geoalchemy2.types": 0.01,
+                                }
+                            },
+                        }
+                    ]
+                }
+            ),
+            encoding="utf-8",
+        )
+    output = tmp_path / "comparison"
+
+    result = compare_benchmarks.main(
+        [
+            "--base",
+            str(base_json),
+            "--compare",
+            str(compare_json),
+            "--output",
+            str(output),
+            "--extra-info-timings",
+            "module_import_times",
+            "--fail-on-slower-percent",
+            "50",
+            "--no-charts",
+        ]
+    )
+
+    comparison = json.loads((output / "comparison.json").read_text(encoding="utf-8"))
+    statuses = {benchmark["name"]: benchmark["status"] for benchmark in comparison["benchmarks"]}
+    assert result == 1
+    assert statuses == {
+        nodeid: "similar",
+        f"{nodeid}[module_import_times:geoalchemy2.functions]": "slower",
+        f"{nodeid}[module_import_times:geoalchemy2.types]": "similar",
+    }
+
+
 def _nodeid(name: str) -> str:
     return f"tests/benchmarks/test_insert_select.py::{name}"
 
@@ -1,3 +1,4 @@
+import pickle
 import re
 import struct
 from itertools import permutations
@@ -16,6 +17,7 @@ from geoalchemy2 import _wkb_wkt
 from geoalchemy2.elements import CompositeElement
 from geoalchemy2.elements import DynamicWKBElement
 from geoalchemy2.elements import DynamicWKTElement
+from geoalchemy2.elements import LazyWKBElement
 from geoalchemy2.elements import RasterElement
 from geoalchemy2.elements import WKBElement
 from geoalchemy2.elements import WKTElement
@@ -759,6 +761,233 @@ class TestWKBElement:
         assert len({a, b, c}) == 2
 
 
+class TestWKBElementComparison:
+    _ewkb = bytes.fromhex("010100002003000000000000000000f03f0000000000000040")
+
+    @pytest.fixture
+    def count_hex_conversions(self, monkeypatch):
+        calls = []
+        wkb_to_hex = WKBElement._wkb_to_hex
+
+        def counting_wkb_to_hex(data):
+            calls.append(data)
+            return wkb_to_hex(data)
+
+        monkeypatch.setattr(WKBElement, "_wkb_to_hex", staticmethod(counting_wkb_to_hex))
+        return calls
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            _ewkb,
+            bytearray(_ewkb),
+            memoryview(_ewkb),
+            memoryview(bytearray(_ewkb)),
+            _ewkb.hex(),
+            _ewkb.hex().upper(),
+        ],
+    )
+    def test_eq_hash_use_raw_data(self, count_hex_conversions, data):
+        a = WKBElement(self._ewkb)
+        b = WKBElement(data)
+        c = LazyWKBElement(data)
+
+        assert a == b == c
+        assert hash(a) == hash(b) == hash(c)
+        assert len({a, b, c}) == 1
+        assert a != WKBElement(self._ewkb, srid=4326)
+        assert a != WKBElement(self._ewkb, extended=False)
+        assert count_hex_conversions == []
+
+    def test_eq_invalid_hex_data(self):
+        assert WKBElement("ZZZZZZ", extended=False) == WKBElement("zzzzzz", extended=False)
+        assert WKBElement("ZZZZZZ", extended=False) != WKBElement(b"ZZZZZZ", extended=False)
+        assert (
+            len({WKBElement("ZZZZZZ", extended=False), WKBElement("zzzzzz", extended=False)}) == 1
+        )
+
+    def test_desc_not_cached_by_default(self, count_hex_conversions):
+        e = WKBElement(self._ewkb)
+        assert e.desc == e.desc == self._ewkb.hex()
+        assert len(count_hex_conversions) == 2
+        assert not hasattr(e, "_desc")
+
+    def test_desc_cached(self, monkeypatch, count_hex_conversions):
+        monkeypatch.setattr(WKBElement, "memoize_desc", True)
+        e = WKBElement(self._ewkb)
+        assert e.desc == e.desc == self._ewkb.hex()
+        assert len(count_hex_conversions) == 1
+
+        e.data = bytes.fromhex("0101000000000000000000f03f0000000000000040")
+        assert e.desc == "0101000000000000000000f03f0000000000000040"
+        assert len(count_hex_conversions) == 2
+
+    def test_desc_not_cached_for_mutable_buffers(self, monkeypatch):
+        monkeypatch.setattr(WKBElement, "memoize_desc", True)
+        data = bytearray(self._ewkb)
+        e = WKBElement(data)
+        assert e.desc == self._ewkb.hex()
+
+        data[-1] = 0
+        assert e.desc == self._ewkb[:-1].hex() + "00"
+
+    def test_pickle_unpickle(self):
+        e = WKBElement(self._ewkb)
+        assert e.desc == self._ewkb.hex()
+        unpickled = pickle.loads(pickle.dumps(e))
+        assert unpickled == e
+        assert unpickled.desc == e.desc
+
+
+class TestWKBElementFromMany:
+    _wkb = bytes.fromhex("0101000000000000000000f03f0000000000000040")
+    _ewkb = bytes.fromhex("0101000020e6100000000000000000f03f0000000000000040")
+    _zero_srid_ewkb = bytes.fromhex("010100002000000000000000000000f03f0000000000000040")
+
+    @pytest.mark.parametrize("srid", [-1, 0, 4326, 3857])
+    @pytest.mark.parametrize("extended", [None, True, False])
+    def test_same_as_constructor(self, srid, extended):
+        buffers = [
+            self._wkb,
+            self._ewkb,
+            memoryview(self._ewkb),
+            self._ewkb.hex(),
+            self._zero_srid_ewkb,
+            b"\x01\x02",
+            None,
+        ]
+        if extended is True:
+            # The header must be valid to read the SRID of EWKB values
+            buffers = [i for i in buffers if i != b"\x01\x02"]
+
+        elements = WKBElement.from_many(buffers, srid=srid, extended=extended)
+
+        assert len(elements) == len(buffers)
+        for element, data in zip(elements, buffers, strict=True):
+            if data is None:
+                assert element is None
+                continue
+            expected = WKBElement(data, srid=srid, extended=extended)
+            assert type(element) is WKBElement
+            assert element.data is data
+            assert element.srid == expected.srid
+            assert element.extended == expected.extended
+
+    def test_invalid_extended_header(self):
+        with pytest.raises(ValueError):
+            WKBElement.from_many([b"\x01\x02"], extended=True)
+
+    def test_subclass(self):
+        elements = DynamicWKBElement.from_many([self._ewkb], extended=True)
+        assert type(elements[0]) is DynamicWKBElement
+        assert elements[0].srid == 4326
+
+    def test_subclass_with_custom_init(self):
+        class CustomWKBElement(WKBElement):
+            __slots__ = ()
+
+            def __init__(self, data, srid=-1, extended=None):
+                super().__init__(data, srid=3857, extended=extended)
+
+        elements = CustomWKBElement.from_many([self._ewkb, None], srid=4326)
+        assert elements[0].srid == 3857
+        assert elements[1] is None
+
+    def test_iterable(self):
+        elements = WKBElement.from_many(iter([self._ewkb]), srid=4326, extended=True)
+        assert elements == [WKBElement(self._ewkb, srid=4326, extended=True)]
+
+
+class TestLazyWKBElement:
+    _ewkb = bytes.fromhex("0101000020e6100000000000000000f03f0000000000000040")
+
+    @pytest.fixture
+    def count_header_parsing(self, monkeypatch):
+        calls = []
+        wkb_srid = _wkb_wkt.wkb_srid
+
+        def counting_wkb_srid(*args, **kwargs):
+            calls.append(args)
+            return wkb_srid(*args, **kwargs)
+
+        monkeypatch.setattr(_wkb_wkt, "wkb_srid", counting_wkb_srid)
+        return calls
+
+    def test_header_parsed_on_first_access(self, count_header_parsing):
+        e = LazyWKBElement(self._ewkb)
+        assert e.data is self._ewkb
+        assert e.desc == self._ewkb.hex()
+        assert count_header_parsing == []
+
+        assert e.srid == 4326
+        assert e.extended is True
+        assert len(count_header_parsing) == 1
+
+    def test_known_header(self, count_header_parsing):
+        e = LazyWKBElement(self._ewkb, srid=4326, extended=True)
+        assert e.srid == 4326
+        assert e.extended is True
+        assert count_header_parsing == []
+
+    @pytest.mark.parametrize("srid", [-1, 4326, 3857])
+    @pytest.mark.parametrize("extended", [None, True, False])
+    @pytest.mark.parametrize(
+        "data",
+        [
+            _ewkb,
+            _ewkb.hex(),
+            memoryview(_ewkb),
+            bytes.fromhex("0101000000000000000000f03f0000000000000040"),
+        ],
+    )
+    def test_same_as_wkb_element(self, data, srid, extended):
+        lazy = LazyWKBElement(data, srid=srid, extended=extended)
+        eager = WKBElement(data, srid=srid, extended=extended)
+
+        assert isinstance(lazy, WKBElement)
+        assert lazy.srid == eager.srid
+        assert lazy.extended == eager.extended
+        assert lazy == eager
+        assert eager == lazy
+        assert hash(lazy) == hash(eager)
+        assert len({lazy, eager}) == 1
+
+    def test_set_attributes(self):
+        e = LazyWKBElement(self._ewkb)
+        e.srid = 3857
+        assert e.srid == 3857
+        assert e.extended is True
+
+        e = LazyWKBElement(self._ewkb)
+        e.extended = False
+        assert e.srid == 4326
+        assert e.extended is False
+
+    def test_pickle_unpickle(self):
+        e = LazyWKBElement(self._ewkb)
+        unpickled = pickle.loads(pickle.dumps(e))
+
+        assert type(unpickled) is LazyWKBElement
+        assert unpickled.srid == 4326
+        assert unpickled.extended is True
+        assert unpickled == e
+        assert unpickled == WKBElement(self._ewkb)
+        assert pickle.dumps(unpickled) == pickle.dumps(e)
+
+    def test_invalid_header_raised_on_access(self):
+        e = LazyWKBElement(b"\x01\x02", extended=True)
+        with pytest.raises(ValueError):
+            e.srid  # noqa: B018
+
+    def test_function_call(self):
+        e = LazyWKBElement(self._ewkb)
+        f = e.ST_Buffer(2)
+        eq_sql(
+            f,
+            "ST_Buffer(ST_GeomFromEWKB(:ST_GeomFromEWKB_1), :ST_Buffer_1)",
+        )
+
+
 class TestNotEqualSpatialElement:
     # _bin/_hex computed by following query:
     # SELECT ST_GeomFromEWKT('SRID=3;POINT(1 2)');
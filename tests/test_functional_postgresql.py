@@ -17,8 +17,11 @@ from sqlalchemy import Column
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
 from sqlalchemy import String
+from sqlalchemy import Table
 from sqlalchemy import __version__ as SA_VERSION
 from sqlalchemy import bindparam
+from sqlalchemy import create_mock_engine
+from sqlalchemy import inspect
 from sqlalchemy import text
 from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
 from sqlalchemy.exc import InternalError
@@ -29,6 +32,8 @@ from sqlalchemy.sql.expression import type_coerce
 from geoalchemy2 import Geography
 from geoalchemy2 import Geometry
 from geoalchemy2 import Raster
+from geoalchemy2.admin import build_deferred_spatial_indexes
+from geoalchemy2.admin.dialects import postgresql as postgresql_admin
 from geoalchemy2.elements import RasterElement
 from geoalchemy2.elements import WKBElement
 from geoalchemy2.elements import WKTElement
@@ -706,3 +711,283 @@ class TestSTSummaryStatsAgg:
 
         # Check the result
         assert res == [(15, 15.0, 0.0, 1.0, 1.0)]
+
+
+class TestReflectionCache:
+    class Bind:
+        def __init__(self, rows):
+            self.rows = rows
+            self.queries = []
+
+        def execute(self, query):
+            self.queries.append(query)
+            return iter(self.rows)
+
+    class Inspector:
+        def __init__(self, bind):
+            self.bind = bind
+            self.info_cache = {}
+
+    def test_spatial_indexes_are_fetched_once_per_schema(self):
+        bind = self.Bind(
+            [
+                (
+                    "lake",
+                    ["geom"],
+                    "CREATE INDEX idx_lake_geom ON gis.lake USING gist (geom)",
+                    "gist",
+                    None,
+                ),
+                (
+                    "ocean",
+                    [],
+                    "CREATE INDEX idx_ocean_rast ON gis.ocean USING gist (st_convexhull(rast))",
+                    "gist",
+                    None,
+                ),
+            ]
+        )
+        inspector = self.Inspector(bind)
+        metadata = MetaData()
+        columns = [
+            (Table("lake", metadata, schema="gis"), "geom", Geometry),
+            (Table("lake", metadata, schema="gis"), "other_geom", Geometry),
+            (Table("ocean", metadata, schema="gis"), "rast", Raster),
+            (Table("river", metadata, schema="gis"), "geom", Geometry),
+        ]
+
+        spatial_indexes = []
+        for table, col_name, type_ in columns:
+            column_info = {"name": col_name, "type": type_()}
+            postgresql_admin.reflect_geometry_column(inspector, table, column_info)
+            spatial_indexes.append(column_info["type"].spatial_index)
+
+        assert spatial_indexes == [True, False, True, False]
+        assert len(bind.queries) == 1
+        assert bind.queries[0].compile().params == {"schema": "gis"}
+
+    def test_index_method_is_reflected(self):
+        bind = self.Bind(
+            [
+                (
+                    "gps",
+                    ["geom"],
+                    "CREATE INDEX idx_gps_geom ON gis.gps USING brin "
+                    "(geom brin_geometry_inclusion_ops_4d) WITH (pages_per_range='32')",
+                    "brin",
+                    ["pages_per_range=32"],
+                ),
+                (
+                    "gps",
+                    ["point"],
+                    "CREATE INDEX idx_gps_point ON gis.gps USING spgist (point)",
+                    "spgist",
+                    None,
+                ),
+            ]
+        )
+        inspector = self.Inspector(bind)
+        table = Table("gps", MetaData(), schema="gis")
+
+        geom_info = {"name": "geom", "type": Geometry()}
+        postgresql_admin.reflect_geometry_column(inspector, table, geom_info)
+        point_info = {"name": "point", "type": Geometry()}
+        postgresql_admin.reflect_geometry_column(inspector, table, point_info)
+
+        assert geom_info["type"].spatial_index_method == "brin"
+        assert geom_info["type"].spatial_index_opclass == "brin_geometry_inclusion_ops_4d"
+        assert geom_info["type"].spatial_index_with == (("pages_per_range", "32"),)
+        assert point_info["type"].spatial_index_method == "spgist"
+        assert point_info["type"].spatial_index_opclass is None
+        assert point_info["type"].spatial_index_with is None
+
+
+class TestSpatialIndexMethod:
+    @pytest.mark.parametrize(
+        "type_kwargs,expected",
+        [
+            pytest.param({}, "USING gist (geom)", id="default"),
+            pytest.param(
+                {"use_N_D_index": True, "spatial_index_method": "spgist"},
+                "USING spgist (geom spgist_geometry_ops_nd)",
+                id="spgist_nd",
+            ),
+            pytest.param(
+                {
+                    "spatial_index_method": "brin",
+                    "spatial_index_opclass": "brin_geometry_inclusion_ops_2d",
+                    "spatial_index_with": {"pages_per_range": 32},
+                },
+                "USING brin (geom brin_geometry_inclusion_ops_2d) WITH (pages_per_range = 32)",
+                id="brin",
+            ),
+        ],
+    )
+    def test_create_index(self, metadata, type_kwargs, expected):
+        statements = []
+        engine = create_mock_engine(
+            "postgresql://",
+            lambda sql, *args, **kwargs: statements.append(
+                str(sql.compile(dialect=engine.dialect))
+            ),
+        )
+        Table(
+            "gps",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("geom", Geometry(geometry_type="POINT", srid=4326, **type_kwargs)),
+        )
+
+        metadata.create_all(engine, checkfirst=False)
+
+        assert [i for i in statements if "CREATE INDEX" in i] == [
+            f"CREATE INDEX idx_gps_geom ON gps {expected}"
+        ]
+
+    def test_unknown_method(self):
+        with pytest.raises(ArgumentError, match="spatial_index_method must be one of"):
+            Geometry(spatial_index_method="hash")
+
+
+class TestDeferredSpatialIndex:
+    class Bind:
+        def __init__(self, existing_indexes=None):
+            self.dialect = PGDialect_psycopg2()
+            self.existing_indexes = existing_indexes or {}
+            self.statements = []
+
+        def execute(self, query, params=None):
+            self.statements.append((str(query), params))
+            return self
+
+        def fetchall(self):
+            # Only the result of the index validity query is used
+            return list(self.existing_indexes.items())
+
+        def exec_driver_sql(self, statement):
+            self.statements.append((statement, None))
+
+    @pytest.fixture
+    def deferred_table(self, metadata):
+        return Table(
+            "deferred_lake",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("geom", Geometry(geometry_type="POINT", srid=4326, spatial_index="deferred")),
+            Column("rast", Raster(spatial_index="deferred")),
+        )
+
+    def test_index_is_not_created_with_the_table(self, metadata, deferred_table):
+        statements = []
+        engine = create_mock_engine(
+            "postgresql://",
+            lambda sql, *args, **kwargs: statements.append(
+                str(sql.compile(dialect=engine.dialect))
+            ),
+        )
+
+        metadata.create_all(engine, checkfirst=False)
+
+        assert not [i for i in statements if "CREATE INDEX" in i]
+        assert sorted(i.name for i in deferred_table.indexes) == [
+            "idx_deferred_lake_geom",
+            "idx_deferred_lake_rast",
+        ]
+
+    def test_build_statements(self, metadata, deferred_table):
+        bind = self.Bind()
+
+        names = postgresql_admin.build_deferred_spatial_indexes(
+            bind, metadata, maintenance_work_mem="1GB"
+        )
+
+        assert names == ["idx_deferred_lake_geom", "idx_deferred_lake_rast"]
+        assert "pg_index" in bind.statements[0][0]
+        assert bind.statements[0][1] == {
+            "names": ["idx_deferred_lake_geom", "idx_deferred_lake_rast"]
+        }
+        assert bind.statements[1:] == [
+            ("SELECT set_config('maintenance_work_mem', :value, false)", {"value": "1GB"}),
+            (
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_deferred_lake_geom "
+                "ON deferred_lake USING gist (geom)",
+                None,
+            ),
+            (
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_deferred_lake_rast "
+                "ON deferred_lake USING gist (ST_ConvexHull(rast))",
+                None,
+            ),
+            ("RESET maintenance_work_mem", None),
+        ]
+        # The index metadata is not altered
+        for idx in deferred_table.indexes:
+            assert not idx.dialect_options["postgresql"]["concurrently"]
+
+    def test_build_statements_existing_indexes(self, metadata, deferred_table):
+        bind = self.Bind({"idx_deferred_lake_geom": True, "idx_deferred_lake_rast": False})
+
+        names = postgresql_admin.build_deferred_spatial_indexes(bind, metadata)
+
+        # The valid index is skipped and the invalid one is built again
+        assert names == ["idx_deferred_lake_rast"]
+        assert bind.statements[1:] == [
+            ("\nDROP INDEX CONCURRENTLY IF EXISTS idx_deferred_lake_rast", None),
+            (
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_deferred_lake_rast "
+                "ON deferred_lake USING gist (ST_ConvexHull(rast))",
+                None,
+            ),
+        ]
+
+    def test_build_statements_not_concurrently(self, metadata, deferred_table):
+        for idx in deferred_table.indexes:
+            idx.dialect_options["postgresql"]["concurrently"] = True
+        bind = self.Bind({"idx_deferred_lake_rast": False})
+
+        postgresql_admin.build_deferred_spatial_indexes(bind, metadata, concurrently=False)
+
+        assert bind.statements[1:] == [
+            (
+                "CREATE INDEX IF NOT EXISTS idx_deferred_lake_geom "
+                "ON deferred_lake USING gist (geom)",
+                None,
+            ),
+            ("\nDROP INDEX IF EXISTS idx_deferred_lake_rast", None),
+            (
+                "CREATE INDEX IF NOT EXISTS idx_deferred_lake_rast "
+                "ON deferred_lake USING gist (ST_ConvexHull(rast))",
+                None,
+            ),
+        ]
+        # The index metadata is not altered
+        for idx in deferred_table.indexes:
+            assert idx.dialect_options["postgresql"]["concurrently"]
+
+    def test_build_statements_all_indexes_exist(self, metadata, deferred_table):
+        bind = self.Bind({"idx_deferred_lake_geom": True, "idx_deferred_lake_rast": True})
+
+        assert postgresql_admin.build_deferred_spatial_indexes(bind, metadata) == []
+        assert len(bind.statements) == 1
+
+    def test_build(self, engine, metadata, deferred_table):
+        metadata.drop_all(engine, checkfirst=True)
+        metadata.create_all(engine)
+        try:
+            with engine.connect() as conn:
+                assert not inspect(conn).get_indexes("deferred_lake")
+
+            names = build_deferred_spatial_indexes(
+                engine, metadata, max_workers=2, maintenance_work_mem="64MB"
+            )
+
+            assert names == ["idx_deferred_lake_geom", "idx_deferred_lake_rast"]
+            with engine.connect() as conn:
+                indexes = inspect(conn).get_indexes("deferred_lake")
+                assert sorted(i["name"] for i in indexes) == names
+                assert conn.execute(text("SHOW maintenance_work_mem")).scalar() != "64MB"
+
+            # The existing indexes are skipped
+            assert build_deferred_spatial_indexes(engine, metadata) == []
+        finally:
+            metadata.drop_all(engine, checkfirst=True)
@@ -11,6 +11,8 @@ from sqlalchemy import MetaData
 from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy import inspect
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import OperationalError
@@ -962,3 +964,178 @@ class TestReflection:
             "lake_z",
             "lake_zm",
         ]
+
+
+class TestReflectionCache:
+    @pytest.fixture
+    def engine(self):
+        # The SpatiaLite metadata table is mimicked so the reflection can run without SpatiaLite
+        engine = create_engine("sqlite://")
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    """CREATE TABLE geometry_columns (
+                        f_table_name TEXT,
+                        f_geometry_column TEXT,
+                        geometry_type TEXT,
+                        coord_dimension TEXT,
+                        srid INTEGER,
+                        spatial_index_enabled INTEGER
+                    )"""
+                )
+            )
+            for table_name in ["lake", "river", "road"]:
+                connection.execute(
+                    text(f"CREATE TABLE {table_name} (id INTEGER PRIMARY KEY, geom GEOMETRY)")
+                )
+                connection.execute(
+                    text(
+                        "INSERT INTO geometry_columns VALUES "
+                        f"('{table_name}', 'geom', 'LINESTRING', 'XYZ', 4326, 1)"
+                    )
+                )
+        return engine
+
+    def test_spatial_columns_are_fetched_once(self, engine, use_alembic_monkeypatch):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        metadata = MetaData()
+        with engine.connect() as connection:
+            event.listen(connection, "before_cursor_execute", before_cursor_execute)
+            metadata.reflect(connection)
+            indexes = inspect(connection).get_indexes("lake")
+
+        for table_name in ["lake", "river", "road"]:
+            type_ = metadata.tables[table_name].c.geom.type
+            assert isinstance(type_, Geometry)
+            assert type_.geometry_type == "LINESTRINGZ"
+            assert type_.dimension == 3
+            assert type_.srid == 4326
+            assert type_.spatial_index
+        assert indexes == [
+            {
+                "name": "idx_lake_geom",
+                "column_names": ["geom"],
+                "unique": 0,
+                "dialect_options": {"_column_flag": True},
+            }
+        ]
+        # One query for the reflection and one for the new inspector
+        assert len([i for i in statements if 'FROM "geometry_columns"' in i]) == 2
+
+
+class TestBatchedSpatialDDL:
+    @pytest.fixture
+    def calls(self):
+        return []
+
+    @pytest.fixture
+    def engine(self, calls):
+        # The SpatiaLite functions are mimicked so the DDL can run without SpatiaLite
+        engine = create_engine("sqlite://")
+
+        @event.listens_for(engine, "connect")
+        def connect(dbapi_conn, connection_record):
+            for name, nargs in [
+                ("RecoverGeometryColumn", 5),
+                ("CreateSpatialIndex", 2),
+                ("DisableSpatialIndex", 2),
+                ("DiscardGeometryColumn", 2),
+            ]:
+                dbapi_conn.create_function(
+                    name, nargs, lambda *args, name=name: calls.append((name, *args)) or 1
+                )
+
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    """CREATE TABLE geometry_columns (
+                        f_table_name TEXT,
+                        f_geometry_column TEXT,
+                        geometry_type TEXT,
+                        coord_dimension TEXT,
+                        srid INTEGER,
+                        spatial_index_enabled INTEGER
+                    )"""
+                )
+            )
+        return engine
+
+    @pytest.fixture
+    def metadata(self):
+        metadata = MetaData()
+        for table_name in ["lake", "river", "road"]:
+            Table(
+                table_name,
+                metadata,
+                Column("id", Integer, primary_key=True),
+                Column("geom", Geometry(geometry_type="LINESTRING", srid=4326)),
+            )
+        return metadata
+
+    def test_create_drop_all(self, engine, metadata, calls):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with engine.begin() as connection:
+            connection = connection.execution_options(geoalchemy2_batch_spatial_ddl=True)
+            event.listen(connection, "before_cursor_execute", before_cursor_execute)
+            metadata.create_all(connection)
+
+            spatial_statements = [i for i in statements if "RecoverGeometryColumn" in i]
+            assert len(spatial_statements) == 1
+            assert "CreateSpatialIndex" in spatial_statements[0]
+            assert calls == [
+                call
+                for table_name in ["lake", "river", "road"]
+                for call in [
+                    ("RecoverGeometryColumn", table_name, "geom", 4326, "LINESTRING", "XY"),
+                    ("CreateSpatialIndex", table_name, "geom"),
+                ]
+            ]
+
+            # Register the columns as SpatiaLite would do
+            for table_name in ["lake", "river", "road"]:
+                connection.execute(
+                    text(
+                        "INSERT INTO geometry_columns VALUES "
+                        f"('{table_name}', 'geom', 'LINESTRING', 'XY', 4326, 1)"
+                    )
+                )
+            calls.clear()
+            statements.clear()
+            metadata.drop_all(connection)
+
+            spatial_statements = [i for i in statements if "DiscardGeometryColumn" in i]
+            assert len(spatial_statements) == 1
+            assert "DisableSpatialIndex" in spatial_statements[0]
+            assert sorted(calls) == sorted(
+                [
+                    ("DisableSpatialIndex", table_name, "geom")
+                    for table_name in ["lake", "river", "road"]
+                ]
+                + [
+                    ("DiscardGeometryColumn", table_name, "geom")
+                    for table_name in ["lake", "river", "road"]
+                ]
+            )
+            assert inspect(connection).get_table_names() == ["geometry_columns"]
+
+    def test_not_batched_by_default(self, engine, metadata, calls):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with engine.begin() as connection:
+            event.listen(connection, "before_cursor_execute", before_cursor_execute)
+            metadata.create_all(connection)
+
+        assert len(calls) == 6
+        assert len([i for i in statements if "RecoverGeometryColumn" in i]) == 3
+        assert len([i for i in statements if "CreateSpatialIndex" in i]) == 3
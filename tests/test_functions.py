@@ -1,8 +1,12 @@
 import re
 from pathlib import Path
 
+import pytest
+from sqlalchemy import Integer
 from sqlalchemy import select
+from sqlalchemy.exc import SAWarning
 from sqlalchemy.sql import func
+from sqlalchemy.sql import functions as sqlalchemy_functions
 
 import geoalchemy2.functions
 from geoalchemy2._functions_helpers import _generate_stubs
@@ -66,6 +70,70 @@ def test_predefined_function() -> None:
     )
 
 
+@pytest.fixture
+def lazy_function(monkeypatch):
+    name = "ST_LazyTestFunction"
+    identifier = name.lower()
+    monkeypatch.setitem(
+        geoalchemy2.functions._LAZY_FUNCTIONS, identifier, (name, Integer, "A lazy function.")
+    )
+    monkeypatch.setitem(geoalchemy2.functions._FUNCTION_NAMES, identifier, name)
+    sqlalchemy_functions.register_function(identifier, geoalchemy2.functions._LazyFunction(name))
+    yield name
+    sqlalchemy_functions._registry["_default"].pop(identifier, None)
+    vars(geoalchemy2.functions).pop(name, None)
+
+
+def test_lazy_function_created_by_func(lazy_function) -> None:
+    assert lazy_function not in vars(geoalchemy2.functions)
+
+    expr = getattr(func, lazy_function)(1)
+
+    assert type(expr) is getattr(geoalchemy2.functions, lazy_function)
+    assert isinstance(expr.type, Integer)
+    assert "A lazy function." in type(expr).__doc__
+
+
+def test_lazy_function_created_by_module_attribute(lazy_function) -> None:
+    cls = getattr(geoalchemy2.functions, lazy_function)
+
+    assert vars(geoalchemy2.functions)[lazy_function] is cls
+    assert type(getattr(func, lazy_function)(1)) is cls
+
+
+def test_lazy_function_keeps_user_function(lazy_function) -> None:
+    with pytest.warns(SAWarning, match="is already registered"):
+        user_function = type(lazy_function, (geoalchemy2.functions.GenericFunction,), {})
+
+    cls = getattr(geoalchemy2.functions, lazy_function)
+
+    assert cls is not user_function
+    assert type(getattr(func, lazy_function)(1)) is user_function
+
+
+def test_lazy_function_subclass(lazy_function) -> None:
+    cls = getattr(geoalchemy2.functions, lazy_function)
+    subclass = type("ST_LazyTestSubclass", (cls,), {})
+
+    try:
+        assert type(func.ST_LazyTestSubclass(1)) is subclass
+    finally:
+        sqlalchemy_functions._registry["_default"].pop("st_lazytestsubclass", None)
+
+
+def test_lazy_functions_use_default_registry() -> None:
+    registry = sqlalchemy_functions._registry["_default"]
+
+    assert type(registry) is dict
+    assert isinstance(registry["st_buffer"], geoalchemy2.functions._LazyFunction)
+    assert "genericfunction" not in registry
+
+
+def test_unknown_function_attribute() -> None:
+    with pytest.raises(AttributeError):
+        geoalchemy2.functions.ST_UnknownFunction  # noqa: B018
+
+
 #
 # Geometry Constructors
 #
@@ -1,7 +1,9 @@
 import importlib
 import sys
 
+import numpy as np
 import pytest
+import shapely
 import shapely.wkb
 from shapely.geometry import Point
 
@@ -9,7 +11,9 @@ import geoalchemy2.shape
 from geoalchemy2.elements import WKBElement
 from geoalchemy2.elements import WKTElement
 from geoalchemy2.shape import from_shape
+from geoalchemy2.shape import from_shapes
 from geoalchemy2.shape import to_shape
+from geoalchemy2.shape import to_shapes
 
 
 def test_import_without_shapely(monkeypatch):
@@ -50,6 +54,19 @@ def test_import_without_shapely(monkeypatch):
     assert CHECK_COMPLETE == 2
 
 
+def test_import_without_numpy(monkeypatch):
+    """Ensure the Shapely functions do not need NumPy, which Shapely 1 does not depend on."""
+    try:
+        with monkeypatch.context() as m:
+            m.setitem(sys.modules, "numpy", None)
+            importlib.reload(geoalchemy2.shape)
+
+            assert geoalchemy2.shape.HAS_SHAPELY
+            assert geoalchemy2.shape.to_shape(WKTElement("SRID=3857;POINT(1 2)")) == Point(1, 2)
+    finally:
+        importlib.reload(geoalchemy2.shape)
+
+
 def test_check_shapely(monkeypatch):
     @geoalchemy2.shape.check_shapely()
     def f():
@@ -154,3 +171,67 @@ def test_from_shape():
     s3 = shapely.wkb.loads(bytes(e3.data))
     assert isinstance(s, Point)
     assert s3.equals(p)
+
+
+def test_to_shapes():
+    elements = [
+        WKBElement(
+            b"\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\x00@"
+        ),
+        WKBElement("0101000000000000000000f03f0000000000000040"),
+        WKBElement(memoryview(bytes.fromhex("0101000020110f0000000000000000f03f0000000000000040"))),
+        None,
+        WKTElement("SRID=3857;POINT(1 2)", extended=True),
+        WKTElement("POINT(1 2)"),
+    ]
+    shapes = to_shapes(elements)
+
+    assert isinstance(shapes, np.ndarray)
+    assert shapes.dtype == object
+    assert len(shapes) == len(elements)
+    assert shapes[3] is None
+    for element, shape in zip(elements, shapes, strict=True):
+        if element is not None:
+            assert isinstance(shape, Point)
+            assert shape.equals(to_shape(element))
+
+
+def test_to_shapes_empty():
+    assert len(to_shapes([])) == 0
+
+
+def test_to_shapes_wrong_type():
+    with pytest.raises(TypeError, match="Only WKBElement and WKTElement objects are supported"):
+        to_shapes([WKTElement("POINT(1 2)"), 0])
+
+
+@pytest.mark.parametrize(
+    ("srid", "extended"), [(-1, False), (2154, False), (2154, True), (2154, None)]
+)
+@pytest.mark.parametrize("as_array", [True, False])
+def test_from_shapes(srid, extended, as_array):
+    shapes = [Point(1, 2), None, shapely.LineString([(0, 0), (1, 1)]), Point(1, 2, 3)]
+    if as_array:
+        shapes = np.array(shapes, dtype=object)
+    elements = from_shapes(shapes, srid=srid, extended=extended)
+
+    assert len(elements) == len(shapes)
+    assert elements[1] is None
+    for shape, element in zip(shapes, elements, strict=True):
+        if shape is not None:
+            assert isinstance(element, WKBElement)
+            assert element == from_shape(shape, srid=srid, extended=extended)
+            assert to_shape(element).equals(shape)
+
+
+def test_from_shapes_to_shapes_roundtrip():
+    points = shapely.points(np.arange(20).reshape(10, 2))
+    assert all(shapely.equals(to_shapes(from_shapes(points, srid=4326, extended=True)), points))
+
+
+def test_vectorized_functions_need_shapely_2(monkeypatch):
+    monkeypatch.delattr(shapely, "from_wkb")
+    with pytest.raises(ImportError, match="Shapely>=2"):
+        to_shapes([])
+    with pytest.raises(ImportError, match="Shapely>=2"):
+        from_shapes([])
@@ -2,9 +2,12 @@ import re
 
 import pytest
 from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import LargeBinary
 from sqlalchemy import MetaData
 from sqlalchemy import Table
 from sqlalchemy import bindparam
+from sqlalchemy import cast
 from sqlalchemy.dialects import mysql
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects import sqlite
@@ -13,16 +16,23 @@ from sqlalchemy.sql import func
 from sqlalchemy.sql import insert
 from sqlalchemy.sql import text
 
+import geoalchemy2.functions
+import geoalchemy2.types
 from geoalchemy2 import _wkb_wkt
 from geoalchemy2._wkb_wkt import is_known_srid
 from geoalchemy2.admin.dialects import mariadb as _mariadb_admin  # noqa: F401
 from geoalchemy2.admin.dialects import mysql as _mysql_admin  # noqa: F401
+from geoalchemy2.elements import LazyWKBElement
+from geoalchemy2.elements import RasterElement
 from geoalchemy2.elements import WKBElement
 from geoalchemy2.elements import WKTElement
 from geoalchemy2.exc import ArgumentError
 from geoalchemy2.types import Geography
 from geoalchemy2.types import Geometry
 from geoalchemy2.types import Raster
+from geoalchemy2.types import _DummyGeometry
+from geoalchemy2.types import dialects as types_dialects
+from geoalchemy2.types.dialects.common import accepts_buffers
 from geoalchemy2.types.dialects.common import as_binary_ewkb
 from geoalchemy2.types.dialects.common import as_binary_wkb
 from geoalchemy2.types.dialects.common import as_ewkb_hex
@@ -31,6 +41,7 @@ from geoalchemy2.types.dialects.common import is_ewkb_constructor
 from geoalchemy2.types.dialects.common import is_wkb_constructor
 from geoalchemy2.types.dialects.common import validate_wkb_srid
 
+from . import compile_w_cache
 from . import select
 
 WKB_HEX = "0101000000000000000000f03f0000000000000040"
@@ -446,6 +457,204 @@ class TestGeometryCollection:
         assert g.get_col_spec() == "geometry(GEOMETRYCOLLECTION,900913)"
 
 
+class TestResultProcessor:
+    @pytest.mark.parametrize(
+        ("spatial_type", "dialect", "value", "expected_srid", "expected_extended"),
+        [
+            (Geometry(srid=4326), postgresql.dialect(), EWKB_HEX, 4326, True),
+            (Geometry(), postgresql.dialect(), EWKB_HEX, 4326, True),
+            (Geometry(), postgresql.dialect(), ZERO_SRID_EWKB_HEX, -1, True),
+            (Geography(srid=4326), postgresql.dialect(), WKB_HEX, 4326, False),
+            (Geography(), postgresql.dialect(), WKB_HEX, -1, False),
+            (Geometry(srid=4326), mysql.dialect(), WKB_HEX, 4326, False),
+            (Geometry(), mysql.dialect(), EWKB_HEX, 4326, True),
+            (Geometry(srid=0), sqlite.dialect(), EWKB_HEX, 4326, True),
+        ],
+    )
+    def test_process(self, spatial_type, dialect, value, expected_srid, expected_extended):
+        data = bytes.fromhex(value)
+        processor = spatial_type.result_processor(dialect, None)
+        element = processor(data)
+
+        assert isinstance(element, WKBElement)
+        assert element.data is data
+        assert element.srid == expected_srid
+        assert element.extended == expected_extended
+        assert processor(None) is None
+
+    def test_fixed_srid_skips_header_parsing(self, monkeypatch):
+        def wkb_srid(*args, **kwargs):
+            raise AssertionError("The EWKB header should not be parsed")
+
+        monkeypatch.setattr(_wkb_wkt, "wkb_srid", wkb_srid)
+        processor = Geometry(srid=4326).result_processor(postgresql.dialect(), None)
+
+        element = processor(bytes.fromhex(EWKB_HEX))
+
+        assert element == WKBElement(bytes.fromhex(EWKB_HEX), srid=4326, extended=True)
+
+    def test_element_type_with_custom_init(self):
+        class CustomWKBElement(WKBElement):
+            __slots__ = ()
+
+            def __init__(self, data, srid=-1, extended=None):
+                super().__init__(data, srid=srid, extended=extended)
+                self.srid = 3857
+
+        class CustomGeometry(Geometry):
+            ElementType = CustomWKBElement
+            cache_ok = True
+
+        processor = CustomGeometry(srid=4326).result_processor(postgresql.dialect(), None)
+        element = processor(bytes.fromhex(EWKB_HEX))
+
+        assert isinstance(element, CustomWKBElement)
+        assert element.srid == 3857
+
+    def test_wkt_element_type(self):
+        class WKTGeometry(Geometry):
+            as_binary = "ST_AsText"
+            ElementType = WKTElement
+            cache_ok = True
+
+        processor = WKTGeometry(srid=4326).result_processor(postgresql.dialect(), None)
+        element = processor("POINT(1 2)")
+
+        assert isinstance(element, WKTElement)
+        assert element.srid == 4326
+        assert element.extended is False
+
+    def test_raster(self):
+        processor = Raster().result_processor(postgresql.dialect(), None)
+        assert processor(None) is None
+
+    @pytest.mark.parametrize("dialect", [postgresql.dialect(), mysql.dialect()])
+    @pytest.mark.parametrize("srid", [-1, 4326])
+    def test_lazy_elements(self, monkeypatch, dialect, srid):
+        data = bytes.fromhex(EWKB_HEX)
+        expected = Geometry(srid=srid).result_processor(dialect, None)(data)
+
+        def wkb_srid(*args, **kwargs):
+            raise AssertionError("The EWKB header should not be parsed")
+
+        monkeypatch.setattr(_wkb_wkt, "wkb_srid", wkb_srid)
+        spatial_type = Geometry(srid=srid, lazy_elements=True)
+        element = spatial_type.result_processor(dialect, None)(data)
+        elements = spatial_type.batch_result_processor(dialect)([data, None])
+        monkeypatch.undo()
+
+        for lazy in (element, elements[0]):
+            assert isinstance(lazy, LazyWKBElement)
+            assert lazy.data is data
+            assert lazy.srid == expected.srid
+            assert lazy.extended == expected.extended
+        assert elements[1] is None
+
+    def test_lazy_elements_not_used_for_other_element_types(self):
+        spatial_type = Raster()
+        spatial_type.lazy_elements = True
+        assert spatial_type._result_element_type() is RasterElement
+
+    @pytest.mark.parametrize(
+        "spatial_type",
+        [Geometry(srid=4326), Geometry(), Geography(srid=4326)],
+    )
+    @pytest.mark.parametrize("dialect", [postgresql.dialect(), mysql.dialect()])
+    def test_batch_process(self, spatial_type, dialect):
+        values = [bytes.fromhex(EWKB_HEX), None, bytes.fromhex(WKB_HEX)]
+        processor = spatial_type.result_processor(dialect, None)
+        batch_processor = spatial_type.batch_result_processor(dialect)
+
+        elements = batch_processor(values)
+
+        assert len(elements) == len(values)
+        for element, value in zip(elements, values, strict=True):
+            expected = processor(value)
+            if value is None:
+                assert element is None
+            else:
+                assert element.srid == expected.srid
+                assert element.extended == expected.extended
+                assert element.data is value
+
+    def test_batch_process_wkt_element_type(self):
+        class WKTGeometry(Geometry):
+            as_binary = "ST_AsText"
+            ElementType = WKTElement
+            cache_ok = True
+
+        batch_processor = WKTGeometry(srid=4326).batch_result_processor(postgresql.dialect())
+
+        assert batch_processor(["POINT(1 2)", None]) == [
+            WKTElement("POINT(1 2)", srid=4326, extended=False),
+            None,
+        ]
+
+
+class TestBindProcessor:
+    @pytest.mark.parametrize(
+        ("dialect", "dialect_module"),
+        [
+            (mysql.dialect(), types_dialects.mysql),
+            (mariadb_dialect.MariaDBDialect(), types_dialects.mariadb),
+            (postgresql.dialect(), types_dialects.postgresql),
+            (sqlite.dialect(), types_dialects.sqlite),
+            (_GeoPackageDialect(), types_dialects.geopackage),
+        ],
+        ids=["mysql", "mariadb", "postgresql", "sqlite", "geopackage"],
+    )
+    def test_constructor_resolved_once(self, monkeypatch, dialect, dialect_module):
+        processor = Geometry(srid=4326, from_text="ST_GeomFromEWKB").bind_processor(dialect)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("The constructor should be resolved only once")
+
+        for name in ["is_wkb_constructor", "is_ewkb_constructor", "select_dialect"]:
+            for module in [dialect_module, types_dialects.sqlite, geoalchemy2.types]:
+                monkeypatch.setattr(module, name, fail, raising=False)
+
+        wkb = bytes.fromhex(WKB_HEX)
+        assert processor(wkb) == processor(WKBElement(wkb, srid=4326))
+        assert processor(None) is None
+
+    def test_unknown_dialect(self):
+        class _UnknownDialect:
+            name = "unknown"
+
+        assert Geometry().bind_processor(_UnknownDialect()) is None
+
+    @pytest.mark.parametrize(
+        "dialect_module,driver",
+        [(postgresql, "psycopg2"), (postgresql, "psycopg"), (sqlite, "pysqlite")],
+        ids=["psycopg2", "psycopg", "pysqlite"],
+    )
+    @pytest.mark.parametrize("from_text", ["ST_GeomFromWKB", "ST_GeomFromEWKB"])
+    @pytest.mark.parametrize("buffer_type", [bytearray, memoryview])
+    def test_buffers_kept(self, dialect_module, driver, from_text, buffer_type):
+        if not hasattr(dialect_module, driver):
+            # The psycopg dialect was added in SQLAlchemy 2.0
+            pytest.skip(f"The {driver} dialect is not available in this SQLAlchemy version")
+        dialect = getattr(dialect_module, driver).dialect()
+        if dialect.name == "sqlite" and from_text == "ST_GeomFromEWKB":
+            pytest.skip("EWKB values are bound as hex strings with SQLite")
+        wkb = buffer_type(bytes.fromhex(EWKB_HEX))
+        processor = Geometry(from_text=from_text).bind_processor(dialect)
+
+        assert accepts_buffers(dialect)
+        assert processor(wkb) is wkb
+        assert processor(WKBElement(wkb)) is wkb
+
+    @pytest.mark.parametrize("buffer_type", [bytearray, memoryview])
+    def test_buffers_copied(self, buffer_type):
+        dialect = postgresql.pg8000.dialect()
+        wkb = buffer_type(bytes.fromhex(EWKB_HEX))
+        processor = Geometry(from_text="ST_GeomFromEWKB").bind_processor(dialect)
+
+        assert not accepts_buffers(dialect)
+        assert processor(wkb) == bytes.fromhex(EWKB_HEX)
+        assert type(processor(wkb)) is bytes
+
+
 class TestMySQLWKBConstructors:
     @staticmethod
     def normalize_sql(sql):
@@ -674,6 +883,71 @@ class TestMySQLWKBConstructors:
             srid_key: (override, 4326),
         }
 
+    def test_mysql_before_execute_skipped_without_ewkb_constructor(self, monkeypatch):
+        class Statement:
+            def _generate_cache_key(self):
+                raise AssertionError("The statement should not be inspected")
+
+            def get_children(self, **kwargs):
+                raise AssertionError("The statement should not be traversed")
+
+        monkeypatch.setattr(geoalchemy2.functions, "_BUILT_EXTENDED_CONSTRUCTORS", set())
+        conn = type("Conn", (), {"dialect": mysql.dialect()})()
+        stmt = Statement()
+
+        assert _mysql_admin.before_execute(conn, stmt, (), {"a": 1}, {}) == (stmt, (), {"a": 1})
+
+        func.ST_GeomFromEWKB(bytes.fromhex(EWKB_HEX))
+        assert {"ST_GeomFromEWKB"} == geoalchemy2.functions._BUILT_EXTENDED_CONSTRUCTORS
+
+    def test_mysql_before_cursor_execute_converts_executemany_parameters(self):
+        table = Table("t", MetaData(), Column("id", Integer), Column("data", LargeBinary))
+        compiled = insert(table).compile(dialect=mysql.mysqldb.dialect())
+        context = type("Context", (), {"compiled": compiled})()
+        parameters = [(1, memoryview(b"a")), (memoryview(b"2"), b"b")]
+
+        _, converted = _mysql_admin.before_cursor_execute(
+            None, None, compiled.string, parameters, context, True
+        )
+
+        assert converted == [(1, b"a"), (parameters[1][0], b"b")]
+
+    def test_mysql_before_execute_memoizes_bind_mappings(self, monkeypatch):
+        calls = []
+
+        def counted(func):
+            def wrapper(*args, **kwargs):
+                calls.append(func.__name__)
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        for name in ["_collect_mysql_ewkb_constructors", "_compile_mysql_statement_bind_name_map"]:
+            monkeypatch.setattr(_mysql_admin, name, counted(getattr(_mysql_admin, name)))
+        conn = type("Conn", (), {"dialect": mysql.dialect()})()
+
+        expanded_params = []
+        for value in [EWKB_HEX, WEB_MERCATOR_EWKB_HEX, EWKB_HEX]:
+            stmt = select([func.ST_GeomFromEWKB(bytes.fromhex(value))])
+            _, _, params = _mysql_admin.before_execute(conn, stmt, (), {}, {})
+            expanded_params.append(params)
+
+        assert calls == [
+            "_collect_mysql_ewkb_constructors",
+            "_compile_mysql_statement_bind_name_map",
+        ]
+        srid_values = [
+            value
+            for params in expanded_params
+            for value in params.values()
+            if isinstance(value, tuple)
+        ]
+        assert srid_values == [
+            (bytes.fromhex(EWKB_HEX), 4326),
+            (bytes.fromhex(WEB_MERCATOR_EWKB_HEX), 3857),
+            (bytes.fromhex(EWKB_HEX), 4326),
+        ]
+
     def test_geom_from_ewkb_callable_bind_uses_dynamic_srid_processor(self):
         calls = []
         value = bytes.fromhex(WEB_MERCATOR_EWKB_HEX)
@@ -960,6 +1234,37 @@ class TestMariaDBWKBConstructors:
         assert srid_processor(bytes.fromhex(WEB_MERCATOR_EWKB_HEX)) == 3857
         assert srid_processor(override) == 4326
 
+    def test_mariadb_before_cursor_execute_converts_only_binary_parameters(self):
+        table = Table(
+            "t",
+            MetaData(),
+            Column("id", Integer),
+            Column("geom", Geometry(srid=4326)),
+            Column("data", LargeBinary),
+        )
+        compiled = insert(table).compile(dialect=self.dialect())
+        context = type("Context", (), {"compiled": compiled})()
+        ewkb = bytes.fromhex(EWKB_HEX)
+        parameters = [(ewkb, WKB_HEX, ewkb), (2, WKB_HEX, memoryview(ewkb))]
+
+        _, converted = _mariadb_admin.before_cursor_execute(
+            None, None, compiled.string, parameters, context, True
+        )
+
+        assert converted == [(ewkb, WKB_HEX, WKB_HEX), (2, WKB_HEX, WKB_HEX)]
+
+    def test_mariadb_before_cursor_execute_converts_all_parameters_without_compiled(self):
+        _, converted = _mariadb_admin.before_cursor_execute(
+            None,
+            None,
+            "SELECT ST_GeomFromWKB(unhex(%(wkb)s))",
+            {"wkb": bytes.fromhex(EWKB_HEX), "name": "lake"},
+            None,
+            False,
+        )
+
+        assert converted == {"wkb": WKB_HEX, "name": "lake"}
+
     def test_mariadb_before_execute_expands_dynamic_ewkb_bindparams(self):
         source_bind = bindparam("wkb", bytes.fromhex(EWKB_HEX))
         stmt = select([func.ST_GeomFromEWKB(source_bind)])
@@ -1088,3 +1393,146 @@ class TestCompositeType:
         s = select([func.ST_Dump(geography_table.c.geom).geom.label("geom")])
 
         eq_sql(s, 'SELECT ST_AsEWKB((ST_Dump("table".geom)).geom) AS geom FROM "table"')
+
+
+class TestStatementCache:
+    @pytest.mark.parametrize(
+        "build_stmt",
+        [
+            lambda t: select([cast(t.c.geom, Geometry(srid=4326))]),
+            lambda t: select([cast(t.c.geom, Geography(srid=4326))]),
+            lambda t: select([cast(t.c.geom, Raster())]),
+            lambda t: select([cast(t.c.geom, _DummyGeometry(srid=4326))]),
+            lambda t: select([func.ST_Dump(t.c.geom).geom.label("geom")]),
+            lambda t: select([func.ST_Dump(t.c.geom).path.label("path")]),
+            lambda t: select([func.ST_AsGeoJSON(t)]),
+        ],
+        ids=["geometry", "geography", "raster", "dummy geometry", "dump geom", "dump path", "row"],
+    )
+    def test_no_recompilation(self, geometry_table, build_stmt):
+        cache = {}
+        dialect = postgresql.dialect()
+
+        statuses = [compile_w_cache(build_stmt(geometry_table), dialect, cache) for _ in range(5)]
+
+        assert statuses == [dialect.CACHE_MISS] + [dialect.CACHE_HIT] * 4
+        assert len(cache) == 1
+
+    def test_distinct_cache_keys(self, geometry_table):
+        stmts = [
+            select([cast(geometry_table.c.geom, Geometry(srid=4326))]),
+            select([cast(geometry_table.c.geom, Geometry(srid=3857))]),
+            select([cast(geometry_table.c.geom, Geography(srid=4326))]),
+            select([cast(geometry_table.c.geom, _DummyGeometry(srid=4326))]),
+            select([func.ST_Dump(geometry_table.c.geom).geom]),
+            select([func.ST_Dump(geometry_table.c.geom).path]),
+            select([func.ST_AsGeoJSON(geometry_table)]),
+            select([func.ST_AsGeoJSON(geometry_table.alias("other"))]),
+        ]
+
+        assert len({stmt._generate_cache_key().key for stmt in stmts}) == len(stmts)
+
+
+def _cached_bound_values(dialect, stmt, cache):
+    compiled, extracted_params, cache_hit = stmt._compile_w_cache(
+        dialect,
+        compiled_cache=cache,
+        column_keys=[],
+        for_executemany=False,
+        schema_translate_map=None,
+    )
+    params = compiled.construct_params(extracted_parameters=extracted_params)
+    processors = compiled._bind_processors
+    bound_values = {
+        key: processors[key](value) if key in processors else value for key, value in params.items()
+    }
+    return cache_hit, compiled.string, bound_values
+
+
+@pytest.mark.parametrize(
+    "dialect",
+    [postgresql.dialect(), sqlite.dialect()],
+    ids=["postgresql", "sqlite"],
+)
+class TestWKBConstructorsCache:
+    def test_geom_from_wkb_srid_is_bound(self, dialect):
+        cache = {}
+        results = [
+            _cached_bound_values(
+                dialect,
+                select([WKBElement(bytes.fromhex(WKB_HEX), srid=srid).ST_Buffer(1)]),
+                cache,
+            )
+            for srid in [4326, 3857, -1]
+        ]
+
+        assert len(cache) == 1
+        assert [cache_hit for cache_hit, _, _ in results] == [
+            dialect.CACHE_MISS,
+            dialect.CACHE_HIT,
+            dialect.CACHE_HIT,
+        ]
+        assert len({sql for _, sql, _ in results}) == 1
+        srid_key = "ST_GeomFromWKB_2"
+        assert [bound_values[srid_key] for _, _, bound_values in results] == [4326, 3857, 0]
+
+    def test_geom_from_wkb_type_srid_is_inlined(self, dialect):
+        expr = func.ST_GeomFromWKB(bytes.fromhex(WKB_HEX), type_=Geometry(srid=4326))
+
+        assert "4326)" in str(select([expr]).compile(dialect=dialect))
+
+    def test_geom_from_ewkb_srid_is_applied_by_bind_processor(self, dialect):
+        cache = {}
+        results = [
+            _cached_bound_values(
+                dialect, select([func.ST_GeomFromEWKB(bytes.fromhex(WKB_HEX), srid)]), cache
+            )
+            for srid in [4326, 4326, 3857, -1]
+        ]
+
+        # The SRID is part of the cache key, so it is not read from the bound values
+        assert [cache_hit for cache_hit, _, _ in results] == [
+            dialect.CACHE_MISS,
+            dialect.CACHE_HIT,
+            dialect.CACHE_MISS,
+            dialect.CACHE_MISS,
+        ]
+        for _, sql, bound_values in results:
+            # The EWKB value is bound once
+            assert "COALESCE(" not in sql
+            assert list(bound_values) == ["ST_GeomFromEWKB_2"]
+        wkb_values = [bound_values["ST_GeomFromEWKB_2"] for _, _, bound_values in results]
+        assert [_wkb_wkt.wkb_srid(i) for i in wkb_values] == [4326, 4326, 3857, None]
+
+    def test_geom_from_ewkb_embedded_srid_is_kept(self, dialect):
+        if dialect.name == "sqlite":
+            pytest.skip("SpatiaLite rejects the EWKB values whose SRID is different")
+        _, _, bound_values = _cached_bound_values(
+            dialect, select([func.ST_GeomFromEWKB(bytes.fromhex(EWKB_HEX), 3857)]), {}
+        )
+
+        assert _wkb_wkt.wkb_srid(bound_values["ST_GeomFromEWKB_2"]) == 4326
+
+    def test_geom_from_ewkb_runtime_srid_is_bound(self, dialect):
+        stmt = select([func.ST_GeomFromEWKB(bindparam("wkb"), bindparam("srid"))])
+
+        assert "SetSRID(" in str(stmt.compile(dialect=dialect))
+
+    def test_literal_binds(self, dialect):
+        expr = WKBElement(bytes.fromhex(WKB_HEX), srid=4326).ST_Buffer(1)
+
+        compiled = str(
+            select([expr]).compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+        )
+
+        assert f"'{WKB_HEX}'" in compiled
+        assert "), 4326)" in compiled
+
+    def test_element_not_modified(self, dialect):
+        expr = func.ST_GeomFromWKB(bytes.fromhex(WKB_HEX), 4326)
+        identifier = expr.identifier
+
+        str(select([expr]).compile(dialect=dialect))
+
+        assert expr.type.srid == -1
+        assert expr.identifier == identifier
@@ -21,6 +21,7 @@ from sqlalchemy.sql import insert
 from sqlalchemy.sql.sqltypes import NullType
 from sqlalchemy.types import TypeDecorator
 
+import geoalchemy2.functions
 from geoalchemy2.admin import select_dialect as select_admin_dialect
 from geoalchemy2.admin.dialects import mssql as mssql_admin
 from geoalchemy2.elements import WKBElement
@@ -873,6 +874,104 @@ class TestMSSQLReflectionHelpers:
             -1,
         )
 
+    def test_parse_mssql_spatial_constraints_parses_each_definition_once_for_all_columns(self):
+        assert mssql_admin._parse_mssql_spatial_constraints(
+            [
+                "([geom].[STSrid]=(3857) AND [geog].[STSrid]=(4326))",
+                "([geom].[STGeometryType]()=N'LineString')",
+                "(UPPER([geog].[AsTextZM]()) LIKE N'POINT%')",
+                "([xgeom].[STSrid]=(2154))",
+            ]
+        ) == {
+            "geom": ("LINESTRING", 3857),
+            "geog": ("POINT", 4326),
+            "xgeom": ("GEOMETRY", 2154),
+        }
+
+    def test_reflect_geometry_column_fetches_schema_metadata_once(self):
+        class Result:
+            def __init__(self, rows):
+                self.rows = rows
+
+            def mappings(self):
+                return iter(self.rows)
+
+        class Bind:
+            def __init__(self):
+                self.params = []
+
+            def execute(self, statement, params):
+                self.params.append(params)
+                if "sys.check_constraints" in str(statement):
+                    return Result(
+                        [
+                            {
+                                "table_name": table_name,
+                                "column_name": "geom",
+                                "type_name": "geometry",
+                                "is_nullable": True,
+                                "constraint_id": constraint_id,
+                                "definition": f"([geom].[STSrid]=({srid}))",
+                            }
+                            for table_name, constraint_id, srid in [
+                                ("lake", 1, 4326),
+                                ("river", 2, 3857),
+                            ]
+                        ]
+                    )
+                return Result(
+                    [
+                        {
+                            "table_name": "lake",
+                            "index_name": "idx_lake_geom",
+                            "column_name": "geom",
+                            "tessellation_scheme": "GEOMETRY_AUTO_GRID",
+                            "cells_per_object": 16,
+                            "bounding_box_xmin": -180.0,
+                            "bounding_box_ymin": -90.0,
+                            "bounding_box_xmax": 180.0,
+                            "bounding_box_ymax": 90.0,
+                            "level_1_grid_desc": None,
+                            "level_2_grid_desc": None,
+                            "level_3_grid_desc": None,
+                            "level_4_grid_desc": None,
+                        }
+                    ]
+                )
+
+        class Inspector:
+            bind = Bind()
+            default_schema_name = "dbo"
+            info_cache = {}
+
+        metadata = MetaData()
+        reflected_types = []
+        for table_name in ["lake", "river", "road"]:
+            column_info = {"name": "geom", "type": NullType()}
+            mssql_admin.reflect_geometry_column(Inspector, Table(table_name, metadata), column_info)
+            reflected_types.append(column_info["type"])
+
+        assert [(type_.srid, type_.spatial_index) for type_ in reflected_types[:2]] == [
+            (4326, True),
+            (3857, False),
+        ]
+        assert isinstance(reflected_types[2], NullType)
+        assert Inspector.bind.params == [{"schema": "dbo"}, {"schema": "dbo"}]
+        assert mssql_admin._get_mssql_spatial_indexes(
+            Inspector.bind, "LAKE", schema="dbo", info_cache=Inspector.info_cache
+        ) == [
+            {
+                "name": "idx_lake_geom",
+                "column_name": "geom",
+                "dialect_options": {
+                    "mssql_using": "GEOMETRY_AUTO_GRID",
+                    "mssql_cells_per_object": 16,
+                    "mssql_bounding_box": (-180.0, -90.0, 180.0, 90.0),
+                },
+            }
+        ]
+        assert len(Inspector.bind.params) == 2
+
     def test_get_mssql_spatial_indexes_maps_reflected_options(self):
         class Result:
             def mappings(self):
@@ -1003,8 +1102,9 @@ class TestMSSQLReflectionHelpers:
 
     def test_nulltype_non_spatial_columns_are_not_rewritten(self):
         class Result:
-            def one(self):
-                return "not_a_spatial_type", True
+            def mappings(self):
+                # Only the geometry and geography columns are returned
+                return iter([])
 
         class Bind:
             def execute(self, *args, **kwargs):
@@ -1521,6 +1621,23 @@ class TestMSSQLBindAndResultProcessing:
         assert params[srid_key_2] == ewkt_values[1]
         assert calls == ewkt_values
 
+    def test_mssql_before_execute_skipped_without_extended_constructor(self, monkeypatch):
+        class Statement:
+            def _generate_cache_key(self):
+                raise AssertionError("The statement should not be inspected")
+
+            def get_children(self, **kwargs):
+                raise AssertionError("The statement should not be traversed")
+
+        monkeypatch.setattr(geoalchemy2.functions, "_BUILT_EXTENDED_CONSTRUCTORS", set())
+        conn = type("Conn", (), {"dialect": self.dialect})()
+        stmt = Statement()
+
+        assert mssql_admin.before_execute(conn, stmt, (), {"a": 1}, {}) == (stmt, (), {"a": 1})
+
+        func.ST_GeomFromEWKT("POINT(1 2)")
+        assert {"ST_GeomFromEWKT"} == geoalchemy2.functions._BUILT_EXTENDED_CONSTRUCTORS
+
     def test_mssql_before_execute_expands_dynamic_ewkt_bindparams(self):
         source_bind = bindparam("wkt")
         stmt = select([func.ST_GeomFromEWKT(source_bind)])
@@ -1619,6 +1736,70 @@ class TestMSSQLBindAndResultProcessing:
         assert multiparams == ()
         assert expanded_params is params
 
+    def test_mssql_before_execute_memoizes_bind_mappings(self, monkeypatch):
+        calls = []
+        compile_bind_name_map = mssql_admin._compile_mssql_statement_bind_name_map
+
+        def counted_compile_bind_name_map(clauseelement, dialect):
+            calls.append(clauseelement)
+            return compile_bind_name_map(clauseelement, dialect)
+
+        monkeypatch.setattr(
+            mssql_admin,
+            "_compile_mssql_statement_bind_name_map",
+            counted_compile_bind_name_map,
+        )
+        dialect = mssql.dialect()
+        conn = type("Conn", (), {"dialect": dialect})()
+
+        for ewkt in ["SRID=4326;POINT(1 2)", "SRID=3857;POINT(3 4)"]:
+            source_bind = bindparam("wkt", unique=True)
+            stmt = select(
+                [func.ST_GeomFromEWKT(source_bind), func.ST_GeomFromEWKB(bindparam("wkb"))]
+            )
+            text_key, srid_key = mssql_admin._mssql_dynamic_ewkt_bind_keys(source_bind)
+            wkb_key, wkb_srid_key = mssql_admin._mssql_dynamic_ewkb_bind_keys(bindparam("wkb"))
+
+            _, _, params = mssql_admin.before_execute(
+                conn, stmt, (), {"wkt_1": ewkt, "wkb": b"wkb"}, {}
+            )
+
+            assert params == {
+                "wkt_1": ewkt,
+                "wkb": b"wkb",
+                text_key: ewkt,
+                srid_key: ewkt,
+                wkb_key: b"wkb",
+                wkb_srid_key: b"wkb",
+            }
+
+        assert len(calls) == 1
+        assert mssql_admin.bind_mapping_cache_info(dialect) == (1, 1, 500, 1)
+
+    def test_mssql_before_execute_traverses_statement_once(self, monkeypatch):
+        traversed = []
+        iterate = mssql_admin.visitors.iterate
+
+        def counted_iterate(clauseelement, *args, **kwargs):
+            traversed.append(clauseelement)
+            return iterate(clauseelement, *args, **kwargs)
+
+        monkeypatch.setattr(mssql_admin.visitors, "iterate", counted_iterate)
+        dialect = mssql.dialect()
+        stmt = select(
+            [func.ST_GeomFromEWKT(bindparam("wkt")), func.ST_GeomFromEWKB(bindparam("wkb"))]
+        )
+
+        mssql_admin.before_execute(
+            type("Conn", (), {"dialect": dialect})(),
+            stmt,
+            (),
+            {"wkt": "SRID=4326;POINT(1 2)", "wkb": b"wkb"},
+            {},
+        )
+
+        assert [element for element in traversed if element is stmt] == [stmt]
+
     def test_geom_from_ewkt_bindparam_defaults_preserve_compile_time_value(self):
         source_bind = bindparam("wkt", "SRID=3857;POINT(1 2)")
         stmt = select([func.ST_GeomFromEWKT(source_bind)])
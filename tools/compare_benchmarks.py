@@ -144,6 +144,16 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Exit with status 1 if any common benchmark is slower by more than this percentage.",
     )
+    parser.add_argument(
+        "--extra-info-timings",
+        action="append",
+        default=[],
+        metavar="KEY",
+        help=(
+            "Also compare the timings in seconds stored as a mapping under this extra_info key "
+            "of the benchmarks, e.g. the per-module import times. May be repeated."
+        ),
+    )
     parser.add_argument(
         "--only-common",
         action="store_true",
@@ -235,6 +245,36 @@ def filter_run_by_junitxml(run: BenchmarkRun, junitxml: Path) -> BenchmarkRun:
     )
 
 
+def expand_extra_info_timings(run: BenchmarkRun, key: str) -> BenchmarkRun:
+    """Add a benchmark for each timing stored under the given extra_info key of the benchmarks.
+
+    The new benchmarks are named ``<fullname>[<key>:<name>]`` and their timing is used for all the
+    location metrics, so they are compared and flagged like the other benchmarks.
+    """
+    benchmarks = dict(run.benchmarks)
+    for fullname, benchmark in run.benchmarks.items():
+        timings = benchmark.get("extra_info", {}).get(key)
+        if not isinstance(timings, dict):
+            continue
+        for name, value in timings.items():
+            if not isinstance(value, (int, float)):
+                continue
+            stats = dict.fromkeys(METRICS, float(value))
+            stats["stddev"] = stats["iqr"] = 0.0
+            timing_name = f"{fullname}[{key}:{name}]"
+            benchmarks[timing_name] = {"fullname": timing_name, "name": timing_name, "stats": stats}
+
+    data = dict(run.data)
+    data["benchmarks"] = list(benchmarks.values())
+    return BenchmarkRun(
+        label=run.label,
+        path=run.path,
+        data=data,
+        benchmarks=benchmarks,
+        outcome_filter=run.outcome_filter,
+    )
+
+
 def load_junit_outcomes(path: Path) -> dict[str, str]:
     root = ElementTree.parse(path).getroot()
     outcomes: dict[str, str] = {}
@@ -727,6 +767,9 @@ def main(argv: list[str] | None = None) -> int:
             "errored, skipped, or xfailed benchmark tests.",
             file=sys.stderr,
         )
+    for key in args.extra_info_timings:
+        base = expand_extra_info_timings(base, key)
+        compare = expand_extra_info_timings(compare, key)
     records = compare_runs(
         base,
         compare,